@@ -0,0 +1,771 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+# -------------------------------------------------------------------------
+"""
+Audio engine shared by the Python VoiceLive samples.
+
+Captures microphone audio for input_audio_buffer.append and plays response
+audio through a preallocated ring buffer. Audio devices are behind a small
+backend interface, so the same engine runs with or without a sound card.
+
+Backends (VOICELIVE_AUDIO_BACKEND):
+    pyaudio  microphone and speakers through PortAudio callbacks (default)
+    wav      capture from VOICELIVE_AUDIO_INPUT_WAV (silence when unset or
+             exhausted), playback written to VOICELIVE_AUDIO_OUTPUT_WAV
+    null     silent capture, playback discarded
+
+The wav and null backends run on a clock thread paced by
+VOICELIVE_AUDIO_REALTIME_FACTOR (1.0 = real time, 0 = as fast as possible).
+
+Captured buffers are coalesced into input_audio_buffer.append messages of up
+to VOICELIVE_AUDIO_LATENCY_BUDGET_MS of audio (default 100, 0 sends every
+buffer as it arrives).
+"""
+from __future__ import annotations
+import asyncio
+import base64
+import logging
+import os
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# PCM16, 24kHz, mono as expected by VoiceLive
+SAMPLE_RATE = 24000
+CHANNELS = 1
+SAMPLE_WIDTH = 2
+DEFAULT_CHUNK_SIZE = 1200  # frames, 50ms
+
+# Playback buffer size; audio beyond this is dropped (counted as overruns)
+PLAYBACK_BUFFER_SECONDS = 120
+
+# Longest a captured buffer waits to be batched with the next ones
+DEFAULT_LATENCY_BUDGET_MS = 100.0
+
+# Called on the backend's thread with one buffer of captured PCM (bytes-like)
+CaptureCallback = Callable[[Any], None]
+# Called on the backend's thread for exactly n bytes of PCM to play
+PlaybackCallback = Callable[[int], bytes]
+
+
+class PCMRingBuffer:
+    """
+    Preallocated single-producer/single-consumer ring buffer for PCM audio.
+
+    The event loop writes and the playback callback reads. Each side writes
+    only its own fields and reads the other's, so no lock is needed.
+    Positions count bytes since creation and are reduced modulo the capacity
+    when indexing.
+
+    Barge-in: discard() starts a new epoch in constant time, however much
+    audio is queued. Writes tagged with an older epoch (late audio from the
+    interrupted response) are dropped. The producer publishes the discard
+    position first and then bumps a discard sequence number; the consumer
+    applies a discard whenever the sequence differs from the last one it
+    applied, so a request cannot be lost to a read running in between.
+
+    Counters:
+    - underruns: reads that ran dry part-way through a callback buffer
+    - overruns: writes that did not fit (the excess is dropped)
+    - discarded_bytes / stale_bytes: audio dropped by discard() / stale writes
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        # Producer fields
+        self._write_pos = 0
+        self._discard_to = 0
+        self._discard_requested_at = 0.0
+        self._discard_seq = 0
+        self.epoch = 0
+        # Consumer fields
+        self._read_pos = 0
+        self._applied_discard_seq = 0
+        self._silence = b""
+
+        self.underruns = 0
+        self.overruns = 0
+        self.overrun_bytes = 0
+        self.stale_bytes = 0
+        self.discarded_bytes = 0
+        self.flushes = 0
+        self.flush_latency_total = 0.0
+        self.flush_latency_max = 0.0
+
+    def available(self) -> int:
+        """Bytes waiting to be played."""
+        return self._write_pos - max(self._read_pos, self._discard_to)
+
+    def write(self, data: bytes, epoch: Optional[int] = None) -> int:
+        """Copy audio in (producer side). Returns the number of bytes stored."""
+        if epoch is not None and epoch != self.epoch:
+            self.stale_bytes += len(data)
+            return 0
+        src = memoryview(data)
+        size = min(len(src), self.capacity - (self._write_pos - self._read_pos))
+        if size < len(src):
+            self.overruns += 1
+            self.overrun_bytes += len(src) - size
+
+        start = self._write_pos % self.capacity
+        first = min(size, self.capacity - start)
+        self._view[start:start + first] = src[:first]
+        if first < size:
+            self._view[:size - first] = src[first:size]
+        self._write_pos += size
+        return size
+
+    def discard(self) -> int:
+        """
+        Drop all audio written so far (producer side, applied on the next read).
+
+        Returns:
+            The new epoch; writes tagged with an earlier one are ignored
+        """
+        # Position and timestamp before the sequence number that publishes them
+        self._discard_to = self._write_pos
+        self._discard_requested_at = time.perf_counter()
+        self._discard_seq += 1
+        self.epoch += 1
+        return self.epoch
+
+    def read(self, size: int) -> bytes:
+        """
+        Take exactly size bytes (consumer side), padded with silence.
+
+        The returned bytes object is the only allocation; an idle stream gets
+        the same cached silence buffer every time.
+        """
+        if len(self._silence) != size:
+            self._silence = bytes(size)
+        discard_seq = self._discard_seq
+        if discard_seq != self._applied_discard_seq:
+            self._apply_discard(discard_seq)
+
+        available = self._write_pos - self._read_pos
+        if available <= 0:
+            return self._silence
+
+        take = min(size, available)
+        start = self._read_pos % self.capacity
+        first = min(take, self.capacity - start)
+        if take == size and first == take:
+            out = self._view[start:start + take].tobytes()
+        else:
+            parts = [self._view[start:start + first]]
+            if first < take:
+                parts.append(self._view[:take - first])
+            if take < size:
+                self.underruns += 1
+                parts.append(memoryview(self._silence)[:size - take])
+            out = b"".join(parts)
+        self._read_pos += take
+        return out
+
+    def _apply_discard(self, discard_seq: int):
+        # Everything the consumer returns from now on is silence or new audio.
+        # _discard_to is at least as new as discard_seq; a later discard seen
+        # here is applied again (as a no-op) on the next read
+        self._applied_discard_seq = discard_seq
+        requested_at = self._discard_requested_at
+        if self._discard_to > self._read_pos:
+            self.discarded_bytes += self._discard_to - self._read_pos
+            self._read_pos = self._discard_to
+        latency = time.perf_counter() - requested_at
+        self.flushes += 1
+        self.flush_latency_total += latency
+        self.flush_latency_max = max(self.flush_latency_max, latency)
+
+
+class AudioBackend(ABC):
+    """
+    Audio device interface used by AudioProcessor.
+
+    Callbacks run on a thread owned by the backend, one buffer of
+    frames_per_buffer frames at a time.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.output_underflows = 0
+
+    @abstractmethod
+    def start_capture(self, callback: CaptureCallback, frames_per_buffer: int):
+        """Start calling callback with each captured buffer."""
+
+    @abstractmethod
+    def stop_capture(self):
+        """Stop capturing."""
+
+    @abstractmethod
+    def start_playback(self, callback: PlaybackCallback, frames_per_buffer: int):
+        """Start pulling audio to play from callback."""
+
+    @abstractmethod
+    def stop_playback(self):
+        """Stop playback."""
+
+    def output_latency(self) -> float:
+        """Seconds between handing audio to the device and hearing it."""
+        return 0.0
+
+    def close(self):
+        """Release the device."""
+
+
+class PyAudioBackend(AudioBackend):
+    """Microphone and speakers through PortAudio stream callbacks."""
+
+    name = "pyaudio"
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import pyaudio
+        except ImportError as e:
+            raise ImportError(
+                "The pyaudio audio backend requires pyaudio. Install with: pip install pyaudio"
+            ) from e
+        self._pa = pyaudio
+        self.audio = pyaudio.PyAudio()
+        self.format = pyaudio.paInt16
+        self.input_stream = None
+        self.output_stream = None
+
+    def check_devices(self):
+        """Raise if there is no input or output device."""
+        infos = [
+            self.audio.get_device_info_by_index(i) for i in range(self.audio.get_device_count())
+        ]
+        if not any((info.get("maxInputChannels", 0) or 0) > 0 for info in infos):
+            raise RuntimeError("No audio input devices found. Please check your microphone.")
+        if not any((info.get("maxOutputChannels", 0) or 0) > 0 for info in infos):
+            raise RuntimeError("No audio output devices found. Please check your speakers.")
+
+    def start_capture(self, callback: CaptureCallback, frames_per_buffer: int):
+        pa = self._pa
+
+        def _capture_callback(in_data, _frame_count, _time_info, _status_flags):
+            # in_data is handed over as is, without copying
+            callback(in_data)
+            return (None, pa.paContinue)
+
+        self.input_stream = self.audio.open(
+            format=self.format,
+            channels=CHANNELS,
+            rate=SAMPLE_RATE,
+            input=True,
+            frames_per_buffer=frames_per_buffer,
+            stream_callback=_capture_callback,
+        )
+
+    def stop_capture(self):
+        if self.input_stream:
+            self.input_stream.stop_stream()
+            self.input_stream.close()
+            self.input_stream = None
+
+    def start_playback(self, callback: PlaybackCallback, frames_per_buffer: int):
+        pa = self._pa
+
+        def _playback_callback(_in_data, frame_count, _time_info, status_flags):
+            if status_flags & pa.paOutputUnderflow:
+                self.output_underflows += 1
+            return (callback(frame_count * SAMPLE_WIDTH), pa.paContinue)
+
+        self.output_stream = self.audio.open(
+            format=self.format,
+            channels=CHANNELS,
+            rate=SAMPLE_RATE,
+            output=True,
+            frames_per_buffer=frames_per_buffer,
+            stream_callback=_playback_callback,
+        )
+
+    def stop_playback(self):
+        if self.output_stream:
+            self.output_stream.stop_stream()
+            self.output_stream.close()
+            self.output_stream = None
+
+    def output_latency(self) -> float:
+        return self.output_stream.get_output_latency() if self.output_stream else 0.0
+
+    def close(self):
+        self.stop_capture()
+        self.stop_playback()
+        self.audio.terminate()
+
+
+class _ClockThread:
+    """Calls tick() once per buffer period on its own thread, like a sound card would."""
+
+    def __init__(self, name: str, period_s: float, tick: Callable[[], None]):
+        self.period_s = period_s
+        self.tick = tick
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            self.tick()
+            if self.period_s > 0:
+                next_tick += self.period_s
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    self._stop.wait(delay)
+                else:
+                    # Fell behind: resynchronise instead of bursting to catch up
+                    next_tick = time.perf_counter()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+
+class NullBackend(AudioBackend):
+    """
+    Device-less backend: captures silence and discards playback.
+
+    Args:
+        realtime_factor: 1.0 runs at the audio rate, 2.0 twice as fast, 0 as fast as possible
+    """
+
+    name = "null"
+
+    def __init__(self, realtime_factor: float = 1.0):
+        super().__init__()
+        self.realtime_factor = realtime_factor
+        self.captured_bytes = 0
+        self.played_bytes = 0
+        self._capture_clock: Optional[_ClockThread] = None
+        self._playback_clock: Optional[_ClockThread] = None
+
+    def _period(self, frames_per_buffer: int) -> float:
+        if self.realtime_factor <= 0:
+            return 0.0
+        return frames_per_buffer / SAMPLE_RATE / self.realtime_factor
+
+    def _next_capture_buffer(self, size: int):
+        return bytes(size)
+
+    def start_capture(self, callback: CaptureCallback, frames_per_buffer: int):
+        size = frames_per_buffer * SAMPLE_WIDTH * CHANNELS
+
+        def tick():
+            data = self._next_capture_buffer(size)
+            self.captured_bytes += len(data)
+            callback(data)
+
+        self._capture_clock = _ClockThread("audio-capture", self._period(frames_per_buffer), tick)
+
+    def stop_capture(self):
+        if self._capture_clock:
+            self._capture_clock.stop()
+            self._capture_clock = None
+
+    def _played(self, data: bytes):
+        self.played_bytes += len(data)
+
+    def start_playback(self, callback: PlaybackCallback, frames_per_buffer: int):
+        size = frames_per_buffer * SAMPLE_WIDTH * CHANNELS
+        self._playback_clock = _ClockThread(
+            "audio-playback", self._period(frames_per_buffer), lambda: self._played(callback(size))
+        )
+
+    def stop_playback(self):
+        if self._playback_clock:
+            self._playback_clock.stop()
+            self._playback_clock = None
+
+    def close(self):
+        self.stop_capture()
+        self.stop_playback()
+
+
+class WavFileBackend(NullBackend):
+    """
+    Device-less backend reading capture audio from, and writing playback to, WAV files.
+
+    The input file is loaded once and handed out as memoryview slices, so
+    capture makes no per-buffer copies.
+
+    Args:
+        input_path: 24kHz mono PCM16 WAV to capture from (silence when None or exhausted)
+        output_path: WAV file receiving everything played, including silence
+        realtime_factor: 1.0 runs at the audio rate, 0 as fast as possible
+    """
+
+    name = "wav"
+
+    def __init__(
+        self,
+        input_path: Optional[str] = None,
+        output_path: Optional[str] = None,
+        realtime_factor: float = 1.0,
+    ):
+        super().__init__(realtime_factor)
+        self._input = memoryview(b"")
+        self._input_pos = 0
+        if input_path:
+            with wave.open(input_path, "rb") as wav:
+                if (
+                    wav.getframerate() != SAMPLE_RATE
+                    or wav.getnchannels() != CHANNELS
+                    or wav.getsampwidth() != SAMPLE_WIDTH
+                ):
+                    raise ValueError(f"{input_path} must be {SAMPLE_RATE} Hz mono PCM16")
+                self._input = memoryview(wav.readframes(wav.getnframes()))
+        self._output: Optional[wave.Wave_write] = None
+        if output_path:
+            self._output = wave.open(output_path, "wb")
+            self._output.setnchannels(CHANNELS)
+            self._output.setsampwidth(SAMPLE_WIDTH)
+            self._output.setframerate(SAMPLE_RATE)
+        self._silence = b""
+
+    def _next_capture_buffer(self, size: int):
+        if self._input_pos + size <= len(self._input):
+            data = self._input[self._input_pos:self._input_pos + size]
+            self._input_pos += size
+            return data
+        if len(self._silence) != size:
+            self._silence = bytes(size)
+        return self._silence
+
+    def _played(self, data: bytes):
+        super()._played(data)
+        if self._output:
+            self._output.writeframes(data)
+
+    def close(self):
+        super().close()
+        if self._output:
+            self._output.close()
+            self._output = None
+
+
+def create_backend(name: Optional[str] = None) -> AudioBackend:
+    """
+    Build the audio backend selected by name or VOICELIVE_AUDIO_BACKEND.
+
+    Args:
+        name: pyaudio, wav or null (defaults to the environment, then pyaudio)
+    """
+    name = (name or os.getenv("VOICELIVE_AUDIO_BACKEND", "pyaudio")).lower()
+    realtime_factor = float(os.getenv("VOICELIVE_AUDIO_REALTIME_FACTOR", "1.0"))
+    if name == "pyaudio":
+        return PyAudioBackend()
+    if name == "wav":
+        return WavFileBackend(
+            input_path=os.getenv("VOICELIVE_AUDIO_INPUT_WAV"),
+            output_path=os.getenv("VOICELIVE_AUDIO_OUTPUT_WAV"),
+            realtime_factor=realtime_factor,
+        )
+    if name == "null":
+        return NullBackend(realtime_factor=realtime_factor)
+    raise ValueError(f"Unknown audio backend '{name}' (expected pyaudio, wav or null)")
+
+
+def check_audio_devices(backend_name: Optional[str] = None):
+    """Raise if the selected backend needs audio devices that are missing."""
+    name = (backend_name or os.getenv("VOICELIVE_AUDIO_BACKEND", "pyaudio")).lower()
+    if name != "pyaudio":
+        return
+    backend = PyAudioBackend()
+    try:
+        backend.check_devices()
+    finally:
+        backend.close()
+
+
+class AudioProcessor:
+    """
+    Handles real-time audio capture and playback for the voice assistant.
+
+    Threading Architecture:
+    - Main thread: Event loop and UI; sends captured audio in coalesced appends
+    - Capture callback (backend thread): queues raw microphone buffers and wakes
+      the event loop (call_soon_threadsafe) only once a batch is ready to send
+    - Playback callback (backend thread): reads from the playback ring buffer
+
+    Nothing polls: an idle session causes no wakeups besides the device callbacks.
+
+    Args:
+        connection: VoiceLive connection receiving input_audio_buffer.append
+        backend: Audio device (defaults to create_backend())
+        chunk_size: Frames per capture/playback buffer
+        latency_budget_ms: Longest a captured buffer may wait to be sent with
+            later ones (defaults to VOICELIVE_AUDIO_LATENCY_BUDGET_MS, then 100)
+    """
+
+    loop: asyncio.AbstractEventLoop
+
+    def __init__(
+        self,
+        connection,
+        backend: Optional[AudioBackend] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        latency_budget_ms: Optional[float] = None,
+    ):
+        self.connection = connection
+        self.backend = backend or create_backend()
+
+        # Audio configuration - PCM16, 24kHz, mono as specified
+        self.channels = CHANNELS
+        self.rate = SAMPLE_RATE
+        self.chunk_size = chunk_size
+        if latency_budget_ms is None:
+            latency_budget_ms = float(
+                os.getenv("VOICELIVE_AUDIO_LATENCY_BUDGET_MS", DEFAULT_LATENCY_BUDGET_MS)
+            )
+        self.latency_budget_s = max(0.0, latency_budget_ms / 1000)
+
+        # Capture and playback state
+        self.capturing = False
+        self.playing = False
+
+        # Raw capture buffers with their capture time, appended by the backend
+        # thread and drained by the sender task (deque appends are thread-safe)
+        self._captured: deque = deque()
+        self._capture_ready: Optional[asyncio.Event] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        # Wake-up handshake. Each side writes only its own fields: the callback
+        # counts bytes and remembers the threshold it last woke the loop for,
+        # the sender sets the captured byte count at which its batch is full
+        self._captured_total = 0
+        self._woken_for = -1
+        self._wake_at_total = 0
+
+        # Capture counters
+        self.captured_buffers = 0
+        self.loop_wakeups = 0
+        self.sender_wakeups = 0
+        self.appends_sent = 0
+        self.append_errors = 0
+        self.appended_bytes = 0
+        self.coalesce_delay_total = 0.0
+        self.coalesce_delay_max = 0.0
+
+        # Room for responses that arrive faster than real time
+        self.playback_buffer = PCMRingBuffer(SAMPLE_RATE * SAMPLE_WIDTH * PLAYBACK_BUFFER_SECONDS)
+
+        logger.info(
+            "AudioProcessor initialized with 24kHz PCM16 mono audio (%s backend)",
+            self.backend.name,
+        )
+
+    def start_capture(self):
+        """Start capturing audio from microphone."""
+        def _capture_callback(in_data):
+            """Audio capture thread - runs in background."""
+            self._captured.append((in_data, time.perf_counter()))
+            self._captured_total += len(in_data)
+            wake_at = self._wake_at_total
+            if self._captured_total >= wake_at and self._woken_for != wake_at:
+                # The sender's batch is full: one wake-up per append
+                self._woken_for = wake_at
+                self.loop_wakeups += 1
+                self.loop.call_soon_threadsafe(self._capture_ready.set)
+
+        if self.capturing:
+            return
+
+        # Store the current event loop for use in threads
+        self.loop = asyncio.get_running_loop()
+        self._capture_ready = asyncio.Event()
+
+        try:
+            self.backend.start_capture(_capture_callback, self.chunk_size)
+            self.capturing = True
+            self._sender_task = self.loop.create_task(self._send_captured_audio())
+            logger.info(
+                "Started audio capture (%.0f ms latency budget)", self.latency_budget_s * 1000
+            )
+
+        except Exception:
+            logger.exception("Failed to start audio capture")
+            raise
+
+    async def _send_captured_audio(self):
+        """
+        Send captured audio, batching buffers into fewer, larger appends.
+
+        A batch is sent once it holds latency_budget_s of audio or its oldest
+        buffer has waited that long. Buffers captured while an append is in
+        flight join the next batch, so a slow connection gets larger appends
+        instead of a growing backlog of small ones. A batch never grows past
+        the budget; buffers beyond it wait for the next append.
+
+        The capture callback wakes this task only when the batch is full. A
+        timer covers partial batches (capture stopping, uneven buffer sizes),
+        so added latency stays within the budget in steady state and within
+        twice the budget otherwise.
+        """
+        budget_s = self.latency_budget_s
+        budget_bytes = int(budget_s * SAMPLE_RATE) * SAMPLE_WIDTH * CHANNELS
+        captured = self._captured
+        ready = self._capture_ready
+        batch = []
+        batch_bytes = 0
+        drained_total = 0
+        oldest = 0.0
+
+        while True:
+            # Stop at a full batch so faster-than-real-time capture still yields
+            while captured and (not batch or batch_bytes < budget_bytes):
+                data, captured_at = captured.popleft()
+                if not batch:
+                    oldest = captured_at
+                batch.append(data)
+                batch_bytes += len(data)
+                drained_total += len(data)
+                self.captured_buffers += 1
+
+            if batch:
+                wait_s = budget_s - (time.perf_counter() - oldest)
+                if batch_bytes >= budget_bytes or wait_s <= 0:
+                    await self._append(batch, oldest)
+                    batch = []
+                    batch_bytes = 0
+                    continue
+            else:
+                # Fallback only; a full batch wakes us first
+                wait_s = 2 * budget_s if budget_s else None
+
+            ready.clear()
+            # Ask to be woken once the rest of the batch has been captured
+            self._wake_at_total = drained_total + max(1, budget_bytes - batch_bytes)
+            if self._captured_total >= self._wake_at_total:
+                continue
+            try:
+                await asyncio.wait_for(ready.wait(), wait_s)
+            except asyncio.TimeoutError:
+                pass
+            self.sender_wakeups += 1
+
+    async def _append(self, batch, oldest: float):
+        audio = batch[0] if len(batch) == 1 else b"".join(batch)
+        delay = time.perf_counter() - oldest
+        self.appends_sent += 1
+        self.appended_bytes += len(audio)
+        self.coalesce_delay_total += delay
+        self.coalesce_delay_max = max(self.coalesce_delay_max, delay)
+        try:
+            await self.connection.input_audio_buffer.append(
+                audio=base64.b64encode(audio).decode("utf-8")
+            )
+        except Exception as e:
+            self.append_errors += 1
+            logger.debug("Failed to send captured audio: %s", e)
+
+    def capture_stats(self) -> Dict[str, Any]:
+        """Append message rate and the delay added by coalescing captured audio."""
+        audio_seconds = self.appended_bytes / (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS)
+        return {
+            "latency_budget_ms": round(self.latency_budget_s * 1000, 1),
+            "captured_buffers": self.captured_buffers,
+            "appends": self.appends_sent,
+            "loop_wakeups": self.loop_wakeups,
+            "sender_wakeups": self.sender_wakeups,
+            "append_errors": self.append_errors,
+            "appends_per_audio_second": round(
+                self.appends_sent / audio_seconds, 1
+            ) if audio_seconds else None,
+            "buffers_per_append": round(
+                self.captured_buffers / self.appends_sent, 2
+            ) if self.appends_sent else None,
+            "coalesce_delay_ms_avg": round(
+                self.coalesce_delay_total / self.appends_sent * 1000, 1
+            ) if self.appends_sent else None,
+            "coalesce_delay_ms_max": round(
+                self.coalesce_delay_max * 1000, 1
+            ) if self.appends_sent else None,
+        }
+
+    def start_playback(self):
+        """Initialize audio playback system."""
+        if self.playing:
+            return
+
+        try:
+            self.backend.start_playback(self.playback_buffer.read, self.chunk_size)
+            self.playing = True
+            logger.info("Audio playback system ready")
+        except Exception:
+            logger.exception("Failed to initialize audio playback")
+            raise
+
+    @property
+    def playback_epoch(self) -> int:
+        """Current playback epoch; audio queued with an older one is dropped."""
+        return self.playback_buffer.epoch
+
+    def queue_audio(self, audio_data: Optional[bytes], epoch: Optional[int] = None) -> None:
+        """Queue audio data for playback."""
+        if audio_data:
+            self.playback_buffer.write(audio_data, epoch)
+
+    def skip_pending_audio(self):
+        """Skip current audio in playback queue."""
+        self.playback_buffer.discard()
+
+    def playback_stats(self) -> Dict[str, Any]:
+        """Playback buffer health counters and barge-in-to-silence latency."""
+        buf = self.playback_buffer
+        # Audio already handed to the device still plays after the flush
+        output_latency_ms = self.backend.output_latency() * 1000
+        return {
+            "buffered_bytes": buf.available(),
+            "underruns": buf.underruns,
+            "overruns": buf.overruns,
+            "overrun_bytes": buf.overrun_bytes,
+            "output_underflows": self.backend.output_underflows,
+            "barge_ins": buf.flushes,
+            "discarded_bytes": buf.discarded_bytes,
+            "stale_bytes": buf.stale_bytes,
+            "barge_in_to_silence_ms_avg": round(
+                buf.flush_latency_total / buf.flushes * 1000 + output_latency_ms, 1
+            ) if buf.flushes else None,
+            "barge_in_to_silence_ms_max": round(
+                buf.flush_latency_max * 1000 + output_latency_ms, 1
+            ) if buf.flushes else None,
+        }
+
+    def shutdown(self):
+        """Clean up audio resources."""
+        if self.capturing:
+            self.backend.stop_capture()
+            self.capturing = False
+            # Audio not sent yet is dropped along with the session
+            if self._sender_task:
+                self._sender_task.cancel()
+                self._sender_task = None
+            self._captured.clear()
+            logger.info("Capture stats: %s", self.capture_stats())
+
+        logger.info("Stopped audio capture")
+
+        if self.playing:
+            self.skip_pending_audio()
+            logger.info("Playback stats: %s", self.playback_stats())
+            self.backend.stop_playback()
+            self.playing = False
+
+        logger.info("Stopped audio playback")
+
+        self.backend.close()
+
+        logger.info("Audio processor cleaned up")
@@ -8,12 +8,10 @@ import os
 import sys
 import argparse
 import asyncio
-import base64
 from datetime import datetime
 import logging
-import queue
 import signal
-from typing import Union, Optional, TYPE_CHECKING, cast
+from typing import Union, Optional, TYPE_CHECKING
 
 from azure.core.credentials import AzureKeyCredential
 from azure.core.credentials_async import AsyncTokenCredential
@@ -32,7 +30,8 @@ from azure.ai.voicelive.models import (
     ServerVad
 )
 from dotenv import load_dotenv
-import pyaudio
+
+from audio_engine import AudioProcessor, check_audio_devices
 
 if TYPE_CHECKING:
     # Only needed for type checking; avoids runtime import issues
@@ -61,183 +60,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class AudioProcessor:
-    """
-    Handles real-time audio capture and playback for the voice assistant.
-
-    Threading Architecture:
-    - Main thread: Event loop and UI
-    - Capture thread: PyAudio input stream reading
-    - Send thread: Async audio data transmission to VoiceLive
-    - Playback thread: PyAudio output stream writing
-    """
-    
-    loop: asyncio.AbstractEventLoop
-    
-    class AudioPlaybackPacket:
-        """Represents a packet that can be sent to the audio playback queue."""
-        def __init__(self, seq_num: int, data: Optional[bytes]):
-            self.seq_num = seq_num
-            self.data = data
-
-    def __init__(self, connection):
-        self.connection = connection
-        self.audio = pyaudio.PyAudio()
-
-        # Audio configuration - PCM16, 24kHz, mono as specified
-        self.format = pyaudio.paInt16
-        self.channels = 1
-        self.rate = 24000
-        self.chunk_size = 1200 # 50ms
-
-        # Capture and playback state
-        self.input_stream = None
-
-        self.playback_queue: queue.Queue[AudioProcessor.AudioPlaybackPacket] = queue.Queue()
-        self.playback_base = 0
-        self.next_seq_num = 0
-        self.output_stream: Optional[pyaudio.Stream] = None
-
-        logger.info("AudioProcessor initialized with 24kHz PCM16 mono audio")
-
-    def start_capture(self):
-        """Start capturing audio from microphone."""
-        def _capture_callback(
-            in_data,      # data
-            _frame_count,  # number of frames
-            _time_info,    # dictionary
-            _status_flags):
-            """Audio capture thread - runs in background."""
-            audio_base64 = base64.b64encode(in_data).decode("utf-8")
-            asyncio.run_coroutine_threadsafe(
-                self.connection.input_audio_buffer.append(audio=audio_base64), self.loop
-            )
-            return (None, pyaudio.paContinue)
-
-        if self.input_stream:
-            return
-
-        # Store the current event loop for use in threads
-        self.loop = asyncio.get_event_loop()
-
-        try:
-            self.input_stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.rate,
-                input=True,
-                frames_per_buffer=self.chunk_size,
-                stream_callback=_capture_callback,
-            )
-            logger.info("Started audio capture")
-
-        except Exception:
-            logger.exception("Failed to start audio capture")
-            raise
-
-    def start_playback(self):
-        """Initialize audio playback system."""
-        if self.output_stream:
-            return
-
-        remaining = bytes()
-        def _playback_callback(
-            _in_data,
-            frame_count,  # number of frames
-            _time_info,
-            _status_flags):
-
-            nonlocal remaining
-            frame_count *= pyaudio.get_sample_size(pyaudio.paInt16)
-
-            out = remaining[:frame_count]
-            remaining = remaining[frame_count:]
-
-            while len(out) < frame_count:
-                try:
-                    packet = self.playback_queue.get_nowait()
-                except queue.Empty:
-                    out = out + bytes(frame_count - len(out))
-                    continue
-                except Exception:
-                    logger.exception("Error in audio playback")
-                    raise
-
-                if not packet or not packet.data:
-                    # None packet indicates end of stream
-                    logger.info("End of playback queue.")
-                    break
-
-                if packet.seq_num < self.playback_base:
-                    # skip requested
-                    # ignore skipped packet and clear remaining
-                    if len(remaining) > 0:
-                        remaining = bytes()
-                    continue
-
-                num_to_take = frame_count - len(out)
-                out = out + packet.data[:num_to_take]
-                remaining = packet.data[num_to_take:]
-
-            if len(out) >= frame_count:
-                return (out, pyaudio.paContinue)
-            else:
-                return (out, pyaudio.paComplete)
-
-        try:
-            self.output_stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.rate,
-                output=True,
-                frames_per_buffer=self.chunk_size,
-                stream_callback=_playback_callback
-            )
-            logger.info("Audio playback system ready")
-        except Exception:
-            logger.exception("Failed to initialize audio playback")
-            raise
-
-    def _get_and_increase_seq_num(self):
-        seq = self.next_seq_num
-        self.next_seq_num += 1
-        return seq
-
-    def queue_audio(self, audio_data: Optional[bytes]) -> None:
-        """Queue audio data for playback."""
-        self.playback_queue.put(
-            AudioProcessor.AudioPlaybackPacket(
-                seq_num=self._get_and_increase_seq_num(),
-                data=audio_data))
-
-    def skip_pending_audio(self):
-        """Skip current audio in playback queue."""
-        self.playback_base = self._get_and_increase_seq_num()
-
-    def shutdown(self):
-        """Clean up audio resources."""
-        if self.input_stream:
-            self.input_stream.stop_stream()
-            self.input_stream.close()
-            self.input_stream = None
-
-        logger.info("Stopped audio capture")
-
-        # Inform thread to complete
-        if self.output_stream:
-            self.skip_pending_audio()
-            self.queue_audio(None)
-            self.output_stream.stop_stream()
-            self.output_stream.close()
-            self.output_stream = None
-
-        logger.info("Stopped audio playback")
-
-        if self.audio:
-            self.audio.terminate()
-
-        logger.info("Audio processor cleaned up")
-
 class BasicVoiceAssistant:
     """Basic voice assistant implementing the VoiceLive SDK patterns."""
 
@@ -261,6 +83,7 @@ class BasicVoiceAssistant:
         self.session_ready = False
         self._active_response = False
         self._response_api_done = False
+        self._response_epoch: Optional[int] = None
         self.conversation_started = False
         self.byom = byom
 
@@ -402,10 +225,12 @@ class BasicVoiceAssistant:
             logger.info("🤖 Assistant response created")
             self._active_response = True
             self._response_api_done = False
+            # Audio of this response is dropped once the user barges in
+            self._response_epoch = ap.playback_epoch
 
         elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
             logger.debug("Received audio delta")
-            ap.queue_audio(event.delta)
+            ap.queue_audio(event.delta, self._response_epoch)
 
         elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
             logger.info("🤖 Assistant finished speaking")
@@ -548,28 +373,7 @@ def main():
 if __name__ == "__main__":
     # Check audio system
     try:
-        p = pyaudio.PyAudio()
-        # Check for input devices
-        input_devices = [
-            i
-            for i in range(p.get_device_count())
-            if cast(Union[int, float], p.get_device_info_by_index(i).get("maxInputChannels", 0) or 0) > 0
-        ]
-        # Check for output devices
-        output_devices = [
-            i
-            for i in range(p.get_device_count())
-            if cast(Union[int, float], p.get_device_info_by_index(i).get("maxOutputChannels", 0) or 0) > 0
-        ]
-        p.terminate()
-
-        if not input_devices:
-            print("❌ No audio input devices found. Please check your microphone.")
-            sys.exit(1)
-        if not output_devices:
-            print("❌ No audio output devices found. Please check your speakers.")
-            sys.exit(1)
-
+        check_audio_devices()
     except Exception as e:
         print(f"❌ Audio system check failed: {e}")
         sys.exit(1)
@@ -0,0 +1,157 @@
+"""
+Admission control for new voice sessions
+Caps concurrent VoiceLive sessions per process and queues extra requests
+(FIFO, bounded, with a timeout) so a demand spike cannot degrade the audio
+of callers already in a session.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of an admission request
+ADMITTED = "admitted"
+REJECTED_QUEUE_FULL = "queue_full"
+REJECTED_TIMEOUT = "queue_timeout"
+
+registry.describe("admission_admitted_total", "Voice sessions admitted")
+registry.describe("admission_rejected_total", "Voice sessions rejected, by reason")
+registry.describe("admission_wait_seconds", "Time admitted sessions spent in the admission queue")
+registry.describe("admission_active_sessions", "Sessions holding an admission slot")
+registry.describe("admission_queue_depth", "Sessions waiting for an admission slot")
+
+
+class AdmissionController:
+    """
+    Counting admission gate with a bounded FIFO wait queue.
+
+    A client holds at most one slot; acquiring again while admitted is a no-op.
+    """
+
+    def __init__(self, max_sessions: int, max_queue: int = 20, queue_timeout_s: float = 10.0):
+        self.max_sessions = max(1, max_sessions)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout_s = queue_timeout_s
+
+        self._active: Set[str] = set()
+        self._waiters: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+        self._admitted_total = registry.counter("admission_admitted_total")
+        self._wait_time = registry.histogram("admission_wait_seconds")
+        registry.register_collector(self._collect_metrics)
+
+    @property
+    def active_sessions(self) -> int:
+        return len(self._active)
+
+    @property
+    def queued_sessions(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def available(self) -> int:
+        return max(0, self.max_sessions - len(self._active))
+
+    async def acquire(
+        self,
+        client_id: str,
+        on_queued: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> str:
+        """
+        Wait for a session slot.
+
+        Args:
+            client_id: Client requesting a session
+            on_queued: Called with the 1-based queue position if the request has to wait
+
+        Returns:
+            ADMITTED, REJECTED_QUEUE_FULL or REJECTED_TIMEOUT
+        """
+        if client_id in self._active:
+            return ADMITTED
+
+        if len(self._active) < self.max_sessions and not self._waiters:
+            self._admit(client_id)
+            return ADMITTED
+
+        if len(self._waiters) >= self.max_queue or client_id in self._waiters:
+            return self._reject(client_id, REJECTED_QUEUE_FULL)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[client_id] = future
+        queued_at = time.perf_counter()
+        logger.info(
+            f"Session for {client_id} queued at position {len(self._waiters)} "
+            f"({len(self._active)}/{self.max_sessions} active)"
+        )
+
+        try:
+            if on_queued:
+                await on_queued(len(self._waiters))
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout_s)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Admitted at the same moment the timeout fired
+                pass
+            else:
+                self._waiters.pop(client_id, None)
+                future.cancel()
+                return self._reject(client_id, REJECTED_TIMEOUT)
+        except BaseException:
+            # Caller went away while queued: give up the place (or the slot)
+            self._waiters.pop(client_id, None)
+            if future.done() and not future.cancelled():
+                self.release(client_id)
+            future.cancel()
+            raise
+
+        self._wait_time.observe(time.perf_counter() - queued_at)
+        return ADMITTED
+
+    def release(self, client_id: str):
+        """Free a client's slot (or queue place) and admit the next waiter. Safe to repeat."""
+        waiter = self._waiters.pop(client_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.cancel()
+
+        if client_id not in self._active:
+            return
+        self._active.discard(client_id)
+
+        while self._waiters and len(self._active) < self.max_sessions:
+            next_client, future = self._waiters.popitem(last=False)
+            if future.done():
+                continue
+            self._admit(next_client)
+            future.set_result(True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_sessions": len(self._active),
+            "max_sessions": self.max_sessions,
+            "queued": len(self._waiters),
+            "max_queue": self.max_queue,
+            "queue_timeout_seconds": self.queue_timeout_s,
+        }
+
+    def _admit(self, client_id: str):
+        self._active.add(client_id)
+        self._admitted_total.inc()
+
+    def _reject(self, client_id: str, reason: str) -> str:
+        registry.counter("admission_rejected_total", reason=reason).inc()
+        logger.warning(
+            f"Session for {client_id} rejected ({reason}): "
+            f"{len(self._active)}/{self.max_sessions} active, {len(self._waiters)} queued"
+        )
+        return reason
+
+    def _collect_metrics(self):
+        registry.gauge("admission_active_sessions").set(len(self._active))
+        registry.gauge("admission_queue_depth").set(len(self._waiters))
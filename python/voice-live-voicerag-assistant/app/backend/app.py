@@ -7,36 +7,183 @@ import asyncio
 import json
 import logging
 import base64
-from typing import Dict, List, Optional
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from typing import Any, Dict, List, Optional
+from fastapi import FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import uvicorn
 import os
+import signal
 
 from web_handler import WebSocketVoiceClient, VoiceAssistantBridge
+from tool_executor import get_tool_latency_stats
+from metrics import registry as metrics_registry
+from turn_tracing import turn_recorder
+from tool_loader import ToolConfigError, ToolConfigWatcher, reload_tools_async
+from tools.implementations import close_semantic_cache, get_search_cache_stats
+from audio_protocol import (
+    AUDIO_TRANSPORT_BINARY,
+    FRAME_KIND_AUDIO_IN,
+    HEADER_SIZE,
+    BinaryAudioEncoder,
+    decode_frame,
+    negotiate_audio_transport,
+)
 from azure.core.credentials import AzureKeyCredential
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+from log_utils import configure_logging
+from session_registry import HEARTBEAT_INTERVAL_SECONDS, create_session_registry
+from admission import ADMITTED, AdmissionController
+from connection_pool import VoiceLiveConnectionPool, WarmSessionSpec
+from session_templates import instructions_file, session_templates
+from session_supervisor import (
+    REASON_DISCONNECTED,
+    REASON_IDLE,
+    REASON_STOPPED,
+    SessionSupervisor,
 )
+
+# Set up logging (queued, so log I/O stays off the event loop)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
-# Global bridge instance
+# Global bridge instance (one per worker process)
 bridge = VoiceAssistantBridge()
 
+# Which worker owns which session; shared between workers when SESSION_REGISTRY=sqlite
+session_registry = create_session_registry()
+MAX_SESSIONS_PER_WORKER = int(os.getenv("MAX_SESSIONS_PER_WORKER", "100"))
+
+# Admission control: at most MAX_SESSIONS_PER_WORKER concurrent voice sessions,
+# extra requests wait in a bounded queue
+admission = AdmissionController(
+    max_sessions=MAX_SESSIONS_PER_WORKER,
+    max_queue=int(os.getenv("ADMISSION_QUEUE_MAX", "20")),
+    queue_timeout_s=float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "10")),
+)
+
+
+# Pre-connected, pre-configured VoiceLive sessions (VOICELIVE_POOL_SIZE=0 disables)
+connection_pool = VoiceLiveConnectionPool(
+    size=int(os.getenv("VOICELIVE_POOL_SIZE", "0")),
+    max_age_s=float(os.getenv("VOICELIVE_POOL_MAX_AGE_SECONDS", "120")),
+)
+
+
+async def _on_voice_session_exit(
+    client_id: str, voice_client, reason: str, error: Optional[BaseException]
+):
+    """Release what a finished voice session held, unless it was replaced by a newer one"""
+    if bridge.voice_clients.get(client_id) is not voice_client:
+        return
+    del bridge.voice_clients[client_id]
+    admission.release(client_id)
+
+    if reason == REASON_IDLE:
+        await bridge.send_message(
+            client_id, {"type": "session_stopped", "status": "idle_timeout"}
+        )
+    elif error is not None:
+        await bridge.send_message(client_id, {"type": "session_error", "error": str(error)})
+
+
+# Owns the voice_client.run() tasks: one per client, idle timeout, guaranteed teardown
+supervisor = SessionSupervisor(
+    idle_timeout_s=float(os.getenv("SESSION_IDLE_TIMEOUT_SECONDS", "300")),
+    on_exit=_on_voice_session_exit,
+)
+CONTROL_MESSAGE_TYPES = ("interrupt", "stop_session", "disconnect")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting WebSocket server...")
+
+    # Hot-reload tools_config.yaml (set TOOLS_CONFIG_WATCH_INTERVAL=0 to disable)
+    watcher = None
+    watch_interval = float(os.getenv("TOOLS_CONFIG_WATCH_INTERVAL", "5"))
+    if watch_interval > 0:
+        watcher = ToolConfigWatcher(interval_seconds=watch_interval)
+        watcher.start()
+
+    # SIGHUP also triggers a reload
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, lambda: asyncio.create_task(_reload_tools_from_signal())
+        )
+    except (NotImplementedError, AttributeError, RuntimeError):
+        pass  # Signals not available (e.g. Windows or non-main thread)
+
+    # Register this worker and serve control messages routed to it
+    await session_registry.start(MAX_SESSIONS_PER_WORKER)
+    registry_tasks = [
+        asyncio.create_task(_control_loop()),
+        asyncio.create_task(_heartbeat_loop()),
+    ]
+    logger.info(f"Worker {session_registry.worker_id} ready")
+    supervisor.start_reaper()
+
+    # Instructions are read here and by the watcher, never on session start
+    await instructions_file.load()
+    instructions_file.start()
+
+    connection_pool.start()
+    try:
+        prime_connection_pool()
+    except Exception as e:
+        logger.warning(f"Could not prime VoiceLive connection pool: {e}")
+
     yield
+
+    await supervisor.shutdown()
+    await connection_pool.stop()
+    await instructions_file.stop()
+    await close_semantic_cache()
+    for task in registry_tasks:
+        task.cancel()
+    await asyncio.gather(*registry_tasks, return_exceptions=True)
+    await session_registry.stop()
+    if watcher:
+        await watcher.stop()
     logger.info("Shutting down WebSocket server...")
 
 
+async def _control_loop():
+    """Apply control messages other workers routed to sessions owned here"""
+    while True:
+        try:
+            for client_id, message in await session_registry.receive_control(1.0):
+                await handle_control_message(client_id, message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error receiving control messages: {e}")
+            await asyncio.sleep(1.0)
+
+
+async def _heartbeat_loop():
+    """Publish this worker's load for load balancing"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            await session_registry.report_capacity(
+                admission.active_sessions, MAX_SESSIONS_PER_WORKER
+            )
+        except Exception as e:
+            logger.error(f"Error reporting worker capacity: {e}")
+
+
+async def _reload_tools_from_signal():
+    """Reload tools on SIGHUP, keeping the current registry on failure"""
+    try:
+        await reload_tools_async()
+    except Exception as e:
+        logger.error(f"Tool configuration reload failed: {e}")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Voice Assistant WebSocket API",
@@ -72,17 +219,113 @@ async def get_config():
     }
 
 
+@app.get("/stats")
+async def get_stats():
+    """Per-client outbound queue depth and drop counts, tool and turn latencies"""
+    return {
+        "active_connections": len(bridge.active_connections),
+        "voice_sessions": len(bridge.voice_clients),
+        "admission": admission.stats(),
+        "supervisor": supervisor.stats(),
+        "connection_pool": connection_pool.stats(),
+        "session_templates": session_templates.stats(),
+        "send_queues": bridge.get_send_queue_stats(),
+        "tool_latency": get_tool_latency_stats(),
+        "search_cache": get_search_cache_stats(),
+        "turn_latency": turn_recorder.stage_stats(),
+        "recent_turns": turn_recorder.recent_turns(),
+    }
+
+
+@app.get("/capacity")
+async def get_capacity():
+    """This worker's session capacity, for load balancer weighting"""
+    return {
+        "worker_id": session_registry.worker_id,
+        "active_sessions": admission.active_sessions,
+        "queued_sessions": admission.queued_sessions,
+        "capacity": MAX_SESSIONS_PER_WORKER,
+        "available": admission.available,
+    }
+
+
+@app.get("/workers")
+async def list_workers():
+    """Capacity of every live worker sharing the session registry"""
+    return {"workers": await session_registry.list_workers()}
+
+
+def _require_admin_key(x_admin_key: Optional[str]):
+    """Reject requests without the ADMIN_API_KEY in the x-admin-key header."""
+    admin_key = os.getenv("ADMIN_API_KEY")
+    if not admin_key or x_admin_key != admin_key:
+        raise HTTPException(status_code=403, detail="Admin access denied")
+
+
+@app.post("/sessions/{client_id}/control")
+async def control_session(
+    client_id: str,
+    message: Dict[str, Any],
+    x_admin_key: Optional[str] = Header(default=None),
+):
+    """Deliver a control message (interrupt, stop_session, disconnect) to the worker owning a session (requires ADMIN_API_KEY)"""
+    _require_admin_key(x_admin_key)
+    if message.get("type") not in CONTROL_MESSAGE_TYPES:
+        raise HTTPException(status_code=400, detail="Unsupported control message type")
+
+    owner = await session_registry.get_owner(client_id)
+    if owner is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    if owner == session_registry.worker_id:
+        await handle_control_message(client_id, message)
+        return {"status": "applied", "worker_id": owner}
+
+    await session_registry.send_control(owner, client_id, message)
+    return {"status": "forwarded", "worker_id": owner}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(
+        metrics_registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.post("/admin/reload-tools")
+async def reload_tools_endpoint(x_admin_key: Optional[str] = Header(default=None)):
+    """Validate and hot-swap tools_config.yaml (requires ADMIN_API_KEY)"""
+    _require_admin_key(x_admin_key)
+
+    try:
+        registry = await reload_tools_async()
+    except ToolConfigError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"status": "reloaded", "tools": dict(registry.environment_info)}
+
+
 # Define WebSocket endpoint
 @app.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """WebSocket endpoint for voice assistant communication"""
     await bridge.connect(websocket, client_id)
+    await _claim_session(client_id)
 
     try:
         while True:
-            # Receive message from frontend
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            # Receive message from frontend (JSON control text or binary audio)
+            data = await websocket.receive()
+            if data["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(data.get("code", 1000))
+
+            if data.get("bytes") is not None:
+                await handle_binary_frame(client_id, data["bytes"])
+                continue
+
+            message = json.loads(data["text"])
 
             await handle_frontend_message(client_id, message, websocket)
 
@@ -91,7 +334,54 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     except Exception as e:
         logger.error(f"WebSocket error for client {client_id}: {e}")
     finally:
+        await supervisor.stop(client_id, REASON_DISCONNECTED)
         await bridge.disconnect(client_id)
+        admission.release(client_id)
+        try:
+            await session_registry.unregister_session(client_id)
+        except Exception as e:
+            logger.error(f"Failed to release session {client_id}: {e}")
+
+
+async def _claim_session(client_id: str):
+    """Record this worker as the session owner, closing a stale copy on another worker"""
+    try:
+        previous_owner = await session_registry.register_session(client_id)
+        if previous_owner:
+            logger.info(f"Session {client_id} moved from worker {previous_owner}")
+            await session_registry.send_control(
+                previous_owner, client_id, {"type": "disconnect", "reason": "session_moved"}
+            )
+    except Exception as e:
+        logger.error(f"Failed to register session {client_id}: {e}")
+
+
+async def handle_control_message(client_id: str, message: dict):
+    """Apply a control message to a session owned by this worker"""
+    message_type = message.get("type")
+
+    if message_type == "interrupt":
+        await interrupt_assistant(client_id)
+
+    elif message_type == "stop_session":
+        await stop_voice_session(client_id)
+
+    elif message_type == "disconnect":
+        websocket = bridge.active_connections.get(client_id)
+        if websocket is not None:
+            # Tear down first so the send queue is closed, then tell the client directly
+            await supervisor.stop(client_id, REASON_DISCONNECTED)
+            await bridge.disconnect(client_id)
+            try:
+                await websocket.send_json(
+                    {"type": "session_closed", "reason": message.get("reason", "disconnect")}
+                )
+                await websocket.close(code=4001)
+            except Exception as e:
+                logger.debug(f"Client {client_id} already gone: {e}")
+
+    else:
+        logger.warning(f"Unknown control message type: {message_type}")
 
 
 async def handle_frontend_message(client_id: str, message: dict, websocket: WebSocket):
@@ -118,8 +408,68 @@ async def handle_frontend_message(client_id: str, message: dict, websocket: WebS
         logger.warning(f"Unknown message type: {message_type}")
 
 
+async def admit_voice_session(client_id: str) -> bool:
+    """Wait for an admission slot, telling the client if it is queued or rejected"""
+
+    async def notify_queued(position: int):
+        await bridge.send_message(
+            client_id,
+            {
+                "type": "session_queued",
+                "position": position,
+                "timeout_seconds": admission.queue_timeout_s,
+            },
+        )
+
+    outcome = await admission.acquire(client_id, on_queued=notify_queued)
+    if outcome != ADMITTED:
+        await bridge.send_message(
+            client_id,
+            {
+                "type": "session_rejected",
+                "reason": outcome,
+                "message": "The voice assistant is at capacity, please try again shortly",
+                "retry_after_seconds": admission.queue_timeout_s,
+            },
+        )
+        return False
+
+    if client_id not in bridge.active_connections:
+        # Client left while it was queued
+        admission.release(client_id)
+        return False
+    return True
+
+
+def prime_connection_pool():
+    """Start warming VoiceLive sessions for the default configuration"""
+    endpoint = os.getenv("AZURE_VOICELIVE_ENDPOINT")
+    api_key = os.getenv("AZURE_VOICELIVE_API_KEY")
+    if not connection_pool.enabled or not endpoint or not api_key:
+        return
+
+    from tool_loader import get_tool_loader
+
+    connection_pool.prime(
+        WarmSessionSpec(
+            endpoint=endpoint,
+            credential=AzureKeyCredential(api_key),
+            template=session_templates.get(
+                os.getenv("VOICELIVE_MODEL", "gpt-realtime"),
+                os.getenv("VOICELIVE_VOICE", "en-US-Ava:DragonHDLatestNeural"),
+                os.getenv("VOICELIVE_TRANSCRIBE_MODEL", "gpt-4o-transcribe"),
+                instructions_file.read(),
+                get_tool_loader().get_registry().api_tools,
+            ),
+        )
+    )
+
+
 async def start_voice_session(client_id: str, config: dict):
     """Start a voice session for the client"""
+    if not await admit_voice_session(client_id):
+        return
+
     try:
         # Get environment variables
         endpoint = os.getenv("AZURE_VOICELIVE_ENDPOINT")
@@ -131,27 +481,38 @@ async def start_voice_session(client_id: str, config: dict):
         # Create credential
         credential = AzureKeyCredential(api_key)
 
-        # Load instructions
-        instructions_path = os.path.join(
-            os.path.dirname(__file__), "shared", "instructions.txt"
-        )
-        with open(instructions_path, "r", encoding="utf-8") as f:
-            instructions = f.read()
+        # Cached in memory; reloaded by a background watcher when the file changes
+        instructions = instructions_file.read()
 
         # Load tools from YAML configuration
         from tool_loader import get_tool_loader
 
-        tool_loader = get_tool_loader()
-        tools = tool_loader.get_tool_definitions()
+        # Shared, precomputed registry: no YAML walking or imports per session
+        tool_registry = get_tool_loader().get_registry()
+        tools = tool_registry.api_tools
 
         # Log tool environment info
-        env_info = tool_loader.get_environment_info()
-        logger.info(f"Tool environment: {env_info}")
+        logger.info(f"Tool environment: {dict(tool_registry.environment_info)}")
+
+        # Negotiate audio transport (binary frames or base64-in-JSON fallback)
+        audio_transport = negotiate_audio_transport(config.get("audioTransport"))
+        binary_encoder = BinaryAudioEncoder()
 
         # Create audio streaming callback
-        async def stream_audio_to_client(audio_data: bytes):
+        async def stream_audio_to_client(
+            audio_data: bytes, response_id: Optional[str] = None
+        ):
             """Stream audio data to frontend via WebSocket."""
             try:
+                if audio_transport == AUDIO_TRANSPORT_BINARY:
+                    frame = binary_encoder.encode(
+                        audio_data,
+                        asyncio.get_event_loop().time(),
+                        response_id=response_id,
+                    )
+                    await bridge.send_bytes(client_id, frame)
+                    return
+
                 # Encode audio data as base64 for WebSocket transmission
                 audio_base64 = base64.b64encode(audio_data).decode("utf-8")
 
@@ -165,9 +526,12 @@ async def start_voice_session(client_id: str, config: dict):
                 }
 
                 await bridge.send_message(client_id, message)
-                logger.debug(
-                    f"🔊 Audio data streamed to client {client_id} ({len(audio_data)} bytes)"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "🔊 Audio data streamed to client %s (%d bytes)",
+                        client_id,
+                        len(audio_data),
+                    )
 
             except Exception as e:
                 logger.error(f"Failed to stream audio to client {client_id}: {e}")
@@ -187,7 +551,9 @@ async def start_voice_session(client_id: str, config: dict):
             ),
             instructions=instructions,
             tools=tools,
+            tool_registry=tool_registry,
             websocket_callback=stream_audio_to_client,
+            connection_pool=connection_pool,
         )
 
         # Store client
@@ -205,6 +571,10 @@ async def start_voice_session(client_id: str, config: dict):
                     "voice": voice_client.voice,
                     "tools_count": len(tools),
                     "audio_streaming": True,
+                    "audio_transport": audio_transport,
+                    "frame_header_bytes": (
+                        HEADER_SIZE if audio_transport == AUDIO_TRANSPORT_BINARY else 0
+                    ),
                     "sample_rate": 24000,
                     "format": "pcm16",
                     "channels": 1,
@@ -212,24 +582,27 @@ async def start_voice_session(client_id: str, config: dict):
             },
         )
 
-        # Start the voice client (this will run in background)
-        asyncio.create_task(voice_client.run())
+        # Run the voice client in the background; a previous session for this
+        # client is cancelled and awaited first
+        await supervisor.start(client_id, voice_client)
 
         logger.info(
-            f"✅ Voice session with audio streaming started for client {client_id}"
+            f"✅ Voice session with audio streaming started for client {client_id} "
+            f"({audio_transport} audio transport)"
         )
 
     except Exception as e:
         logger.error(f"Failed to start voice session for {client_id}: {e}")
+        admission.release(client_id)
         await bridge.send_message(client_id, {"type": "session_error", "error": str(e)})
 
 
 async def stop_voice_session(client_id: str):
     """Stop voice session for the client"""
     if client_id in bridge.voice_clients:
-        voice_client = bridge.voice_clients[client_id]
-        await voice_client.cleanup()
-        del bridge.voice_clients[client_id]
+        # Cancels voice_client.run(), which closes the VoiceLive connection;
+        # the exit handler releases the client's slot
+        await supervisor.stop(client_id, REASON_STOPPED)
 
         await bridge.send_message(
             client_id, {"type": "session_stopped", "status": "success"}
@@ -246,7 +619,8 @@ async def handle_audio_input(client_id: str, audio_data: str):
     try:
         # Audio data should be base64 encoded
         await voice_client.process_audio_input(audio_data)
-        logger.debug(f"Audio input processed for client {client_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Audio input processed for client %s", client_id)
     except Exception as e:
         logger.error(f"Error handling audio input for {client_id}: {e}")
 
@@ -261,11 +635,38 @@ async def handle_audio_chunk(client_id: str, audio_base64: str):
     try:
         # Process audio chunk
         await voice_client.process_audio_input(audio_base64)
-        logger.debug(f"Audio chunk processed for client {client_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Audio chunk processed for client %s", client_id)
     except Exception as e:
         logger.error(f"Error handling audio chunk for {client_id}: {e}")
 
 
+async def handle_binary_frame(client_id: str, data: bytes):
+    """Handle binary audio frames from frontend (binary audio transport)"""
+    if client_id not in bridge.voice_clients:
+        logger.warning(f"No voice client found for {client_id}")
+        return
+
+    try:
+        header, payload = decode_frame(data)
+    except ValueError as e:
+        logger.warning(f"Dropping invalid binary frame from {client_id}: {e}")
+        return
+
+    if header.kind != FRAME_KIND_AUDIO_IN:
+        logger.warning(f"Unexpected binary frame kind {header.kind} from {client_id}")
+        return
+
+    voice_client = bridge.voice_clients[client_id]
+    try:
+        # VoiceLive expects base64 audio on its side of the bridge
+        await voice_client.process_audio_input(
+            base64.b64encode(payload).decode("ascii")
+        )
+    except Exception as e:
+        logger.error(f"Error handling binary audio frame for {client_id}: {e}")
+
+
 async def interrupt_assistant(client_id: str):
     """Interrupt the assistant's current response"""
     if client_id not in bridge.voice_clients:
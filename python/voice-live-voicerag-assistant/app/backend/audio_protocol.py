@@ -0,0 +1,127 @@
+"""
+Binary audio framing for the frontend WebSocket
+PCM16 audio travels as binary WebSocket messages with a small fixed header,
+while control messages stay on the JSON text protocol.
+"""
+
+import struct
+from typing import NamedTuple, Optional, Tuple
+
+# Audio transports a client can negotiate in the start_session config
+AUDIO_TRANSPORT_TEXT = "text"
+AUDIO_TRANSPORT_BINARY = "binary"
+SUPPORTED_AUDIO_TRANSPORTS = (AUDIO_TRANSPORT_TEXT, AUDIO_TRANSPORT_BINARY)
+
+FRAME_VERSION = 1
+
+# Frame kinds
+FRAME_KIND_AUDIO_OUT = 1  # backend -> frontend (assistant audio)
+FRAME_KIND_AUDIO_IN = 2  # frontend -> backend (microphone audio)
+
+# Little-endian header:
+#   version (uint8) | kind (uint8) | reserved (uint16) |
+#   sequence (uint32) | response index (uint32) | timestamp seconds (float64)
+_HEADER = struct.Struct("<BBHIId")
+HEADER_SIZE = _HEADER.size
+
+_SEQUENCE_MASK = 0xFFFFFFFF
+
+
+class AudioFrameHeader(NamedTuple):
+    """Decoded header of a binary audio frame."""
+
+    version: int
+    kind: int
+    sequence: int
+    response_index: int
+    timestamp: float
+
+
+def negotiate_audio_transport(requested: Optional[str]) -> str:
+    """
+    Pick the audio transport for a session.
+
+    Args:
+        requested: Transport requested by the client (``"binary"`` or ``"text"``)
+
+    Returns:
+        The negotiated transport, falling back to the text protocol
+    """
+    if isinstance(requested, str) and requested.lower() == AUDIO_TRANSPORT_BINARY:
+        return AUDIO_TRANSPORT_BINARY
+    return AUDIO_TRANSPORT_TEXT
+
+
+def encode_frame(
+    payload: bytes,
+    kind: int,
+    sequence: int,
+    timestamp: float,
+    response_index: int = 0,
+) -> bytes:
+    """Prefix a PCM16 payload with a binary frame header."""
+    header = _HEADER.pack(
+        FRAME_VERSION, kind, 0, sequence & _SEQUENCE_MASK, response_index, timestamp
+    )
+    return header + payload
+
+
+def decode_frame(data: bytes) -> Tuple[AudioFrameHeader, memoryview]:
+    """
+    Split a binary frame into its header and payload.
+
+    Args:
+        data: Raw binary WebSocket message
+
+    Returns:
+        Tuple of the decoded header and a zero-copy view of the PCM16 payload
+
+    Raises:
+        ValueError: If the frame is truncated or uses an unknown version
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError(
+            f"Binary frame too short: {len(data)} bytes (header is {HEADER_SIZE})"
+        )
+
+    version, kind, _reserved, sequence, response_index, timestamp = (
+        _HEADER.unpack_from(data)
+    )
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported binary frame version: {version}")
+
+    header = AudioFrameHeader(version, kind, sequence, response_index, timestamp)
+    return header, memoryview(data)[HEADER_SIZE:]
+
+
+class BinaryAudioEncoder:
+    """
+    Encodes outbound assistant audio into binary frames for one connection.
+
+    Tracks the frame sequence number and maps VoiceLive response ids to a
+    small per-connection response index, so the client can tell responses
+    apart without a variable-length id in every frame.
+    """
+
+    def __init__(self):
+        self.sequence = 0
+        self.response_index = 0
+        self._current_response_id: Optional[str] = None
+
+    def encode(
+        self, audio_data: bytes, timestamp: float, response_id: Optional[str] = None
+    ) -> bytes:
+        """Encode one audio chunk as a binary frame."""
+        if response_id and response_id != self._current_response_id:
+            self._current_response_id = response_id
+            self.response_index += 1
+
+        frame = encode_frame(
+            audio_data,
+            FRAME_KIND_AUDIO_OUT,
+            self.sequence,
+            timestamp,
+            self.response_index,
+        )
+        self.sequence = (self.sequence + 1) & _SEQUENCE_MASK
+        return frame
@@ -0,0 +1,307 @@
+"""
+Pool of pre-warmed VoiceLive sessions
+Keeps connections that are already open and configured (session.update sent,
+session.updated received) so a new voice session can skip the handshake and
+send its greeting straight away. Connections are pooled per configuration
+(endpoint, model, voice, instructions, tools, ...), refilled in the background
+and closed once they get stale.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import deque
+from contextlib import AsyncExitStack
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+from azure.ai.voicelive.aio import connect
+from azure.ai.voicelive.models import ServerEventType
+
+from metrics import registry
+from session_templates import SessionTemplate
+
+logger = logging.getLogger(__name__)
+
+registry.describe("voicelive_pool_claims_total", "Session starts that asked the pool, by result")
+registry.describe("voicelive_pool_warmups_total", "Pooled connections opened, by result")
+registry.describe("voicelive_pool_warmup_seconds", "Time to open and configure a pooled connection")
+registry.describe("voicelive_pool_idle", "Pre-warmed connections waiting to be claimed")
+
+# Configurations nobody asked for in this long stop being kept warm
+TARGET_IDLE_SECONDS = 600.0
+
+
+class WarmSessionSpec(NamedTuple):
+    """Everything that determines a pre-configured VoiceLive session."""
+
+    endpoint: str
+    credential: Any
+    template: SessionTemplate
+
+    @property
+    def key(self) -> str:
+        """Pool key; equal keys are interchangeable sessions."""
+        return hashlib.sha256(
+            f"{self.endpoint}|{self.template.key}".encode("utf-8")
+        ).hexdigest()[:16]
+
+
+class WarmConnection:
+    """An open, configured VoiceLive connection waiting in the pool."""
+
+    def __init__(self, key: str, connection, session, exit_stack: AsyncExitStack):
+        self.key = key
+        self.connection = connection
+        self.session = session
+        self.created_at = time.monotonic()
+        self.closed = False
+        self._exit_stack = exit_stack
+        self._keeper: Optional[asyncio.Task] = None
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def keep_alive(self):
+        """Read the connection in the background while it sits in the pool."""
+        self._keeper = asyncio.create_task(self._keep_reading())
+
+    async def detach(self):
+        """Stop the idle reader so the claiming session can read the connection."""
+        if self._keeper:
+            self._keeper.cancel()
+            await asyncio.gather(self._keeper, return_exceptions=True)
+            self._keeper = None
+
+    async def close(self):
+        """Close the connection (owned by the pool until claimed, then by the session)."""
+        await self.detach()
+        self.closed = True
+        try:
+            await self._exit_stack.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+    async def _keep_reading(self):
+        # Someone has to read the socket while idle so pings are answered
+        # and a server-side close is noticed
+        try:
+            while True:
+                event = await self.connection.recv()
+                if event.type == ServerEventType.ERROR:
+                    logger.warning(f"Pooled VoiceLive connection reported an error: {event}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.closed = True
+
+
+class _Target:
+    """A configuration the pool keeps warm."""
+
+    def __init__(self, spec: WarmSessionSpec):
+        self.spec = spec
+        self.idle: Deque[WarmConnection] = deque()
+        self.opening = 0
+        self.last_used = time.monotonic()
+
+
+class VoiceLiveConnectionPool:
+    """
+    Pre-warmed VoiceLive sessions, keyed by WarmSessionSpec.key.
+
+    A configuration is kept warm once it has been primed or claimed, and
+    dropped after TARGET_IDLE_SECONDS without claims.
+
+    Args:
+        size: Warm connections kept per configuration (0 disables the pool)
+        max_age_s: Close warm connections older than this
+        setup_timeout_s: Give up on a warm-up that takes longer than this
+        refill_interval_s: How often the background task checks the pool
+    """
+
+    def __init__(
+        self,
+        size: int = 0,
+        max_age_s: float = 120.0,
+        setup_timeout_s: float = 10.0,
+        refill_interval_s: float = 5.0,
+    ):
+        self.size = max(0, size)
+        self.max_age_s = max_age_s
+        self.setup_timeout_s = setup_timeout_s
+        self.refill_interval_s = refill_interval_s
+
+        self._targets: Dict[str, _Target] = {}
+        self._wakeup = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._warmup_tasks: set = set()
+        self._warmup_time = registry.histogram("voicelive_pool_warmup_seconds")
+        registry.register_collector(self._collect_metrics)
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def prime(self, spec: WarmSessionSpec):
+        """Start keeping a configuration warm before anyone asks for it."""
+        if self.enabled:
+            self._target(spec)
+            self._wakeup.set()
+
+    async def claim(self, spec: WarmSessionSpec) -> Optional[WarmConnection]:
+        """
+        Take a warm connection for a configuration.
+
+        Returns:
+            A connection the caller now owns (and must close), or None if none
+            was ready; the pool starts warming this configuration either way
+        """
+        if not self.enabled:
+            return None
+
+        target = self._target(spec)
+        target.last_used = time.monotonic()
+        self._wakeup.set()
+
+        while target.idle:
+            warm = target.idle.popleft()
+            if warm.closed or warm.age_seconds >= self.max_age_s:
+                await warm.close()
+                continue
+            try:
+                await warm.detach()
+            except BaseException:
+                await warm.close()
+                raise
+            if warm.closed:
+                await warm.close()
+                continue
+            registry.counter("voicelive_pool_claims_total", result="hit").inc()
+            return warm
+
+        registry.counter("voicelive_pool_claims_total", result="miss").inc()
+        return None
+
+    def start(self):
+        """Start the background refill task."""
+        if self.enabled and self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill_loop())
+
+    async def stop(self):
+        """Stop refilling and close every pooled connection."""
+        if self._refill_task:
+            self._refill_task.cancel()
+            await asyncio.gather(self._refill_task, return_exceptions=True)
+            self._refill_task = None
+        for task in list(self._warmup_tasks):
+            task.cancel()
+        await asyncio.gather(*self._warmup_tasks, return_exceptions=True)
+
+        idle = [warm for target in self._targets.values() for warm in target.idle]
+        self._targets.clear()
+        await asyncio.gather(*(warm.close() for warm in idle), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "size": self.size,
+            "max_age_seconds": self.max_age_s,
+            "configurations": {
+                key: {"idle": len(target.idle), "opening": target.opening}
+                for key, target in self._targets.items()
+            },
+        }
+
+    def _target(self, spec: WarmSessionSpec) -> _Target:
+        key = spec.key
+        target = self._targets.get(key)
+        if target is None:
+            target = self._targets[key] = _Target(spec)
+            logger.info(f"Keeping {self.size} VoiceLive session(s) warm for configuration {key}")
+        return target
+
+    async def _refill_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.refill_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self._refill()
+            except Exception as e:
+                logger.error(f"Error refilling VoiceLive connection pool: {e}")
+
+    async def _refill(self):
+        now = time.monotonic()
+        stale = []
+        for key, target in list(self._targets.items()):
+            if now - target.last_used >= TARGET_IDLE_SECONDS:
+                logger.info(f"No longer keeping configuration {key} warm")
+                del self._targets[key]
+                stale.extend(target.idle)
+                continue
+
+            fresh = [w for w in target.idle if not w.closed and w.age_seconds < self.max_age_s]
+            stale.extend(w for w in target.idle if w not in fresh)
+            target.idle = deque(fresh)
+
+            for _ in range(self.size - len(target.idle) - target.opening):
+                target.opening += 1
+                task = asyncio.create_task(self._warm_up(key, target))
+                self._warmup_tasks.add(task)
+                task.add_done_callback(self._warmup_tasks.discard)
+
+        if stale:
+            await asyncio.gather(*(warm.close() for warm in stale), return_exceptions=True)
+
+    async def _warm_up(self, key: str, target: _Target):
+        start = time.perf_counter()
+        try:
+            warm = await asyncio.wait_for(self._open(key, target.spec), self.setup_timeout_s)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            registry.counter("voicelive_pool_warmups_total", result="error").inc()
+            logger.warning(f"Could not pre-warm VoiceLive session for {key}: {e}")
+            return
+        finally:
+            target.opening -= 1
+
+        self._warmup_time.observe(time.perf_counter() - start)
+        registry.counter("voicelive_pool_warmups_total", result="ok").inc()
+        if self._targets.get(key) is not target:
+            # Configuration was dropped while this connection was opening
+            await warm.close()
+            return
+        warm.keep_alive()
+        target.idle.append(warm)
+
+    async def _open(self, key: str, spec: WarmSessionSpec) -> WarmConnection:
+        """Connect, send session.update and wait for session.updated."""
+        exit_stack = AsyncExitStack()
+        try:
+            connection = await exit_stack.enter_async_context(
+                connect(
+                    endpoint=spec.endpoint,
+                    credential=spec.credential,
+                    model=spec.template.model,
+                )
+            )
+            await connection.session.update(session=spec.template.session_config)
+            while True:
+                event = await connection.recv()
+                if event.type == ServerEventType.SESSION_UPDATED:
+                    return WarmConnection(key, connection, event.session, exit_stack)
+                if event.type == ServerEventType.ERROR:
+                    raise RuntimeError(f"VoiceLive error during warm-up: {event}")
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+
+    def _collect_metrics(self):
+        registry.gauge("voicelive_pool_idle").set(
+            sum(len(target.idle) for target in self._targets.values())
+        )
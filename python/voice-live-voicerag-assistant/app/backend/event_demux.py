@@ -0,0 +1,121 @@
+"""
+Event demultiplexer for a VoiceLive connection
+A single reader dispatches every server event; code that needs to wait for a
+specific event registers a future instead of reading the connection itself.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (future, call_id filter)
+_Waiter = Tuple[asyncio.Future, Optional[str]]
+
+
+class EventDemultiplexer:
+    """
+    Routes server events to registered waiters without consuming the stream.
+
+    Waiters are keyed by event type and, optionally, by ``call_id`` so that
+    concurrent function calls each receive their own events. Dispatching never
+    removes an event from the main processing path.
+    """
+
+    def __init__(self):
+        self._waiters: Dict[str, List[_Waiter]] = {}
+        self._closed_error: Optional[BaseException] = None
+
+    def expect(
+        self, wanted_types: Iterable[Any], call_id: Optional[str] = None
+    ) -> asyncio.Future:
+        """
+        Register interest in the next event of the given types.
+
+        Register before triggering the event (e.g. before sending a request)
+        so it cannot be dispatched before the waiter exists.
+
+        Args:
+            wanted_types: Event types that resolve the waiter
+            call_id: Only resolve for events carrying this call_id
+
+        Returns:
+            Future resolved with the matching event
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self._closed_error is not None:
+            future.set_exception(self._closed_error)
+            return future
+
+        wanted_types = list(wanted_types)
+        waiter: _Waiter = (future, call_id)
+        for event_type in wanted_types:
+            self._waiters.setdefault(event_type, []).append(waiter)
+
+        future.add_done_callback(lambda _f: self._discard(waiter, wanted_types))
+        return future
+
+    async def wait(self, future: asyncio.Future, timeout_s: float = 10.0):
+        """Wait for a registered future, unregistering it on timeout."""
+        try:
+            return await asyncio.wait_for(future, timeout=timeout_s)
+        finally:
+            if not future.done():
+                future.cancel()
+
+    async def wait_for(
+        self,
+        wanted_types: Iterable[Any],
+        call_id: Optional[str] = None,
+        timeout_s: float = 10.0,
+    ):
+        """Register and wait for the next matching event."""
+        return await self.wait(self.expect(wanted_types, call_id), timeout_s)
+
+    def dispatch(self, event) -> int:
+        """
+        Resolve every waiter matching this event.
+
+        Returns:
+            Number of waiters resolved
+        """
+        waiters = self._waiters.get(event.type)
+        if not waiters:
+            return 0
+
+        event_call_id = getattr(event, "call_id", None)
+        resolved = 0
+        for future, call_id in list(waiters):
+            if future.done():
+                continue
+            if call_id is not None and call_id != event_call_id:
+                continue
+            future.set_result(event)
+            resolved += 1
+        return resolved
+
+    def pending_count(self) -> int:
+        """Number of waiters still registered."""
+        return len({id(w[0]) for ws in self._waiters.values() for w in ws})
+
+    def close(self, error: Optional[BaseException] = None):
+        """Fail all pending waiters, e.g. when the connection ends."""
+        self._closed_error = error or ConnectionError("VoiceLive connection closed")
+        for waiters in list(self._waiters.values()):
+            for future, _call_id in list(waiters):
+                if not future.done():
+                    future.set_exception(self._closed_error)
+        self._waiters.clear()
+
+    def _discard(self, waiter: _Waiter, wanted_types: List[Any]):
+        for event_type in wanted_types:
+            waiters = self._waiters.get(event_type)
+            if not waiters:
+                continue
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiters:
+                del self._waiters[event_type]
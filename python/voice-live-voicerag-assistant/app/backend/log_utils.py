@@ -0,0 +1,156 @@
+"""
+Logging setup for the Voice Assistant backend
+Keeps log I/O off the event loop (QueueHandler + listener thread) and
+rate-limits repetitive messages emitted from the audio/event hot path.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from typing import Dict, Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Per-message-template budget for hot-path loggers (records per second, 0 = unlimited)
+DEFAULT_HOT_PATH_RATE = 5.0
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RateLimiter:
+    """
+    Token bucket per message template.
+
+    Meant for the event loop thread (no locking). Messages are keyed by their
+    unformatted template, so with lazy formatting ("... %s", arg) every chunk
+    of the same kind shares one budget.
+    """
+
+    def __init__(self, rate_per_second: float, burst: Optional[float] = None):
+        self.rate = rate_per_second
+        self.burst = burst if burst is not None else max(1.0, rate_per_second)
+        # template -> [tokens, last refill time, suppressed since last allowed]
+        self._buckets: Dict[str, list] = {}
+        self.suppressed = 0
+
+    def allow(self, template: str) -> int:
+        """
+        Take a token for a template.
+
+        Returns:
+            -1 if the message must be dropped, otherwise the number of messages
+            suppressed since the last one allowed
+        """
+        if self.rate <= 0:
+            return 0
+
+        now = time.monotonic()
+        bucket = self._buckets.get(template)
+        if bucket is None:
+            bucket = self._buckets[template] = [self.burst, now, 0]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
+            bucket[2] += 1
+            self.suppressed += 1
+            return -1
+        bucket[0] = tokens - 1.0
+        skipped, bucket[2] = bucket[2], 0
+        return skipped
+
+
+class HotPathLogger:
+    """
+    Rate-limited front for a logger, for per-event / per-chunk messages.
+
+    The level check and the rate limit run before a LogRecord is created, so a
+    suppressed or disabled message costs a dict lookup and a few additions.
+    Use lazy %-style arguments so nothing is formatted unless the record is kept.
+    """
+
+    def __init__(self, logger: logging.Logger, rate_per_second: float):
+        self.logger = logger
+        self.limiter = RateLimiter(rate_per_second)
+
+    def log(self, level: int, msg: str, *args):
+        if not self.logger.isEnabledFor(level):
+            return
+        skipped = self.limiter.allow(msg)
+        if skipped < 0:
+            return
+        if skipped:
+            msg = f"{msg} [{skipped} similar messages suppressed]"
+        self.logger.log(level, msg, *args, stacklevel=3)
+
+    def debug(self, msg: str, *args):
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg: str, *args):
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg: str, *args):
+        self.log(logging.WARNING, msg, *args)
+
+
+def get_hot_path_logger(name: str) -> HotPathLogger:
+    """
+    Rate-limited logger for the audio/event hot path.
+
+    Allows HOT_PATH_LOG_RATE records per second per message template
+    (default 5, 0 disables the limit).
+    """
+    rate = float(os.getenv("HOT_PATH_LOG_RATE", DEFAULT_HOT_PATH_RATE))
+    return HotPathLogger(logging.getLogger(name), rate)
+
+
+def configure_logging(level: Optional[str] = None, use_queue: Optional[bool] = None):
+    """
+    Configure root logging.
+
+    With the queue enabled (LOG_QUEUE_ENABLED, default on) the calling thread only
+    puts records on an in-memory queue and a background listener thread writes
+    them, so a slow stdout/stderr never blocks the event loop.
+
+    Args:
+        level: Root log level (default LOG_LEVEL env var or INFO)
+        use_queue: Route records through a QueueHandler (default LOG_QUEUE_ENABLED)
+    """
+    global _listener
+
+    level = level or os.getenv("LOG_LEVEL", "INFO")
+    if use_queue is None:
+        use_queue = os.getenv("LOG_QUEUE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(level.upper())
+
+    stop_logging_queue()
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        _listener.start()
+    else:
+        root.addHandler(stream_handler)
+
+
+def stop_logging_queue():
+    """Flush and stop the queue listener thread (safe to call more than once)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging_queue)
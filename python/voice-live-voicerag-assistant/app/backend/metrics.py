@@ -0,0 +1,243 @@
+"""
+Lightweight in-process metrics for the Voice Assistant backend
+Counters, gauges and fixed-bucket histograms rendered in the Prometheus text
+format. Recording is a few additions (plus a bisect for histograms); gauges
+that mirror existing state are filled in by collectors at scrape time, so the
+audio path pays nothing for them.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds (upper bounds, inclusive)
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Handler-time buckets in seconds, for work that is usually sub-millisecond
+FAST_LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.5,
+)
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics: value <= bucket bound)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # One extra slot for +Inf
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Record a single observation."""
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile from the buckets.
+
+        Returns:
+            Upper bound of the bucket holding the quantile, or None if empty
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(self.buckets):
+                    return self.buckets[index]
+                return float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary suitable for JSON responses."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MetricsRegistry:
+    """Holds named metrics, one instance per (name, labels) combination."""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, _LabelKey], Histogram] = {}
+        self._counters: Dict[Tuple[str, _LabelKey], Counter] = {}
+        self._gauges: Dict[Tuple[str, _LabelKey], Gauge] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def describe(self, name: str, help_text: str):
+        """Set the HELP text rendered for a metric name."""
+        self._help[name] = help_text
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        """Get or create a counter for a name and label set."""
+        key = (name, tuple(sorted(labels.items())))
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = Counter()
+        return counter
+
+    def gauge(self, name: str, **labels: str) -> Gauge:
+        """Get or create a gauge for a name and label set."""
+        key = (name, tuple(sorted(labels.items())))
+        gauge = self._gauges.get(key)
+        if gauge is None:
+            gauge = self._gauges[key] = Gauge()
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """Get or create a histogram for a name and label set."""
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(buckets)
+        return histogram
+
+    def register_collector(self, collector: Callable[[], None]):
+        """Register a callback that updates gauges just before each scrape."""
+        self._collectors.append(collector)
+
+    def histogram_snapshots(self, name: str) -> Dict[str, Dict[str, float]]:
+        """Snapshots of every label set recorded for a histogram name."""
+        snapshots = {}
+        for (metric_name, label_key), histogram in self._histograms.items():
+            if metric_name != name:
+                continue
+            label_text = ",".join(f"{k}={v}" for k, v in label_key) or "all"
+            snapshots[label_text] = histogram.snapshot()
+        return snapshots
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        for collector in self._collectors:
+            collector()
+
+        lines: List[str] = []
+        for metric_type, metrics in (
+            ("counter", self._counters),
+            ("gauge", self._gauges),
+        ):
+            for name, series in _group_by_name(metrics).items():
+                self._render_header(lines, name, metric_type)
+                for label_key, metric in series:
+                    lines.append(f"{name}{_format_labels(label_key)} {_format_value(metric.value)}")
+
+        for name, series in _group_by_name(self._histograms).items():
+            self._render_header(lines, name, "histogram")
+            for label_key, histogram in series:
+                cumulative = 0
+                for bound, bucket_count in zip(
+                    histogram.buckets + (math.inf,), histogram.bucket_counts
+                ):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels(label_key + (("le", _format_value(bound)),))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                labels = _format_labels(label_key)
+                lines.append(f"{name}_sum{labels} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def _render_header(self, lines: List[str], name: str, metric_type: str):
+        help_text = self._help.get(name)
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+
+def _group_by_name(metrics: Dict[Tuple[str, _LabelKey], object]) -> Dict[str, list]:
+    grouped: Dict[str, list] = {}
+    for (name, label_key), metric in sorted(metrics.items(), key=lambda item: item[0]):
+        grouped.setdefault(name, []).append((label_key, metric))
+    return grouped
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_key: _LabelKey) -> str:
+    if not label_key:
+        return ""
+    pairs = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in label_key)
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+# Global registry
+registry = MetricsRegistry()
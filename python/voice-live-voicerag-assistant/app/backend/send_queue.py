@@ -0,0 +1,198 @@
+"""
+Outbound send queue for frontend WebSocket connections
+Each client gets a bounded queue drained by its own writer task, so a slow
+browser never stalls the VoiceLive event loop or other clients.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Union
+
+from fastapi import WebSocket
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MESSAGES = 200
+
+registry.describe("send_queue_audio_dropped_total", "Audio messages dropped on queue overflow")
+registry.describe("send_queue_audio_flushed_total", "Queued audio messages discarded on barge-in")
+_DROPPED_AUDIO = registry.counter("send_queue_audio_dropped_total")
+_FLUSHED_AUDIO = registry.counter("send_queue_audio_flushed_total")
+
+# Queue entries are (is_audio, payload); payload is a JSON-able dict or raw bytes
+_Entry = Tuple[bool, Union[Dict[str, Any], bytes]]
+
+
+def _audio_size(payload: Union[Dict[str, Any], bytes]) -> int:
+    """Size of a queued audio message (binary frame or base64 text)."""
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    return len(payload.get("data", ""))
+
+
+class ClientSendQueue:
+    """
+    Bounded outbound queue with a dedicated writer coroutine for one client.
+
+    Overflow policy:
+    - Audio is droppable: when the queue is full the oldest queued audio is
+      discarded first, and new audio is dropped if no queued audio is left.
+    - Control events are never dropped: they evict queued audio to make room,
+      and may exceed the bound if the queue holds control events only.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        websocket: WebSocket,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        on_error: Optional[Callable[[str], Awaitable[None]]] = None,
+    ):
+        self.client_id = client_id
+        self.websocket = websocket
+        self.max_messages = max(1, max_messages)
+        self.on_error = on_error
+
+        self._queue: Deque[_Entry] = deque()
+        self._audio_count = 0
+        self._audio_bytes = 0
+        self._wakeup = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._on_next_audio_sent: Optional[Callable[[], None]] = None
+
+        # Counters exposed per client
+        self.sent_messages = 0
+        self.dropped_audio = 0
+        self.flushed_audio = 0
+        self.high_water_mark = 0
+
+    def start(self):
+        """Start the writer task."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(
+                self._writer(), name=f"send-queue-{self.client_id}"
+            )
+
+    def put_control(self, message: Dict[str, Any]):
+        """Queue a control event (never dropped)."""
+        if self._closed:
+            return
+        if len(self._queue) >= self.max_messages:
+            self._drop_oldest_audio()
+        self._append((False, message))
+
+    def put_audio(self, payload: Union[Dict[str, Any], bytes]):
+        """Queue an audio message (JSON dict or binary frame), dropping stale audio on overflow."""
+        if self._closed:
+            return
+        if len(self._queue) >= self.max_messages and not self._drop_oldest_audio():
+            # Queue is full of control events; drop the new audio instead
+            self.dropped_audio += 1
+            _DROPPED_AUDIO.inc()
+            return
+        self._audio_count += 1
+        self._audio_bytes += _audio_size(payload)
+        self._append((True, payload))
+
+    def flush_audio(self) -> int:
+        """Discard all queued audio (e.g. on barge-in). Returns the number of messages removed."""
+        if not self._audio_count:
+            return 0
+        flushed = self._audio_count
+        self._queue = deque(entry for entry in self._queue if not entry[0])
+        self._audio_count = 0
+        self._audio_bytes = 0
+        self.flushed_audio += flushed
+        _FLUSHED_AUDIO.inc(flushed)
+        return flushed
+
+    def notify_next_audio_sent(self, callback: Callable[[], None]):
+        """Call ``callback`` once, right after the next audio message is written to the socket."""
+        self._on_next_audio_sent = callback
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and drop counters for this client."""
+        return {
+            "depth": len(self._queue),
+            "audio_depth": self._audio_count,
+            "audio_bytes": self._audio_bytes,
+            "max_messages": self.max_messages,
+            "high_water_mark": self.high_water_mark,
+            "sent_messages": self.sent_messages,
+            "dropped_audio": self.dropped_audio,
+            "flushed_audio": self.flushed_audio,
+        }
+
+    async def close(self):
+        """Stop the writer task and discard anything still queued."""
+        self._closed = True
+        self._queue.clear()
+        self._audio_count = 0
+        self._audio_bytes = 0
+        self._wakeup.set()
+
+        task = self._writer_task
+        self._writer_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def _append(self, entry: _Entry):
+        self._queue.append(entry)
+        if len(self._queue) > self.high_water_mark:
+            self.high_water_mark = len(self._queue)
+        self._wakeup.set()
+
+    def _drop_oldest_audio(self) -> bool:
+        """Remove the oldest queued audio message. Returns False if there is none."""
+        if not self._audio_count:
+            return False
+        for index, (is_audio, payload) in enumerate(self._queue):
+            if is_audio:
+                del self._queue[index]
+                self._audio_count -= 1
+                self._audio_bytes -= _audio_size(payload)
+                self.dropped_audio += 1
+                _DROPPED_AUDIO.inc()
+                return True
+        return False
+
+    async def _writer(self):
+        """Drain the queue to the WebSocket."""
+        try:
+            while not self._closed:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                is_audio, payload = self._queue.popleft()
+                if is_audio:
+                    self._audio_count -= 1
+                    self._audio_bytes -= _audio_size(payload)
+
+                if isinstance(payload, (bytes, bytearray)):
+                    await self.websocket.send_bytes(payload)
+                else:
+                    await self.websocket.send_text(json.dumps(payload))
+                self.sent_messages += 1
+
+                if is_audio and self._on_next_audio_sent is not None:
+                    callback, self._on_next_audio_sent = self._on_next_audio_sent, None
+                    callback()
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to {self.client_id}: {e}")
+            self._closed = True
+            if self.on_error:
+                await self.on_error(self.client_id)
@@ -0,0 +1,307 @@
+"""
+Session registry for multi-worker deployments
+Records which worker process owns each client session, carries control
+messages to the owning worker and publishes per-worker capacity.
+
+Backends (SESSION_REGISTRY):
+    memory  single process (default)
+    sqlite  shared SQLite file for several uvicorn workers on one host
+            (SESSION_REGISTRY_PATH), a stand-in for Redis in local testing
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Workers that have not sent a heartbeat for this long are considered gone
+WORKER_TTL_SECONDS = 15.0
+HEARTBEAT_INTERVAL_SECONDS = 5.0
+
+ControlMessage = Tuple[str, Dict[str, Any]]
+
+
+def default_worker_id() -> str:
+    """Identity of this worker process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class SessionRegistry(ABC):
+    """
+    Interface shared by the registry backends.
+
+    All methods are coroutines so backends backed by I/O fit behind it.
+    """
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or default_worker_id()
+
+    @abstractmethod
+    async def start(self, capacity: int):
+        """Register this worker."""
+
+    @abstractmethod
+    async def stop(self):
+        """Remove this worker and its sessions."""
+
+    @abstractmethod
+    async def register_session(self, client_id: str) -> Optional[str]:
+        """
+        Claim a session for this worker.
+
+        Returns:
+            Worker that owned the session before, if it was another live worker
+        """
+
+    @abstractmethod
+    async def unregister_session(self, client_id: str):
+        """Release a session, unless another worker has taken it over."""
+
+    @abstractmethod
+    async def get_owner(self, client_id: str) -> Optional[str]:
+        """Worker currently owning a session."""
+
+    @abstractmethod
+    async def send_control(self, worker_id: str, client_id: str, message: Dict[str, Any]):
+        """Queue a control message for the worker owning a session."""
+
+    @abstractmethod
+    async def receive_control(self, timeout_s: float) -> List[ControlMessage]:
+        """Wait up to timeout_s for control messages addressed to this worker."""
+
+    @abstractmethod
+    async def report_capacity(self, active_sessions: int, capacity: int):
+        """Publish this worker's load (also serves as its heartbeat)."""
+
+    @abstractmethod
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        """Live workers and their capacity."""
+
+
+class InMemorySessionRegistry(SessionRegistry):
+    """Registry for a single worker process."""
+
+    def __init__(self, worker_id: Optional[str] = None):
+        super().__init__(worker_id)
+        self._sessions: Dict[str, str] = {}
+        self._control: asyncio.Queue = asyncio.Queue()
+        self._worker: Dict[str, Any] = {}
+
+    async def start(self, capacity: int):
+        await self.report_capacity(0, capacity)
+
+    async def stop(self):
+        self._sessions.clear()
+
+    async def register_session(self, client_id: str) -> Optional[str]:
+        previous = self._sessions.get(client_id)
+        self._sessions[client_id] = self.worker_id
+        return previous if previous != self.worker_id else None
+
+    async def unregister_session(self, client_id: str):
+        if self._sessions.get(client_id) == self.worker_id:
+            del self._sessions[client_id]
+
+    async def get_owner(self, client_id: str) -> Optional[str]:
+        return self._sessions.get(client_id)
+
+    async def send_control(self, worker_id: str, client_id: str, message: Dict[str, Any]):
+        self._control.put_nowait((client_id, message))
+
+    async def receive_control(self, timeout_s: float) -> List[ControlMessage]:
+        try:
+            first = await asyncio.wait_for(self._control.get(), timeout_s)
+        except asyncio.TimeoutError:
+            return []
+        messages = [first]
+        while not self._control.empty():
+            messages.append(self._control.get_nowait())
+        return messages
+
+    async def report_capacity(self, active_sessions: int, capacity: int):
+        self._worker = {
+            "worker_id": self.worker_id,
+            "pid": os.getpid(),
+            "active_sessions": active_sessions,
+            "capacity": capacity,
+            "heartbeat": time.time(),
+        }
+
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        return [dict(self._worker)] if self._worker else []
+
+
+class SqliteSessionRegistry(SessionRegistry):
+    """
+    Registry in a SQLite file shared by the workers on one host.
+
+    Blocking sqlite calls run in a thread. Control messages are delivered by
+    polling, so cross-worker control latency is up to poll_interval_s.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        worker_id: Optional[str] = None,
+        poll_interval_s: float = 0.1,
+    ):
+        super().__init__(worker_id)
+        self.path = path
+        self.poll_interval_s = poll_interval_s
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS workers (
+                    worker_id TEXT PRIMARY KEY,
+                    pid INTEGER,
+                    active_sessions INTEGER,
+                    capacity INTEGER,
+                    heartbeat REAL
+                );
+                CREATE TABLE IF NOT EXISTS sessions (
+                    client_id TEXT PRIMARY KEY,
+                    worker_id TEXT NOT NULL,
+                    created_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS control_messages (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    worker_id TEXT NOT NULL,
+                    client_id TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    created_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS control_by_worker
+                    ON control_messages (worker_id, id);
+                """
+            )
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def _run(self, sql: str, params: tuple = ()) -> List[tuple]:
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    async def start(self, capacity: int):
+        await self.report_capacity(0, capacity)
+
+    async def stop(self):
+        await asyncio.to_thread(self._remove_worker)
+        self._conn.close()
+
+    def _remove_worker(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE worker_id = ?", (self.worker_id,))
+            self._conn.execute(
+                "DELETE FROM control_messages WHERE worker_id = ?", (self.worker_id,)
+            )
+            self._conn.execute("DELETE FROM workers WHERE worker_id = ?", (self.worker_id,))
+
+    async def register_session(self, client_id: str) -> Optional[str]:
+        return await asyncio.to_thread(self._claim, client_id)
+
+    def _claim(self, client_id: str) -> Optional[str]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT s.worker_id FROM sessions s JOIN workers w USING (worker_id) "
+                "WHERE s.client_id = ? AND w.heartbeat > ?",
+                (client_id, time.time() - WORKER_TTL_SECONDS),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (client_id, worker_id, created_at) "
+                "VALUES (?, ?, ?)",
+                (client_id, self.worker_id, time.time()),
+            )
+        previous = row[0] if row else None
+        return previous if previous != self.worker_id else None
+
+    async def unregister_session(self, client_id: str):
+        await self._run(
+            "DELETE FROM sessions WHERE client_id = ? AND worker_id = ?",
+            (client_id, self.worker_id),
+        )
+
+    async def get_owner(self, client_id: str) -> Optional[str]:
+        rows = await self._run(
+            "SELECT s.worker_id FROM sessions s JOIN workers w USING (worker_id) "
+            "WHERE s.client_id = ? AND w.heartbeat > ?",
+            (client_id, time.time() - WORKER_TTL_SECONDS),
+        )
+        return rows[0][0] if rows else None
+
+    async def send_control(self, worker_id: str, client_id: str, message: Dict[str, Any]):
+        await self._run(
+            "INSERT INTO control_messages (worker_id, client_id, message, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (worker_id, client_id, json.dumps(message), time.time()),
+        )
+
+    async def receive_control(self, timeout_s: float) -> List[ControlMessage]:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            messages = await asyncio.to_thread(self._take_control)
+            if messages or time.monotonic() >= deadline:
+                return messages
+            await asyncio.sleep(self.poll_interval_s)
+
+    def _take_control(self) -> List[ControlMessage]:
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, client_id, message FROM control_messages "
+                "WHERE worker_id = ? ORDER BY id",
+                (self.worker_id,),
+            ).fetchall()
+            if rows:
+                self._conn.execute(
+                    "DELETE FROM control_messages WHERE worker_id = ? AND id <= ?",
+                    (self.worker_id, rows[-1][0]),
+                )
+        return [(client_id, json.loads(message)) for _id, client_id, message in rows]
+
+    async def report_capacity(self, active_sessions: int, capacity: int):
+        await self._run(
+            "INSERT OR REPLACE INTO workers "
+            "(worker_id, pid, active_sessions, capacity, heartbeat) VALUES (?, ?, ?, ?, ?)",
+            (self.worker_id, os.getpid(), active_sessions, capacity, time.time()),
+        )
+
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        rows = await self._run(
+            "SELECT worker_id, pid, active_sessions, capacity, heartbeat FROM workers "
+            "WHERE heartbeat > ? ORDER BY worker_id",
+            (time.time() - WORKER_TTL_SECONDS,),
+        )
+        return [
+            {
+                "worker_id": worker_id,
+                "pid": pid,
+                "active_sessions": active_sessions,
+                "capacity": capacity,
+                "heartbeat": heartbeat,
+            }
+            for worker_id, pid, active_sessions, capacity, heartbeat in rows
+        ]
+
+
+def create_session_registry() -> SessionRegistry:
+    """Build the registry selected by SESSION_REGISTRY (memory or sqlite)."""
+    backend = os.getenv("SESSION_REGISTRY", "memory").lower()
+    if backend == "sqlite":
+        path = os.getenv("SESSION_REGISTRY_PATH", "/tmp/voicerag_sessions.db")
+        logger.info(f"Using SQLite session registry at {path}")
+        return SqliteSessionRegistry(path)
+    if backend != "memory":
+        logger.warning(f"Unknown SESSION_REGISTRY '{backend}', using in-memory registry")
+    return InMemorySessionRegistry()
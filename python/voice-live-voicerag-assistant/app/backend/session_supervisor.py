@@ -0,0 +1,211 @@
+"""
+Supervisor for background voice sessions
+Owns the voice_client.run() tasks: one session per client_id, prior sessions
+are cancelled and awaited before a replacement starts, idle sessions are
+closed, and every exit path ends the task so its VoiceLive socket is closed.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Why a session ended
+REASON_STOPPED = "stopped"
+REASON_REPLACED = "replaced"
+REASON_DISCONNECTED = "disconnected"
+REASON_IDLE = "idle_timeout"
+REASON_SHUTDOWN = "shutdown"
+REASON_FINISHED = "finished"
+REASON_FAILED = "failed"
+
+registry.describe("voice_sessions_started_total", "Voice sessions started by the supervisor")
+registry.describe("voice_sessions_ended_total", "Voice sessions ended, by reason")
+registry.describe("voicelive_connections_open", "VoiceLive connections currently open")
+
+# Called when a session ends: (client_id, voice_client, reason, exception)
+ExitCallback = Callable[[str, Any, str, Optional[BaseException]], Awaitable[None]]
+
+
+class SupervisedSession:
+    """A running voice client and its task."""
+
+    def __init__(self, client_id: str, voice_client, task: asyncio.Task):
+        self.client_id = client_id
+        self.voice_client = voice_client
+        self.task = task
+        self.started_at = time.monotonic()
+        self.stop_reason: Optional[str] = None
+
+    @property
+    def idle_seconds(self) -> float:
+        last_input = getattr(self.voice_client, "last_input_at", None) or self.started_at
+        return time.monotonic() - last_input
+
+
+class SessionSupervisor:
+    """
+    Keeps track of voice sessions and their lifetime.
+
+    Args:
+        idle_timeout_s: Close sessions without client input for this long (0 disables)
+        stop_timeout_s: How long to wait for a cancelled session to shut down
+        on_exit: Coroutine called once per session after its task has ended
+            (awaited by stop() for sessions it ends)
+    """
+
+    def __init__(
+        self,
+        idle_timeout_s: float = 300.0,
+        stop_timeout_s: float = 5.0,
+        on_exit: Optional[ExitCallback] = None,
+    ):
+        self.idle_timeout_s = idle_timeout_s
+        self.stop_timeout_s = stop_timeout_s
+        self.on_exit = on_exit
+
+        self._sessions: Dict[str, SupervisedSession] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._started_total = registry.counter("voice_sessions_started_total")
+        registry.register_collector(self._collect_metrics)
+
+    def __contains__(self, client_id: str) -> bool:
+        return client_id in self._sessions
+
+    async def start(self, client_id: str, voice_client) -> SupervisedSession:
+        """
+        Run a voice client as the only session for client_id.
+
+        A session already running for the client is cancelled and awaited first,
+        so its VoiceLive connection is closed before the new one opens.
+        """
+        await self.stop(client_id, REASON_REPLACED)
+
+        task = asyncio.create_task(voice_client.run(), name=f"voice-session-{client_id}")
+        session = SupervisedSession(client_id, voice_client, task)
+        self._sessions[client_id] = session
+        self._started_total.inc()
+        task.add_done_callback(lambda t, s=session: self._on_task_done(s))
+        return session
+
+    async def stop(self, client_id: str, reason: str = REASON_STOPPED) -> bool:
+        """
+        Cancel a client's session and wait for it to finish.
+
+        Returns:
+            True if a session was running
+        """
+        session = self._sessions.pop(client_id, None)
+        if session is None:
+            return False
+
+        session.stop_reason = reason
+        task = session.task
+        if not task.done():
+            task.cancel()
+            try:
+                await asyncio.wait_for(asyncio.shield(task), self.stop_timeout_s)
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Session {client_id} did not stop within {self.stop_timeout_s}s"
+                )
+            except asyncio.CancelledError:
+                if not task.done():
+                    # Our caller was cancelled, not the session task
+                    raise
+            except Exception:
+                pass  # Reported by _on_task_done
+
+        exception = None
+        if task.done() and not task.cancelled():
+            exception = task.exception()
+        await self._run_exit_callback(session, reason, exception)
+        return True
+
+    async def stop_all(self, reason: str = REASON_SHUTDOWN):
+        """Stop every session (used on shutdown)."""
+        await asyncio.gather(
+            *(self.stop(client_id, reason) for client_id in list(self._sessions)),
+            return_exceptions=True,
+        )
+
+    def start_reaper(self, interval_s: float = 10.0):
+        """Start the background task closing idle sessions."""
+        if self._reaper_task is None and self.idle_timeout_s > 0:
+            self._reaper_task = asyncio.create_task(self._reap_idle(interval_s))
+
+    async def shutdown(self):
+        """Stop the reaper and all sessions."""
+        if self._reaper_task:
+            self._reaper_task.cancel()
+            await asyncio.gather(self._reaper_task, return_exceptions=True)
+            self._reaper_task = None
+        await self.stop_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "open_voicelive_connections": self._open_connections(),
+            "idle_timeout_seconds": self.idle_timeout_s,
+            "oldest_session_seconds": round(
+                max((time.monotonic() - s.started_at for s in self._sessions.values()), default=0.0),
+                1,
+            ),
+        }
+
+    async def _reap_idle(self, interval_s: float):
+        while True:
+            await asyncio.sleep(interval_s)
+            for client_id, session in list(self._sessions.items()):
+                if session.idle_seconds >= self.idle_timeout_s:
+                    logger.info(
+                        f"Closing idle session {client_id} "
+                        f"({session.idle_seconds:.0f}s without input)"
+                    )
+                    try:
+                        await self.stop(client_id, REASON_IDLE)
+                    except Exception as e:
+                        logger.error(f"Error closing idle session {client_id}: {e}")
+
+    def _on_task_done(self, session: SupervisedSession):
+        task = session.task
+        exception = None if task.cancelled() else task.exception()
+        if self._sessions.get(session.client_id) is session:
+            # Ended on its own (VoiceLive closed the connection or run() failed)
+            del self._sessions[session.client_id]
+        reason = session.stop_reason or (REASON_FAILED if exception else REASON_FINISHED)
+        registry.counter("voice_sessions_ended_total", reason=reason).inc()
+
+        if exception is not None:
+            logger.error(f"Voice session {session.client_id} failed: {exception}")
+        else:
+            logger.info(f"Voice session {session.client_id} ended ({reason})")
+
+        if session.stop_reason is None:
+            # stop() runs the exit callback itself for sessions it ends
+            asyncio.create_task(
+                self._run_exit_callback(session, reason, exception),
+                name=f"voice-session-exit-{session.client_id}",
+            )
+
+    async def _run_exit_callback(
+        self, session: SupervisedSession, reason: str, exception: Optional[BaseException]
+    ):
+        if not self.on_exit:
+            return
+        try:
+            await self.on_exit(session.client_id, session.voice_client, reason, exception)
+        except Exception as e:
+            logger.error(f"Error in session exit handler for {session.client_id}: {e}")
+
+    def _open_connections(self) -> int:
+        return sum(
+            1 for s in self._sessions.values() if getattr(s.voice_client, "connection", None)
+        )
+
+    def _collect_metrics(self):
+        registry.gauge("voicelive_connections_open").set(self._open_connections())
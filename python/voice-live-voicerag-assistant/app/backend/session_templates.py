@@ -0,0 +1,247 @@
+"""
+Session templates for the Voice Assistant
+Builds the VoiceLive session configuration once per distinct configuration
+(model, voice, transcribe model, instructions, tool set) and shares it across
+sessions, and caches shared/instructions.txt until the file changes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from azure.ai.voicelive.models import (
+    AudioInputTranscriptionOptions,
+    AzureSemanticDetection,
+    AzureSemanticVad,
+    AzureStandardVoice,
+    InputAudioFormat,
+    Modality,
+    OutputAudioFormat,
+    RequestSession,
+    ToolChoiceLiteral,
+)
+
+logger = logging.getLogger(__name__)
+
+# Realtime models do end-of-utterance detection themselves; only cascaded
+# pipelines accept AzureSemanticDetection
+REALTIME_MODELS = frozenset(("gpt-realtime", "gpt-realtime-mini", "phi4-mm-realtime"))
+
+INSTRUCTIONS_PATH = os.path.join(os.path.dirname(__file__), "shared", "instructions.txt")
+
+
+def build_session_config(
+    model: str, voice: str, transcribe_model: str, instructions: str, tools: Sequence[dict]
+) -> RequestSession:
+    """
+    Session configuration sent with session.update.
+
+    Args:
+        model: VoiceLive model (decides whether end-of-utterance detection is used)
+        voice: Azure standard voice name
+        transcribe_model: Model for input audio transcription
+        instructions: System instructions
+        tools: Tool definitions in API format
+
+    Returns:
+        The RequestSession for the session
+    """
+    if model not in REALTIME_MODELS:
+        turn_detection = AzureSemanticVad(
+            threshold=0.3,
+            prefix_padding_ms=300,
+            speech_duration_ms=80,
+            silence_duration_ms=500,
+            remove_filler_words=True,
+            interrupt_response=True,
+            end_of_utterance_detection=AzureSemanticDetection(
+                threshold_level="default",
+                timeout_ms=1000
+            )
+        )
+    else:
+        turn_detection = AzureSemanticVad(
+            threshold=0.3,
+            prefix_padding_ms=300,
+            speech_duration_ms=80,
+            silence_duration_ms=500,
+            remove_filler_words=True,
+            interrupt_response=True,
+        )
+
+    return RequestSession(
+        modalities=[Modality.TEXT, Modality.AUDIO],
+        instructions=instructions,
+        voice=AzureStandardVoice(name=voice, type="azure-standard"),
+        input_audio_format=InputAudioFormat.PCM16,
+        output_audio_format=OutputAudioFormat.PCM16,
+        input_audio_transcription=AudioInputTranscriptionOptions(
+            model=transcribe_model
+        ),
+        turn_detection=turn_detection,
+        tools=list(tools),
+        tool_choice=ToolChoiceLiteral.AUTO,
+        temperature=0.6,
+        max_response_output_tokens=4096,
+    )
+
+
+class SessionTemplate(NamedTuple):
+    """
+    Prebuilt session configuration shared by every session that uses it.
+
+    session_config must be treated as read-only.
+    """
+
+    model: str
+    session_config: RequestSession
+    key: str  # digest of model + full session configuration
+
+
+class SessionTemplateCache:
+    """
+    Session templates keyed by model, voice, transcribe model, instructions and tool set.
+
+    Args:
+        max_entries: Templates kept before the least recently used is dropped
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._templates: "OrderedDict[Tuple, SessionTemplate]" = OrderedDict()
+        # Tool tuples are shared per tool registry, so their digest is memoized
+        # by identity; the tuple is kept alongside so its id cannot be reused
+        self._tool_digests: Dict[int, Tuple[Sequence[dict], str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        model: str,
+        voice: str,
+        transcribe_model: str,
+        instructions: str,
+        tools: Sequence[dict],
+    ) -> SessionTemplate:
+        """Template for a configuration, built on first use."""
+        cache_key = (model, voice, transcribe_model, instructions, self._tools_digest(tools))
+        template = self._templates.get(cache_key)
+        if template is not None:
+            self._templates.move_to_end(cache_key)
+            self.hits += 1
+            return template
+
+        self.misses += 1
+        session_config = build_session_config(
+            model, voice, transcribe_model, instructions, tools
+        )
+        payload = json.dumps(
+            {"model": model, "session": session_config.as_dict()}, sort_keys=True, default=str
+        )
+        template = SessionTemplate(
+            model=model,
+            session_config=session_config,
+            key=hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        )
+        self._templates[cache_key] = template
+        if len(self._templates) > self.max_entries:
+            self._templates.popitem(last=False)
+        logger.info(f"Built session template {template.key} for {model} / {voice}")
+        return template
+
+    def clear(self):
+        self._templates.clear()
+        self._tool_digests.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"templates": len(self._templates), "hits": self.hits, "misses": self.misses}
+
+    def _tools_digest(self, tools: Sequence[dict]) -> str:
+        entry = self._tool_digests.get(id(tools))
+        if entry is not None and entry[0] is tools:
+            return entry[1]
+
+        digest = hashlib.sha256(
+            json.dumps(list(tools), sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        if len(self._tool_digests) >= self.max_entries:
+            self._tool_digests.clear()
+        self._tool_digests[id(tools)] = (tools, digest)
+        return digest
+
+
+class InstructionsFile:
+    """
+    Text file cached in memory and reloaded in the background when it changes.
+
+    The file is stat'ed and read in a worker thread (load() and the watcher
+    started by start()), so read() on the event loop only returns the cached
+    string.
+
+    Args:
+        path: File to read
+        check_interval_s: How often the watcher checks the file's mtime and size
+    """
+
+    def __init__(self, path: str, check_interval_s: float = 5.0):
+        self.path = path
+        self.check_interval_s = check_interval_s
+        self._text: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def read(self) -> str:
+        """Current file contents (the same str object until the file changes)."""
+        if self._text is None:
+            # Only before load() has run, e.g. outside the app lifespan
+            self._reload_if_changed()
+        return self._text
+
+    async def load(self):
+        """Read the file off the event loop (call once at startup)."""
+        await asyncio.to_thread(self._reload_if_changed)
+
+    def start(self):
+        """Start watching the file in the background."""
+        if self._task is None and self.check_interval_s > 0:
+            self._task = asyncio.create_task(self._watch(), name="instructions-watcher")
+
+    async def stop(self):
+        """Stop watching."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.check_interval_s)
+            try:
+                await asyncio.to_thread(self._reload_if_changed)
+            except OSError as e:
+                logger.error(f"Could not reload {self.path}, keeping current instructions: {e}")
+
+    def _reload_if_changed(self):
+        stat = os.stat(self.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            text = f.read()
+        if self._stamp is not None:
+            logger.info(f"Reloaded {self.path}")
+        # Published in one assignment each; readers on the loop see old or new text
+        self._text = text
+        self._stamp = stamp
+
+
+# Shared by all sessions
+session_templates = SessionTemplateCache()
+instructions_file = InstructionsFile(
+    INSTRUCTIONS_PATH, check_interval_s=float(os.getenv("INSTRUCTIONS_WATCH_INTERVAL", "5"))
+)
@@ -0,0 +1,81 @@
+"""
+Tool execution wrapper for the Voice Assistant
+Applies the per-tool timeout from tools_config.yaml and records latency.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from metrics import registry
+
+logger = logging.getLogger(__name__)
+
+TOOL_LATENCY_METRIC = "tool_execution_seconds"
+registry.describe(TOOL_LATENCY_METRIC, "Tool execution time, by tool and status")
+
+# Execution outcomes
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+STATUS_CANCELLED = "cancelled"
+
+
+def timeout_result(tool_name: str, timeout_seconds: float) -> Dict[str, Any]:
+    """Structured result returned to the model when a tool times out."""
+    return {
+        "error": "timeout",
+        "tool": tool_name,
+        "timeout_seconds": timeout_seconds,
+        "message": (
+            f"The {tool_name} tool did not respond within {timeout_seconds} seconds. "
+            "Let the user know the information is temporarily unavailable."
+        ),
+    }
+
+
+async def execute_tool(
+    tool_name: str,
+    func: Callable[[Any], Awaitable[Any]],
+    arguments: Any,
+    timeout_seconds: float,
+) -> Tuple[Any, str]:
+    """
+    Execute a tool implementation with a deadline.
+
+    On timeout the tool coroutine is cancelled (and awaited) and a structured
+    timeout result is returned instead of raising. Other exceptions propagate
+    to the caller.
+
+    Args:
+        tool_name: Name of the tool (used for metrics and the timeout result)
+        func: Async tool implementation
+        arguments: Arguments passed through to the implementation
+        timeout_seconds: Deadline for the call
+
+    Returns:
+        Tuple of (result, status) where status is "ok" or "timeout"
+    """
+    status = STATUS_ERROR
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(func(arguments), timeout=timeout_seconds)
+        status = STATUS_OK
+        return result, status
+    except asyncio.TimeoutError:
+        status = STATUS_TIMEOUT
+        logger.warning(f"Tool {tool_name} timed out after {timeout_seconds}s")
+        return timeout_result(tool_name, timeout_seconds), status
+    except asyncio.CancelledError:
+        status = STATUS_CANCELLED
+        raise
+    finally:
+        registry.histogram(TOOL_LATENCY_METRIC, tool=tool_name, status=status).observe(
+            time.perf_counter() - start
+        )
+
+
+def get_tool_latency_stats() -> Dict[str, Dict[str, float]]:
+    """Latency histogram snapshots per tool and status."""
+    return registry.histogram_snapshots(TOOL_LATENCY_METRIC)
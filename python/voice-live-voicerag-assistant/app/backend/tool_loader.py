@@ -5,14 +5,37 @@ Loads tool definitions and configurations from YAML files
 
 import os
 import yaml
+import asyncio
 import logging
 import importlib
-from typing import Dict, List, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Mapping, NamedTuple, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+class ToolConfigError(ValueError):
+    """Raised when a tool configuration fails validation."""
+
+
+class ToolRegistry(NamedTuple):
+    """
+    Immutable, precomputed view of the tool configuration.
+
+    Built once per configuration load and shared by every session, so
+    starting a session does no YAML walking or importing.
+    """
+
+    environment: str
+    config_path: str
+    api_tools: Tuple[Dict[str, Any], ...]
+    functions: Mapping[str, Callable]
+    timeouts: Mapping[str, float]
+    enabled: Mapping[str, bool]
+    environment_info: Mapping[str, Any]
+
+
 class ToolConfigLoader:
     """Loads and manages tool configurations from YAML files."""
 
@@ -26,10 +49,12 @@ class ToolConfigLoader:
         self.config_file = config_file
         self.config_path = Path(__file__).parent / "tools" / config_file
         self.config = {}
+        self.config_mtime: Optional[float] = None
         self.tools = []
         self.environment = os.getenv("ENVIRONMENT", "production")
 
         self._load_config()
+        self.registry = self._build_registry()
 
     def _load_config(self):
         """Load configuration from YAML file."""
@@ -38,8 +63,9 @@ class ToolConfigLoader:
                 logger.error(f"Tool config file not found: {self.config_path}")
                 return
 
+            self.config_mtime = self.config_path.stat().st_mtime
             with open(self.config_path, "r", encoding="utf-8") as file:
-                self.config = yaml.safe_load(file)
+                self.config = yaml.safe_load(file) or {}
                 logger.info(f"Loaded YAML configuration from {self.config_file}")
 
             # Override environment if specified in config
@@ -56,10 +82,95 @@ class ToolConfigLoader:
             logger.error(f"Error loading tool configuration: {e}")
             self.config = {}
 
+    @classmethod
+    def load_validated(cls, config_file: str = "tools_config.yaml") -> "ToolConfigLoader":
+        """
+        Load a configuration and fail loudly if it is not usable.
+
+        Used for reloads: unlike the constructor, which logs errors and falls
+        back to an empty configuration, this raises so the current registry
+        can stay in place.
+
+        Args:
+            config_file: Path to the YAML configuration file
+
+        Returns:
+            A fully built ToolConfigLoader
+
+        Raises:
+            ToolConfigError: If the file is missing, invalid, or an enabled
+                tool's implementation cannot be imported
+        """
+        loader = cls(config_file)
+        if not loader.config:
+            raise ToolConfigError(f"Could not load tool configuration from {loader.config_path}")
+
+        errors = cls.validate_config(loader.config)
+
+        # Every enabled tool must resolve to an implementation
+        for name, enabled in loader.registry.enabled.items():
+            if enabled and name not in loader.registry.functions:
+                errors.append(f"Tool '{name}': implementation could not be loaded")
+
+        if errors:
+            raise ToolConfigError("; ".join(errors))
+        return loader
+
+    @staticmethod
+    def validate_config(config: Dict[str, Any]) -> List[str]:
+        """
+        Validate the structure of a tool configuration.
+
+        Args:
+            config: Parsed YAML configuration
+
+        Returns:
+            List of validation errors (empty when valid)
+        """
+        if not isinstance(config, dict):
+            return ["Configuration must be a mapping"]
+
+        errors = []
+        tools = config.get("tools", [])
+        if not isinstance(tools, list):
+            return ["'tools' must be a list"]
+
+        seen = set()
+        for index, tool in enumerate(tools):
+            if not isinstance(tool, dict):
+                errors.append(f"Tool #{index}: must be a mapping")
+                continue
+
+            name = tool.get("name")
+            if not name:
+                errors.append(f"Tool #{index}: missing 'name'")
+            elif name in seen:
+                errors.append(f"Tool '{name}': duplicate name")
+            seen.add(name)
+
+            if not isinstance(tool.get("parameters", {}), dict):
+                errors.append(f"Tool '{name}': 'parameters' must be a mapping")
+
+            impl_config = tool.get("implementation") or {}
+            if not impl_config.get("module") or not impl_config.get("function"):
+                errors.append(f"Tool '{name}': implementation needs 'module' and 'function'")
+
+            timeout = tool.get("timeout_seconds")
+            if timeout is not None and (
+                not isinstance(timeout, (int, float)) or timeout <= 0
+            ):
+                errors.append(f"Tool '{name}': 'timeout_seconds' must be a positive number")
+
+        environments = config.get("environments", {})
+        if not isinstance(environments, dict):
+            errors.append("'environments' must be a mapping")
+
+        return errors
+
     def get_environment_config(self) -> Dict[str, Any]:
         """Get configuration for the current environment."""
         environments = self.config.get("environments", {})
-        env_config = environments.get(self.environment, {})
+        env_config = dict(environments.get(self.environment, {}))
 
         # Set defaults if not specified
         defaults = {
@@ -75,6 +186,54 @@ class ToolConfigLoader:
 
         return env_config
 
+    def _build_registry(self) -> ToolRegistry:
+        """Precompute tool definitions, implementations and timeouts."""
+        env_config = self.get_environment_config()
+        api_tools = tuple(self._load_tool_definitions())
+        functions = self._load_function_implementations()
+
+        tools = self.config.get("tools", [])
+        default_timeout = env_config.get("default_timeout_seconds", 10)
+        timeouts = {
+            tool.get("name"): tool.get("timeout_seconds") or default_timeout
+            for tool in tools
+        }
+        enabled = {
+            tool.get("name"): env_config.get("enable_all_tools", True)
+            and tool.get("enabled", True)
+            for tool in tools
+        }
+
+        environment_info = {
+            "environment": self.environment,
+            "config_file": str(self.config_path),
+            "tools_enabled": env_config.get("enable_all_tools", True),
+            "tool_count": len(api_tools),
+            "function_count": len(functions),
+            "log_function_calls": env_config.get("log_function_calls", False),
+            "debug_mode": env_config.get("debug_mode", False),
+            "default_timeout": default_timeout,
+        }
+
+        return ToolRegistry(
+            environment=self.environment,
+            config_path=str(self.config_path),
+            api_tools=api_tools,
+            functions=MappingProxyType(functions),
+            timeouts=MappingProxyType(timeouts),
+            enabled=MappingProxyType(enabled),
+            environment_info=MappingProxyType(environment_info),
+        )
+
+    def get_registry(self) -> ToolRegistry:
+        """
+        Get the precomputed tool registry shared by all sessions.
+
+        Returns:
+            ToolRegistry snapshot of the current configuration
+        """
+        return self.registry
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Get tool definitions for Azure VoiceLive API.
@@ -82,6 +241,10 @@ class ToolConfigLoader:
         Returns:
             List of tool definitions ready for the API
         """
+        return list(self.registry.api_tools)
+
+    def _load_tool_definitions(self) -> List[Dict[str, Any]]:
+        """Build API tool definitions from the YAML configuration."""
         tools = self.config.get("tools", [])
         env_config = self.get_environment_config()
 
@@ -110,11 +273,15 @@ class ToolConfigLoader:
 
     def get_function_implementations(self) -> Dict[str, Callable]:
         """
-        Get function implementations by importing them dynamically.
+        Get function implementations (imported once when the registry is built).
 
         Returns:
             Dictionary mapping function names to callable implementations
         """
+        return dict(self.registry.functions)
+
+    def _load_function_implementations(self) -> Dict[str, Callable]:
+        """Import function implementations dynamically."""
         tools = self.config.get("tools", [])
         env_config = self.get_environment_config()
 
@@ -185,15 +352,13 @@ class ToolConfigLoader:
         Returns:
             Timeout in seconds
         """
-        tool_config = self.get_tool_config(tool_name)
-        tool_timeout = tool_config.get("timeout_seconds")
+        tool_timeout = self.registry.timeouts.get(tool_name)
 
         if tool_timeout:
             return tool_timeout
 
         # Fall back to environment default
-        env_config = self.get_environment_config()
-        return env_config.get("default_timeout_seconds", 10)
+        return self.registry.environment_info.get("default_timeout", 10)
 
     def is_tool_enabled(self, tool_name: str) -> bool:
         """
@@ -205,12 +370,7 @@ class ToolConfigLoader:
         Returns:
             True if enabled, False otherwise
         """
-        env_config = self.get_environment_config()
-        if not env_config.get("enable_all_tools", True):
-            return False
-
-        tool_config = self.get_tool_config(tool_name)
-        return tool_config.get("enabled", True)
+        return self.registry.enabled.get(tool_name, False)
 
     def should_log_function_calls(self) -> bool:
         """Check if function calls should be logged."""
@@ -229,24 +389,23 @@ class ToolConfigLoader:
         Returns:
             Dictionary with environment information
         """
-        env_config = self.get_environment_config()
-        tools = self.get_tool_definitions()
-        functions = self.get_function_implementations()
-
-        return {
-            "environment": self.environment,
-            "config_file": str(self.config_path),
-            "tools_enabled": env_config.get("enable_all_tools", True),
-            "tool_count": len(tools),
-            "function_count": len(functions),
-            "log_function_calls": self.should_log_function_calls(),
-            "debug_mode": self.is_debug_mode(),
-            "default_timeout": env_config.get("default_timeout_seconds", 10),
-        }
+        return dict(self.registry.environment_info)
 
     def reload(self):
-        """Reload configuration from file."""
-        self._load_config()
+        """
+        Reload configuration from file.
+
+        The new configuration is validated and fully built before it replaces
+        the current one; on failure the current registry stays in place.
+
+        Raises:
+            ToolConfigError: If the new configuration is invalid
+        """
+        candidate = ToolConfigLoader.load_validated(self.config_file)
+        self.config = candidate.config
+        self.config_mtime = candidate.config_mtime
+        self.environment = candidate.environment
+        self.registry = candidate.registry
         logger.info("Tool configuration reloaded")
 
 
@@ -270,11 +429,97 @@ def get_tool_loader(config_file: str = "tools_config.yaml") -> ToolConfigLoader:
     return _tool_loader
 
 
-def reload_tools():
-    """Reload tool configuration."""
+def reload_tools() -> ToolRegistry:
+    """
+    Reload tool configuration and atomically swap in the new registry.
+
+    New sessions pick up the new registry; sessions already running keep the
+    snapshot they started with.
+
+    Returns:
+        The new ToolRegistry
+
+    Raises:
+        ToolConfigError: If the new configuration is invalid
+    """
     global _tool_loader
-    if _tool_loader is not None:
-        _tool_loader.reload()
-    else:
-        _tool_loader = ToolConfigLoader()
+    config_file = _tool_loader.config_file if _tool_loader else "tools_config.yaml"
+    _tool_loader = ToolConfigLoader.load_validated(config_file)
     logger.info("Tool configuration reloaded")
+    return _tool_loader.registry
+
+
+async def reload_tools_async() -> ToolRegistry:
+    """
+    Reload tool configuration without blocking the event loop.
+
+    YAML parsing, validation and imports run in a worker thread; the swap
+    itself happens on the event loop as a single assignment.
+
+    Returns:
+        The new ToolRegistry
+
+    Raises:
+        ToolConfigError: If the new configuration is invalid
+    """
+    global _tool_loader
+    config_file = _tool_loader.config_file if _tool_loader else "tools_config.yaml"
+    candidate = await asyncio.to_thread(ToolConfigLoader.load_validated, config_file)
+    _tool_loader = candidate
+    logger.info(
+        f"Tool configuration reloaded: {candidate.registry.environment_info['tool_count']} tools"
+    )
+    return candidate.registry
+
+
+class ToolConfigWatcher:
+    """Polls tools_config.yaml for changes and hot-reloads the registry."""
+
+    def __init__(self, interval_seconds: float = 5.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            interval_seconds: How often to check the file modification time
+        """
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start watching in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch(), name="tool-config-watcher")
+            logger.info(f"Watching tool configuration every {self.interval_seconds}s")
+
+    async def stop(self):
+        """Stop watching."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch(self):
+        loader = get_tool_loader()
+        last_mtime = loader.config_mtime
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                mtime = loader.config_path.stat().st_mtime
+            except OSError:
+                continue
+
+            if mtime == last_mtime:
+                continue
+            # Remember the attempt either way so a broken file is not retried in a loop
+            last_mtime = mtime
+
+            try:
+                await reload_tools_async()
+            except ToolConfigError as e:
+                logger.error(f"Tool configuration change rejected, keeping current tools: {e}")
+            except Exception as e:
+                logger.error(f"Error reloading tool configuration: {e}")
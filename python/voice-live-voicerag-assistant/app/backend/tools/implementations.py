@@ -13,6 +13,10 @@ from azure.identity import DefaultAzureCredential
 import logging
 import json
 
+from tools.result_assembler import SearchResultAssembler
+from tools.search_cache import AsyncSearchCache
+from tools.semantic_cache import AzureOpenAIEmbedder, SemanticCache, semantic_cache_available
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,103 @@ if azure_search_endpoint and azure_search_index:
         index_name=azure_search_index,
     )
 
+# Upper bound on the product search tool output (UTF-8 bytes, roughly 4 bytes per token)
+product_search_max_output_bytes = int(
+    os.getenv("PRODUCT_SEARCH_MAX_OUTPUT_BYTES", 6000)
+)
+
+# Result cache for product searches (set PRODUCT_SEARCH_CACHE_MAX_BYTES=0 to disable)
+product_search_cache = AsyncSearchCache(
+    max_bytes=int(os.getenv("PRODUCT_SEARCH_CACHE_MAX_BYTES", 4 * 1024 * 1024)),
+    ttl_seconds=float(os.getenv("PRODUCT_SEARCH_CACHE_TTL_SECONDS", 300)),
+    compute_timeout_seconds=float(os.getenv("PRODUCT_SEARCH_TIMEOUT_SECONDS", 30)),
+)
+
+# Optional semantic cache behind the exact-match cache (requires numpy)
+semantic_search_cache = None
+
+
+def configure_semantic_cache(
+    embedder,
+    dimensions: int = None,
+    threshold: float = None,
+    max_entries: int = None,
+):
+    """
+    Enable the semantic cache for product searches.
+
+    Args:
+        embedder: Async callable mapping text to a vector, such as
+            AzureOpenAIEmbedder
+        dimensions: Embedding size produced by the embedder; defaults to
+            embedder.dimensions
+        threshold: Cosine similarity needed for a cache hit; defaults to
+            SEMANTIC_CACHE_THRESHOLD, then to the embedder's default_threshold
+        max_entries: Maximum number of cached embeddings
+    """
+    global semantic_search_cache
+    if threshold is None:
+        threshold = os.getenv("SEMANTIC_CACHE_THRESHOLD") or getattr(
+            embedder, "default_threshold", None
+        )
+    if threshold is None:
+        raise ValueError(
+            "No similarity threshold for this embedder; pass threshold "
+            "or set SEMANTIC_CACHE_THRESHOLD"
+        )
+    semantic_search_cache = SemanticCache(
+        embedder=embedder,
+        dimensions=dimensions or embedder.dimensions,
+        threshold=float(threshold),
+        max_entries=max_entries or int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", 512)),
+        ttl_seconds=product_search_cache.ttl_seconds or 300,
+    )
+    return semantic_search_cache
+
+
+def _semantic_cache_embedder_from_env():
+    """The embedder named by SEMANTIC_CACHE_EMBEDDER, or None if it is not usable."""
+    name = os.getenv("SEMANTIC_CACHE_EMBEDDER", "").lower()
+    if name != "azure-openai":
+        logger.warning(
+            "SEMANTIC_CACHE_ENABLED is set but SEMANTIC_CACHE_EMBEDDER is not "
+            f"'azure-openai' (got '{name}'); the semantic cache stays disabled"
+        )
+        return None
+
+    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+    deployment = os.getenv("AZURE_OPENAI_EMBEDDING_NAME")
+    if not endpoint or not deployment:
+        logger.warning(
+            "SEMANTIC_CACHE_EMBEDDER=azure-openai needs AZURE_OPENAI_ENDPOINT and "
+            "AZURE_OPENAI_EMBEDDING_NAME; the semantic cache stays disabled"
+        )
+        return None
+
+    return AzureOpenAIEmbedder(
+        endpoint=endpoint,
+        deployment=deployment,
+        dimensions=int(os.getenv("AZURE_OPENAI_EMBEDDING_DIMENSIONS", 3072)),
+        timeout_seconds=float(os.getenv("SEMANTIC_CACHE_EMBED_TIMEOUT_SECONDS", 5)),
+    )
+
+
+if os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true":
+    if not semantic_cache_available():
+        logger.warning("SEMANTIC_CACHE_ENABLED is set but numpy is not installed")
+    else:
+        _embedder = _semantic_cache_embedder_from_env()
+        if _embedder is not None:
+            configure_semantic_cache(_embedder)
+
+
+async def close_semantic_cache():
+    """Release the semantic cache embedder's HTTP session, if it holds one."""
+    if semantic_search_cache is not None:
+        close = getattr(semantic_search_cache.embedder, "close", None)
+        if close is not None:
+            await close()
+
 
 async def get_user_information(args: dict) -> str:
     """Search the knowledge base user credit card due date and amount."""
@@ -69,6 +170,22 @@ async def get_product_information(args: dict) -> str:
         )
         return f"Unable to search for '{query}' - Azure Search service not configured."
 
+    return await product_search_cache.get_or_compute(
+        query, lambda: _lookup_product_information(query)
+    )
+
+
+async def _lookup_product_information(query: str) -> str:
+    """Answer from the semantic cache when enabled, otherwise search."""
+    if semantic_search_cache is None:
+        return await _search_product_information(query)
+    return await semantic_search_cache.get_or_compute(
+        query, lambda: _search_product_information(query)
+    )
+
+
+async def _search_product_information(query: str) -> str:
+    """Run the hybrid knowledge base search for a product query."""
     # Hybrid query using Azure AI Search with Semantic Ranker
     vector_queries = [
         VectorizableTextQuery(text=query, k_nearest_neighbors=50, fields="text_vector")
@@ -82,7 +199,24 @@ async def get_product_information(args: dict) -> str:
         vector_queries=vector_queries,
         select=", ".join(["chunk_id", "chunk"]),
     )
-    result = ""
+    # Results arrive in rank order; stop pulling pages once the budget is met
+    assembler = SearchResultAssembler(product_search_max_output_bytes)
     async for r in search_results:
-        result += f"[{r['chunk_id']}]: {r['chunk']}\n-----\n"
-    return result
+        if not assembler.add(r["chunk_id"], r["chunk"]):
+            break
+
+    if assembler.budget_exhausted:
+        logger.info(
+            f"Product search output truncated to {assembler.max_bytes} bytes "
+            f"({assembler.chunks_included} chunks included, "
+            f"{assembler.chunks_truncated} truncated, {assembler.chunks_dropped} dropped)"
+        )
+    return assembler.result()
+
+
+def get_search_cache_stats() -> dict:
+    """Hit/miss/eviction metrics for the product search caches."""
+    stats = product_search_cache.stats()
+    if semantic_search_cache is not None:
+        stats["semantic"] = semantic_search_cache.stats()
+    return stats
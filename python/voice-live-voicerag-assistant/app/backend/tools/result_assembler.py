@@ -0,0 +1,81 @@
+"""
+Budgeted assembly of search results into tool output
+Collects ranked chunks into a list and stops once the output budget is met,
+so the tool output stays small and no further result pages are fetched.
+"""
+
+from typing import List
+
+TRUNCATION_MARKER = " …[truncated]"
+
+# Don't bother including a partial chunk smaller than this
+MIN_PARTIAL_BYTES = 256
+
+SEPARATOR = "\n-----\n"
+
+
+class SearchResultAssembler:
+    """
+    Builds the tool output from chunks arriving in rank order.
+
+    Chunks are appended while they fit in ``max_bytes`` (UTF-8). The first
+    chunk that does not fit is truncated to the remaining room (if enough is
+    left), and it and all lower-ranked chunks after it are dropped.
+
+    chunks_dropped counts chunks offered but left out entirely: the
+    over-budget chunk when too little room is left for a partial, and any
+    chunk added after the budget was met. Results the caller never pulls are
+    not known here.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._parts: List[str] = []
+        self._size = 0
+        self.chunks_included = 0
+        self.chunks_truncated = 0
+        self.chunks_dropped = 0
+        self.budget_exhausted = False
+
+    def add(self, chunk_id: str, chunk: str) -> bool:
+        """
+        Add the next-ranked chunk.
+
+        Returns:
+            False once the budget is met and the caller should stop pulling results
+        """
+        if self.budget_exhausted:
+            self.chunks_dropped += 1
+            return False
+
+        entry = f"[{chunk_id}]: {chunk}{SEPARATOR}"
+        entry_size = len(entry.encode("utf-8"))
+        remaining = self.max_bytes - self._size
+
+        if entry_size <= remaining:
+            self._parts.append(entry)
+            self._size += entry_size
+            self.chunks_included += 1
+            if self._size == self.max_bytes:
+                self.budget_exhausted = True
+            return not self.budget_exhausted
+
+        # Over budget: keep what fits of this chunk, drop everything ranked lower
+        self.budget_exhausted = True
+        prefix = f"[{chunk_id}]: "
+        overhead = len((prefix + TRUNCATION_MARKER + SEPARATOR).encode("utf-8"))
+        room = remaining - overhead
+        if room >= MIN_PARTIAL_BYTES:
+            partial = chunk.encode("utf-8")[:room].decode("utf-8", errors="ignore")
+            entry = f"{prefix}{partial}{TRUNCATION_MARKER}{SEPARATOR}"
+            self._parts.append(entry)
+            self._size += len(entry.encode("utf-8"))
+            self.chunks_included += 1
+            self.chunks_truncated += 1
+        else:
+            self.chunks_dropped += 1
+        return False
+
+    def result(self) -> str:
+        """The assembled tool output."""
+        return "".join(self._parts)
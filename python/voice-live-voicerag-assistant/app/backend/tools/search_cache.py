@@ -0,0 +1,173 @@
+"""
+Async result cache for knowledge base searches
+TTL + LRU cache bounded in bytes, with coalescing of concurrent identical
+requests into a single in-flight search.
+"""
+
+import asyncio
+import re
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache lookups (case, punctuation, whitespace)."""
+    return " ".join(_PUNCTUATION.sub(" ", query.casefold()).split())
+
+
+def _sizeof(key: str, value: Any) -> int:
+    """Approximate memory cost of an entry in bytes."""
+    if isinstance(value, str):
+        value_size = len(value.encode("utf-8"))
+    elif isinstance(value, (bytes, bytearray)):
+        value_size = len(value)
+    else:
+        value_size = sys.getsizeof(value)
+    return value_size + len(key.encode("utf-8"))
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+
+
+class AsyncSearchCache:
+    """
+    TTL + LRU cache for async search results.
+
+    - Entries expire after ``ttl_seconds`` and the least recently used entries
+      are evicted once the total size exceeds ``max_bytes``.
+    - Concurrent misses for the same key share one in-flight computation; the
+      computation runs in its own task, so a cancelled caller (e.g. barge-in)
+      does not cancel the search for everyone else.
+    - The shared computation has its own deadline (``compute_timeout_seconds``),
+      so a hung search is abandoned instead of every later identical query
+      coalescing onto it.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 4 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        compute_timeout_seconds: float = 30.0,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.compute_timeout_seconds = compute_timeout_seconds
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.current_bytes = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.compute_timeouts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl_seconds > 0
+
+    async def get_or_compute(
+        self, query: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached result for a query, computing it on a miss.
+
+        Args:
+            query: Raw search query (normalized internally)
+            compute: Coroutine factory performing the actual search
+
+        Returns:
+            Cached or freshly computed result
+        """
+        if not self.enabled:
+            return await compute()
+
+        key = normalize_query(query)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            self._remove(key)
+            self.expirations += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._compute_with_deadline(compute))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_computed(key, t))
+
+        return await asyncio.shield(task)
+
+    def clear(self):
+        """Drop all cached entries (in-flight searches are left running)."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "compute_timeouts": self.compute_timeouts,
+            "inflight": len(self._inflight),
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else None,
+        }
+
+    async def _compute_with_deadline(self, compute: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.compute_timeout_seconds or self.compute_timeout_seconds <= 0:
+            return await compute()
+        try:
+            return await asyncio.wait_for(compute(), timeout=self.compute_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.compute_timeouts += 1
+            raise
+
+    def _on_computed(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            # Failures are not cached; the exception reaches the awaiting callers
+            return
+        self._store(key, task.result())
+
+    def _store(self, key: str, value: Any):
+        size = _sizeof(key, value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(value, time.monotonic() + self.ttl_seconds, size)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
@@ -0,0 +1,256 @@
+"""
+Semantic cache for knowledge base lookups
+Answers paraphrased questions from cache when the query embedding is close
+enough (cosine similarity) to one already searched.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+from azure.identity.aio import DefaultAzureCredential
+
+from tools.search_cache import normalize_query
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency: the semantic cache is disabled without it
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# An embedder maps text to a 1-D float vector (any length, normalized internally).
+# Embedders may define default_threshold, the cosine similarity that means
+# "same question" for that model.
+Embedder = Callable[[str], Awaitable[Any]]
+
+
+class HashingEmbedder:
+    """
+    Deterministic local embedder based on feature hashing of words and word pairs.
+
+    Needs no model or network access, which makes it suitable for offline
+    tests and benchmarks only. It measures word overlap, not meaning: two
+    long queries that differ only in a product name still score above 0.9,
+    so it is never used when the cache is enabled from the environment.
+    """
+
+    # Only near-identical wording counts as a match
+    default_threshold = 0.99
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+
+    async def __call__(self, text: str):
+        return self.embed(text)
+
+    def embed(self, text: str):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        words = normalize_query(text).split()
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+        return vector
+
+
+class AzureOpenAIEmbedder:
+    """
+    Embeds queries with an Azure OpenAI embedding deployment.
+
+    Authenticates with DefaultAzureCredential and reuses one HTTP session and
+    access token across calls. Requests are bounded by timeout_seconds so a
+    slow embedding call cannot hold up the search it is meant to save.
+    """
+
+    # Paraphrases of one question score above this with text-embedding-3 models
+    default_threshold = 0.95
+
+    TOKEN_SCOPE = "https://cognitiveservices.azure.com/.default"
+    API_VERSION = "2024-10-21"
+
+    def __init__(
+        self,
+        endpoint: str,
+        deployment: str,
+        dimensions: int,
+        timeout_seconds: float = 5.0,
+    ):
+        self.url = (
+            f"{endpoint.rstrip('/')}/openai/deployments/{deployment}/embeddings"
+            f"?api-version={self.API_VERSION}"
+        )
+        self.dimensions = dimensions
+        self.timeout_seconds = timeout_seconds
+        self._credential = DefaultAzureCredential()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token = None
+
+    async def __call__(self, text: str):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+            )
+        async with self._session.post(
+            self.url,
+            json={"input": text, "dimensions": self.dimensions},
+            headers={"Authorization": f"Bearer {await self._access_token()}"},
+        ) as response:
+            response.raise_for_status()
+            body = await response.json()
+        return body["data"][0]["embedding"]
+
+    async def _access_token(self) -> str:
+        # Refresh five minutes before expiry
+        if self._token is None or self._token.expires_on - 300 <= time.time():
+            self._token = await self._credential.get_token(self.TOKEN_SCOPE)
+        return self._token.token
+
+    async def close(self):
+        """Close the HTTP session and credential."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        await self._credential.close()
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache with LRU eviction.
+
+    Embeddings live in a preallocated NumPy matrix of unit vectors, so a lookup
+    is one matrix-vector product followed by an argmax (vectorized top-1 search).
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        dimensions: int,
+        threshold: float,
+        max_entries: int = 512,
+        ttl_seconds: float = 300.0,
+    ):
+        if np is None:
+            raise RuntimeError("The semantic cache requires numpy (pip install numpy)")
+
+        self.embedder = embedder
+        self.dimensions = dimensions
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._matrix = np.zeros((max_entries, dimensions), dtype=np.float32)
+        self._valid = np.zeros(max_entries, dtype=bool)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._expires_at = np.zeros(max_entries, dtype=np.float64)
+        self._values: List[Any] = [None] * max_entries
+        self._clock = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.embed_errors = 0
+        self.last_similarity: Optional[float] = None
+
+    async def get_or_compute(
+        self, query: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a cached result for a semantically similar query, or compute and store one.
+
+        Args:
+            query: Raw search query
+            compute: Coroutine factory performing the actual search
+
+        Returns:
+            Cached or freshly computed result
+        """
+        try:
+            vector = self._normalize(await self.embedder(query))
+        except Exception as e:
+            # The cache is optional: search without it rather than fail the call
+            self.embed_errors += 1
+            logger.warning(f"Semantic cache embedding failed, searching directly: {e}")
+            return await compute()
+
+        index = self._lookup(vector)
+        if index is not None:
+            self.hits += 1
+            return self._values[index]
+
+        self.misses += 1
+        result = await compute()
+        self._insert(vector, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": int(self._valid.sum()),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "embed_errors": self.embed_errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "last_similarity": self.last_similarity,
+        }
+
+    def _normalize(self, vector):
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dimensions:
+            raise ValueError(
+                f"Embedding has {vector.shape[0]} dimensions, expected {self.dimensions}"
+            )
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def _lookup(self, vector) -> Optional[int]:
+        """Vectorized top-1 cosine search over live entries."""
+        live = self._valid & (self._expires_at > time.monotonic())
+        if not live.any():
+            self.last_similarity = None
+            return None
+
+        similarities = self._matrix @ vector
+        similarities[~live] = -np.inf
+        index = int(np.argmax(similarities))
+        self.last_similarity = round(float(similarities[index]), 4)
+        if similarities[index] < self.threshold:
+            return None
+
+        self._last_used[index] = self._tick()
+        return index
+
+    def _insert(self, vector, value: Any):
+        now = time.monotonic()
+        free = np.flatnonzero(~self._valid | (self._expires_at <= now))
+        if free.size:
+            index = int(free[0])
+        else:
+            # Evict the least recently used entry
+            index = int(np.argmin(self._last_used))
+            self.evictions += 1
+
+        self._matrix[index] = vector
+        self._valid[index] = True
+        self._last_used[index] = self._tick()
+        self._expires_at[index] = now + self.ttl_seconds
+        self._values[index] = value
+
+
+def semantic_cache_available() -> bool:
+    """Whether numpy is installed so the semantic cache can be used."""
+    return np is not None
+
@@ -0,0 +1,156 @@
+"""
+Per-turn latency tracing for the Voice Assistant
+Follows one user turn from speech stopped to the end of the assistant's
+response, including tool calls, and exports it as a structured log event
+and aggregated histograms.
+"""
+
+import itertools
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from metrics import registry
+
+logger = logging.getLogger("turn_trace")
+
+TURN_STAGE_METRIC = "turn_stage_seconds"
+TURN_TOOL_METRIC = "turn_tool_seconds"
+registry.describe(TURN_STAGE_METRIC, "Time from user speech stopped to each turn stage")
+registry.describe(TURN_TOOL_METRIC, "Total tool execution time inside a turn")
+
+# Marks, in the order they normally happen
+SPEECH_STOPPED = "speech_stopped"
+RESPONSE_CREATED = "response_created"
+FIRST_DELTA_RECEIVED = "first_delta_received"
+FIRST_AUDIO_SENT = "first_audio_sent"
+RESPONSE_DONE = "response_done"
+
+STAGES = (RESPONSE_CREATED, FIRST_DELTA_RECEIVED, FIRST_AUDIO_SENT, RESPONSE_DONE)
+
+RECENT_TURNS = 50
+
+_turn_ids = itertools.count(1)
+
+
+class ToolSpan:
+    """One tool execution inside a turn."""
+
+    __slots__ = ("name", "call_id", "start", "end", "status")
+
+    def __init__(self, name: str, call_id: str, start: float):
+        self.name = name
+        self.call_id = call_id
+        self.start = start
+        self.end: Optional[float] = None
+        self.status: Optional[str] = None
+
+
+class TurnTrace:
+    """
+    Timeline of a single turn.
+
+    Each mark keeps its first occurrence only, so a tool-call turn with two
+    responses reports when the user first heard something.
+    """
+
+    def __init__(self, client_id: str):
+        self.turn_id = next(_turn_ids)
+        self.client_id = client_id
+        self.marks: Dict[str, float] = {SPEECH_STOPPED: time.perf_counter()}
+        self.tool_spans: List[ToolSpan] = []
+        self.finished = False
+
+    def mark(self, name: str):
+        """Record a stage the first time it happens."""
+        if not self.finished and name not in self.marks:
+            self.marks[name] = time.perf_counter()
+
+    def has(self, name: str) -> bool:
+        return name in self.marks
+
+    def tool_started(self, name: str, call_id: str) -> ToolSpan:
+        span = ToolSpan(name, call_id, time.perf_counter())
+        if not self.finished:
+            self.tool_spans.append(span)
+        return span
+
+    @staticmethod
+    def tool_finished(span: ToolSpan, status: str):
+        span.end = time.perf_counter()
+        span.status = status
+
+    def to_dict(self, status: str) -> Dict[str, Any]:
+        """Offsets in milliseconds relative to speech stopped."""
+        origin = self.marks[SPEECH_STOPPED]
+
+        def offset(t: Optional[float]) -> Optional[float]:
+            return round((t - origin) * 1000, 2) if t is not None else None
+
+        return {
+            "turn_id": self.turn_id,
+            "client_id": self.client_id,
+            "status": status,
+            "marks_ms": {name: offset(t) for name, t in self.marks.items()},
+            "tools": [
+                {
+                    "name": span.name,
+                    "call_id": span.call_id,
+                    "start_ms": offset(span.start),
+                    "end_ms": offset(span.end),
+                    "duration_ms": (
+                        round((span.end - span.start) * 1000, 2) if span.end else None
+                    ),
+                    "status": span.status,
+                }
+                for span in self.tool_spans
+            ],
+        }
+
+
+class TurnTraceRecorder:
+    """Aggregates finished turns into histograms and keeps the most recent ones."""
+
+    def __init__(self, max_recent: int = RECENT_TURNS):
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=max_recent)
+
+    def finish(self, trace: Optional[TurnTrace], status: str = "completed"):
+        """
+        Close a turn and export it.
+
+        Args:
+            trace: Turn to close (ignored if None or already finished)
+            status: completed, cancelled, superseded or closed
+        """
+        if trace is None or trace.finished:
+            return
+        trace.finished = True
+
+        origin = trace.marks[SPEECH_STOPPED]
+        for stage in STAGES:
+            t = trace.marks.get(stage)
+            if t is not None:
+                registry.histogram(TURN_STAGE_METRIC, stage=stage, status=status).observe(
+                    t - origin
+                )
+        tool_seconds = sum(span.end - span.start for span in trace.tool_spans if span.end)
+        if trace.tool_spans:
+            registry.histogram(TURN_TOOL_METRIC, status=status).observe(tool_seconds)
+
+        record = trace.to_dict(status)
+        self.recent.append(record)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", json.dumps(record))
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """Histogram snapshots per stage and status."""
+        return registry.histogram_snapshots(TURN_STAGE_METRIC)
+
+    def recent_turns(self) -> List[Dict[str, Any]]:
+        return list(self.recent)
+
+
+# Global recorder
+turn_recorder = TurnTraceRecorder()
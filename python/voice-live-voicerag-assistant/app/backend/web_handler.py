@@ -9,32 +9,73 @@ import json
 import logging
 import base64
 import os
-from typing import Dict, Any, Optional, Callable
+import time
+from contextlib import AsyncExitStack
+from typing import Dict, Any, Optional, Callable, Tuple
 from azure.core.credentials import AzureKeyCredential
 from azure.ai.voicelive.aio import connect
 from azure.ai.voicelive.models import (
     RequestSession,
     ServerEventType,
-    AzureStandardVoice,
-    Modality,
-    InputAudioFormat,
-    OutputAudioFormat,
     FunctionCallOutputItem,
     ItemType,
-    ToolChoiceLiteral,
     ResponseFunctionCallItem,
     ServerEventConversationItemCreated,
     ServerEventResponseFunctionCallArgumentsDone,
-    AudioInputTranscriptionOptions,
-    AzureSemanticVad,
-    AzureSemanticDetection,
     MessageItem,
     ResponseCreateParams,
 )
 from fastapi import WebSocket
 
+from connection_pool import VoiceLiveConnectionPool, WarmSessionSpec
+from session_templates import session_templates
+from send_queue import ClientSendQueue, DEFAULT_MAX_MESSAGES
+from event_demux import EventDemultiplexer
+from tool_executor import STATUS_CANCELLED, STATUS_ERROR, STATUS_TIMEOUT, execute_tool
+from log_utils import get_hot_path_logger
+from metrics import FAST_LATENCY_BUCKETS, Counter, Histogram, registry
+from turn_tracing import (
+    FIRST_AUDIO_SENT,
+    FIRST_DELTA_RECEIVED,
+    RESPONSE_CREATED,
+    RESPONSE_DONE,
+    TurnTrace,
+    turn_recorder,
+)
+
 # Set up logging
 logger = logging.getLogger(__name__)
+# Per-event messages go through a rate limiter
+hot_logger = get_hot_path_logger(__name__)
+
+registry.describe("voice_bridge_connections_total", "Frontend WebSocket connections accepted")
+registry.describe("voice_bridge_disconnections_total", "Frontend WebSocket connections closed")
+registry.describe("voice_bridge_active_connections", "Open frontend WebSocket connections")
+registry.describe("voice_sessions_active", "Active VoiceLive sessions")
+registry.describe("send_queue_depth", "Messages queued for all frontend clients")
+registry.describe("send_queue_depth_max", "Deepest per-client send queue")
+registry.describe("send_queue_audio_bytes", "Audio bytes queued for all frontend clients")
+registry.describe("voicelive_events_total", "VoiceLive server events handled, by type")
+registry.describe("voicelive_event_handler_seconds", "Time spent handling VoiceLive events, by type")
+
+_CONNECTIONS = registry.counter("voice_bridge_connections_total")
+_DISCONNECTIONS = registry.counter("voice_bridge_disconnections_total")
+
+# Per event type (counter, histogram), created on first sight of a type
+_event_metrics: Dict[str, Tuple[Counter, Histogram]] = {}
+
+
+def _metrics_for_event(event_type) -> Tuple[Counter, Histogram]:
+    metrics = _event_metrics.get(event_type)
+    if metrics is None:
+        label = str(event_type)
+        metrics = _event_metrics[event_type] = (
+            registry.counter("voicelive_events_total", type=label),
+            registry.histogram(
+                "voicelive_event_handler_seconds", FAST_LATENCY_BUCKETS, type=label
+            ),
+        )
+    return metrics
 
 
 class WebSocketAudioProcessor:
@@ -53,11 +94,14 @@ class WebSocketAudioProcessor:
         self.websocket_callback = callback
         logger.info("WebSocket callback set for audio streaming")
 
-    async def queue_audio(self, audio_data: bytes):
+    async def queue_audio(self, audio_data: bytes, response_id: Optional[str] = None):
         """Queue audio data for streaming to frontend."""
         if self.websocket_callback:
             try:
-                await self.websocket_callback(audio_data)
+                if response_id:
+                    await self.websocket_callback(audio_data, response_id=response_id)
+                else:
+                    await self.websocket_callback(audio_data)
             except Exception as e:
                 logger.error(f"Error streaming audio via WebSocket: {e}")
         else:
@@ -67,7 +111,8 @@ class WebSocketAudioProcessor:
         """Process audio input received from frontend."""
         try:
             await connection.input_audio_buffer.append(audio=audio_base64)
-            logger.debug("Audio input processed from frontend")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Audio input processed from frontend")
         except Exception as e:
             logger.error(f"Error processing input audio: {e}")
 
@@ -97,23 +142,52 @@ class WebSocketAudioProcessor:
                 logger.error(f"Error stopping playback: {e}")
         logger.info("Audio playback stopped")
 
+class ToolCallBatch:
+    """Tool calls issued by one VoiceLive response."""
+
+    def __init__(self):
+        self.pending: set = set()
+        self.outputs_posted = 0
+        self.response_done = False
+
+
 class VoiceAssistantBridge:
     """Bridge between frontend WebSocket and Azure VoiceLive API"""
 
-    def __init__(self):
+    def __init__(self, max_queued_messages: Optional[int] = None):
         self.active_connections: Dict[str, WebSocket] = {}
         self.voice_clients: Dict[str, WebSocketVoiceClient] = {}
+        self.send_queues: Dict[str, ClientSendQueue] = {}
+        self.max_queued_messages = max_queued_messages or int(
+            os.getenv("CLIENT_SEND_QUEUE_MAX_MESSAGES", DEFAULT_MAX_MESSAGES)
+        )
+        registry.register_collector(self._collect_metrics)
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """Accept a new WebSocket connection"""
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        _CONNECTIONS.inc()
+
+        # Each client gets its own bounded queue and writer task
+        send_queue = ClientSendQueue(
+            client_id,
+            websocket,
+            max_messages=self.max_queued_messages,
+            on_error=self.disconnect,
+        )
+        self.send_queues[client_id] = send_queue
+        send_queue.start()
         logger.info(f"Client {client_id} connected")
 
     async def disconnect(self, client_id: str):
         """Handle WebSocket disconnection"""
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            _DISCONNECTIONS.inc()
+        send_queue = self.send_queues.pop(client_id, None)
+        if send_queue:
+            await send_queue.close()
         if client_id in self.voice_clients:
             # Cleanup voice client
             voice_client = self.voice_clients[client_id]
@@ -122,14 +196,52 @@ class VoiceAssistantBridge:
         logger.info(f"Client {client_id} disconnected")
 
     async def send_message(self, client_id: str, message: dict):
-        """Send message to specific client"""
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message to {client_id}: {e}")
-                await self.disconnect(client_id)
+        """Queue message for specific client (audio may be dropped under backpressure)"""
+        send_queue = self.send_queues.get(client_id)
+        if send_queue:
+            if message.get("type") == "audio_data":
+                send_queue.put_audio(message)
+            else:
+                send_queue.put_control(message)
+
+    async def send_bytes(self, client_id: str, data: bytes):
+        """Queue a binary audio frame for specific client"""
+        send_queue = self.send_queues.get(client_id)
+        if send_queue:
+            send_queue.put_audio(data)
+
+    def notify_next_audio_sent(self, client_id: str, callback: Callable[[], None]):
+        """Run callback once the next audio message for a client reaches its socket"""
+        send_queue = self.send_queues.get(client_id)
+        if send_queue:
+            send_queue.notify_next_audio_sent(callback)
+
+    def flush_audio(self, client_id: str) -> int:
+        """Drop queued audio for a client, e.g. when the user barges in"""
+        send_queue = self.send_queues.get(client_id)
+        return send_queue.flush_audio() if send_queue else 0
+
+    def get_send_queue_stats(self) -> Dict[str, Dict[str, int]]:
+        """Queue depth and drop counts per client"""
+        return {
+            client_id: send_queue.stats()
+            for client_id, send_queue in self.send_queues.items()
+        }
+
+    def _collect_metrics(self):
+        """Refresh connection and queue gauges (runs at scrape time, not per message)"""
+        registry.gauge("voice_bridge_active_connections").set(len(self.active_connections))
+        registry.gauge("voice_sessions_active").set(len(self.voice_clients))
+
+        depth = depth_max = audio_bytes = 0
+        for send_queue in self.send_queues.values():
+            stats = send_queue.stats()
+            depth += stats["depth"]
+            depth_max = max(depth_max, stats["depth"])
+            audio_bytes += stats["audio_bytes"]
+        registry.gauge("send_queue_depth").set(depth)
+        registry.gauge("send_queue_depth_max").set(depth_max)
+        registry.gauge("send_queue_audio_bytes").set(audio_bytes)
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
@@ -156,6 +268,8 @@ class WebSocketVoiceClient:
         tools: list = None,
         websocket_callback: Optional[Callable] = None,
         conversation_started: bool = False,
+        tool_registry=None,
+        connection_pool: Optional[VoiceLiveConnectionPool] = None,
     ):
         self.client_id = client_id
         self.endpoint = endpoint
@@ -168,6 +282,7 @@ class WebSocketVoiceClient:
         self.websocket_callback = websocket_callback
         self.bridge = bridge
         self.conversation_started = conversation_started
+        self.connection_pool = connection_pool
 
         # Initialize audio processor
         self.audio_processor = WebSocketAudioProcessor()
@@ -181,19 +296,51 @@ class WebSocketVoiceClient:
         self.function_call_in_progress = False
         self.active_call_id = None
 
-        # Available functions - load from YAML configuration
+        # Single reader per connection; waiters register futures here
+        self.event_demux = EventDemultiplexer()
+
+        # Supervised tool executions, keyed by call_id, and the tool calls
+        # issued by each response (keyed by response_id)
+        self._tool_tasks: Dict[str, asyncio.Task] = {}
+        self._tool_batches: Dict[str, ToolCallBatch] = {}
+
+        # Latency trace of the turn in progress (speech stopped -> response done)
+        self._turn: Optional[TurnTrace] = None
+
+        # Monotonic time of the last audio received from the frontend
+        self.last_input_at: Optional[float] = None
+        self._tool_semaphore = asyncio.Semaphore(
+            int(os.getenv("MAX_CONCURRENT_TOOL_CALLS", "4"))
+        )
+
+        # Available functions and their timeouts - load from YAML configuration
         self.available_functions = {}
-        self._register_functions()
+        self.tool_timeouts: Dict[str, float] = {}
+        self._register_functions(tool_registry)
 
         logger.info(f"WebSocket voice client initialized for {client_id}")
 
-    def _register_functions(self):
-        """Register available functions from YAML configuration."""
+    def session_spec(self) -> WarmSessionSpec:
+        """Configuration of this client's VoiceLive session (also the connection pool key)."""
+        return WarmSessionSpec(
+            endpoint=self.endpoint,
+            credential=self.credential,
+            template=session_templates.get(
+                self.model, self.voice, self.transcribe_model, self.instructions, self.tools
+            ),
+        )
+
+    def _register_functions(self, tool_registry=None):
+        """Register available functions from the shared tool registry."""
         try:
-            from tool_loader import get_tool_loader
+            if tool_registry is None:
+                from tool_loader import get_tool_loader
 
-            tool_loader = get_tool_loader()
-            self.available_functions = tool_loader.get_function_implementations()
+                tool_registry = get_tool_loader().get_registry()
+
+            # Read-only mappings shared with every other session
+            self.available_functions = tool_registry.functions
+            self.tool_timeouts = tool_registry.timeouts
             logger.info(
                 f"Registered {len(self.available_functions)} functions from YAML config"
             )
@@ -207,25 +354,47 @@ class WebSocketVoiceClient:
         """Start the voice client session."""
         try:
             self.is_running = True
-            logger.info(f"Connecting to VoiceLive API with model {self.model}")
-
-            async with connect(
-                endpoint=self.endpoint,
-                credential=self.credential,
-                model=self.model,
-            ) as connection:
+            spec = self.session_spec()
+            warm = None
+            if self.connection_pool is not None:
+                warm = await self.connection_pool.claim(spec)
+
+            async with AsyncExitStack() as stack:
+                if warm is not None:
+                    # Already connected and configured: skip straight to the greeting
+                    stack.push_async_callback(warm.close)
+                    connection = warm.connection
+                    self.session = warm.session
+                    logger.info(f"Using pre-warmed VoiceLive session {self.session.id}")
+                else:
+                    logger.info(f"Connecting to VoiceLive API with model {self.model}")
+                    connection = await stack.enter_async_context(
+                        connect(
+                            endpoint=self.endpoint,
+                            credential=self.credential,
+                            model=self.model,
+                        )
+                    )
                 self.connection = connection
 
                 # Start audio processor
                 await self.audio_processor.start()
 
-                # Configure session
-                await self._setup_session(connection)
+                # Process events - the only reader of this connection
+                events_task = asyncio.create_task(self._process_events(connection))
+
+                try:
+                    # Configure session
+                    if warm is None:
+                        await self._setup_session(connection, spec.template.session_config)
+                    await self._send_greeting(connection)
+                except Exception:
+                    events_task.cancel()
+                    raise
 
                 logger.info("🎤 Voice assistant ready! Start speaking...")
 
-                # Process events
-                await self._process_events(connection)
+                await events_task
 
         except Exception as e:
             logger.error(f"Voice client error: {e}")
@@ -233,58 +402,13 @@ class WebSocketVoiceClient:
         finally:
             await self.cleanup()
 
-    async def _setup_session(self, connection):
+    async def _setup_session(self, connection, session_config: RequestSession):
         """Setup the voice session with tools."""
         try:
-            # Create session configuration
-            try:
-                # Determine if end_of_utterance_detection is supported
-                # It's only supported for cascaded pipelines, not gpt-realtime models
-                realtime_models = ["gpt-realtime", "gpt-realtime-mini", "phi4-mm-realtime"]
-                supports_eou_detection = self.model not in realtime_models
-                
-                # Build turn detection configuration
-                if supports_eou_detection:
-                    turn_detection = AzureSemanticVad(
-                        threshold=0.3,
-                        prefix_padding_ms=300,
-                        speech_duration_ms=80,
-                        silence_duration_ms=500,
-                        remove_filler_words=True,
-                        interrupt_response=True,
-                        end_of_utterance_detection=AzureSemanticDetection(
-                            threshold_level="default",
-                            timeout_ms=1000
-                        )
-                    )
-                else:
-                    turn_detection = AzureSemanticVad(
-                        threshold=0.3,
-                        prefix_padding_ms=300,
-                        speech_duration_ms=80,
-                        silence_duration_ms=500,
-                        remove_filler_words=True,
-                        interrupt_response=True,
-                    )
-                
-                session_config = RequestSession(
-                    modalities=[Modality.TEXT, Modality.AUDIO],
-                    instructions=self.instructions,
-                    voice=AzureStandardVoice(name=self.voice, type="azure-standard"),
-                    input_audio_format=InputAudioFormat.PCM16,
-                    output_audio_format=OutputAudioFormat.PCM16,
-                    input_audio_transcription=AudioInputTranscriptionOptions(
-                        model=self.transcribe_model
-                    ),
-                    turn_detection=turn_detection,
-                    tools=self.tools,
-                    tool_choice=ToolChoiceLiteral.AUTO,
-                    temperature=0.6,
-                    max_response_output_tokens=4096,
-                )
-            except Exception as e:
-                logger.error(f"Failed to create session configuration: {e}")
-                raise
+            # Register the waiter before sending so the reply cannot be missed
+            session_updated_waiter = self.event_demux.expect(
+                {ServerEventType.SESSION_UPDATED}
+            )
 
             # Send session configuration
             await connection.session.update(session=session_config)
@@ -292,7 +416,7 @@ class WebSocketVoiceClient:
             # Wait for session to be ready
             try:
                 session_updated = await self._wait_for_event(
-                    connection, {ServerEventType.SESSION_UPDATED}
+                    session_updated_waiter, {ServerEventType.SESSION_UPDATED}
                 )
                 if session_updated is None:
                     raise ValueError("SESSION_UPDATED event not received")
@@ -305,16 +429,6 @@ class WebSocketVoiceClient:
                 self.session = session_updated.session
                 logger.info(f"Session ready: {self.session.id}")
 
-                # Invoke Proactive greeting
-                if not self.conversation_started:
-                    self.conversation_started = True
-                    logger.info("Sending proactive greeting request")
-                    try:
-                        await connection.response.create()
-
-                    except Exception:
-                        logger.error("Failed to send proactive greeting request")
-
             except asyncio.TimeoutError:
                 logger.error("Timeout waiting for SESSION_UPDATED event")
                 raise
@@ -326,6 +440,17 @@ class WebSocketVoiceClient:
             logger.error(f"Failed to setup session: {e}")
             raise
 
+    async def _send_greeting(self, connection):
+        """Invoke the proactive greeting once per conversation."""
+        if not self.conversation_started:
+            self.conversation_started = True
+            logger.info("Sending proactive greeting request")
+            try:
+                await connection.response.create()
+
+            except Exception:
+                logger.error("Failed to send proactive greeting request")
+
     async def _process_events(self, connection):
         """Process incoming events from VoiceLive API."""
         try:
@@ -333,11 +458,22 @@ class WebSocketVoiceClient:
                 if not self.is_running:
                     break
 
+                # Resolve waiters first; the event still goes through normal handling
+                self.event_demux.dispatch(event)
+
+                event_count, handler_time = _metrics_for_event(event.type)
+                start = time.perf_counter()
                 await self._handle_event(event, connection)
+                handler_time.observe(time.perf_counter() - start)
+                event_count.inc()
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Error processing events: {e}")
             raise
+        finally:
+            self.event_demux.close()
 
     async def _handle_event(self, event, connection):
         """Handle individual events from VoiceLive API."""
@@ -346,39 +482,58 @@ class WebSocketVoiceClient:
 
             # Audio events
             if event_type == ServerEventType.RESPONSE_AUDIO_DELTA:
+                if self._turn is not None and not self._turn.has(FIRST_DELTA_RECEIVED):
+                    self._trace_first_delta(self._turn)
                 if hasattr(event, "delta") and event.delta:
-                    await self.audio_processor.queue_audio(event.delta)
+                    await self.audio_processor.queue_audio(
+                        event.delta, getattr(event, "response_id", None)
+                    )
 
             elif event_type == ServerEventType.RESPONSE_AUDIO_DONE:
-                logger.info("🔊 Audio response complete")
+                hot_logger.info("🔊 Audio response complete")
 
             # Speech detection events
             elif event_type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-                logger.info("🎤 User started speaking")
+                hot_logger.info("🎤 User started speaking")
                 await self._handle_user_interruption(connection)
 
             elif event_type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-                logger.info("🎤 User stopped speaking")
+                hot_logger.info("🎤 User stopped speaking")
+                turn_recorder.finish(self._turn, "superseded")
+                self._turn = TurnTrace(self.client_id)
                 await self._handle_user_speech_end()
 
             # Response events
             elif event_type == ServerEventType.RESPONSE_CREATED:
-                logger.info("🤖 Assistant response created")
+                hot_logger.info("🤖 Assistant response created")
+                if self._turn is not None:
+                    self._turn.mark(RESPONSE_CREATED)
 
             elif event_type == ServerEventType.RESPONSE_DONE:
-                logger.info("✅ Response complete")
+                hot_logger.info("✅ Response complete")
+                self._trace_response_done(event)
+                await self._handle_response_done(event, connection)
 
             # Function call events
             elif event_type == ServerEventType.CONVERSATION_ITEM_CREATED:
                 await self._handle_conversation_item_created(event, connection)
 
+            elif event_type == ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE:
+                # Track the call against its response here, on the reader path,
+                # so RESPONSE_DONE always sees the complete batch
+                if event.call_id in self._tool_tasks:
+                    batch = self._tool_batches.setdefault(
+                        event.response_id, ToolCallBatch()
+                    )
+                    batch.pending.add(event.call_id)
+
             # Text transcription events
             elif (
                 event_type
                 == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED
             ):
                 if hasattr(event, "transcript"):
-                    logger.info(f"📝 Transcription: {event.transcript}")
+                    hot_logger.info("📝 Transcription: %s", event.transcript)
 
             # Error events
             elif event_type == ServerEventType.ERROR:
@@ -402,31 +557,110 @@ class WebSocketVoiceClient:
                 and item.type == ItemType.FUNCTION_CALL
                 and hasattr(item, "call_id")
             ):
-
-                await self._handle_function_call_with_improved_pattern(
-                    event, connection
+                # Register the waiter now, before the reader can dispatch the
+                # arguments event, then run the tool off the event path
+                arguments_waiter = self.event_demux.expect(
+                    {ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE},
+                    call_id=item.call_id,
                 )
+                self._start_tool_call(event, connection, arguments_waiter)
 
         except Exception as e:
             logger.error(f"Error handling conversation item: {e}")
 
-    async def _handle_function_call_with_improved_pattern(
-        self, conversation_created_event, connection
-    ):
-        """Enhanced function call handler with WebSocket events"""
-        # Validate the event structure
-        if not isinstance(conversation_created_event, type(conversation_created_event)):
-            logger.error("Expected ServerEventConversationItemCreated")
+    def _start_tool_call(self, event, connection, arguments_waiter):
+        """Run a function call as a supervised background task."""
+        call_id = event.item.call_id
+        task = asyncio.create_task(
+            self._handle_function_call_with_improved_pattern(
+                event, connection, arguments_waiter
+            ),
+            name=f"tool-call-{call_id}",
+        )
+        self._tool_tasks[call_id] = task
+        self.function_call_in_progress = True
+        self.active_call_id = call_id
+        task.add_done_callback(
+            lambda t, call_id=call_id: self._on_tool_task_done(call_id, t)
+        )
+
+    def _on_tool_task_done(self, call_id: str, task: asyncio.Task):
+        """Forget a finished tool task and surface unexpected failures."""
+        self._tool_tasks.pop(call_id, None)
+        self.function_call_in_progress = bool(self._tool_tasks)
+        if self.active_call_id == call_id:
+            self.active_call_id = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Tool task {call_id} failed: {task.exception()}")
+
+    async def cancel_tool_calls(self, reason: str):
+        """Cancel all in-flight tool executions (barge-in or teardown)."""
+        tasks = list(self._tool_tasks.values())
+        self._tool_batches.clear()
+        if not tasks:
             return
 
-        if not hasattr(conversation_created_event.item, "call_id"):
-            logger.error("Expected ResponseFunctionCallItem")
+        logger.info(f"Cancelling {len(tasks)} tool call(s): {reason}")
+        for task in tasks:
+            task.cancel(reason)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _trace_first_delta(self, turn: TurnTrace):
+        """Mark the first audio delta of a turn and when it reaches the browser."""
+        turn.mark(FIRST_DELTA_RECEIVED)
+        self.bridge.notify_next_audio_sent(
+            self.client_id, lambda: turn.mark(FIRST_AUDIO_SENT)
+        )
+
+    def _trace_response_done(self, event):
+        """Close the current turn unless this response only issued tool calls."""
+        turn = self._turn
+        if turn is None:
+            return
+        response = getattr(event, "response", None)
+        if getattr(response, "id", None) in self._tool_batches:
+            # Tool calls continue the turn with a follow-up response
+            return
+        turn.mark(RESPONSE_DONE)
+        status = getattr(response, "status", None) or "completed"
+        turn_recorder.finish(turn, "cancelled" if status == "cancelled" else "completed")
+        self._turn = None
+
+    async def _handle_response_done(self, event, connection):
+        """Continue the conversation once a response's tool calls have all reported back."""
+        response = getattr(event, "response", None)
+        response_id = getattr(response, "id", None)
+        batch = self._tool_batches.get(response_id)
+        if batch is None:
             return
 
+        if getattr(response, "status", None) == "cancelled":
+            self._tool_batches.pop(response_id, None)
+            return
+
+        batch.response_done = True
+        await self._maybe_continue_response(response_id, connection)
+
+    async def _maybe_continue_response(self, response_id: str, connection):
+        """Request a new response when the originating response and all its tools are done."""
+        batch = self._tool_batches.get(response_id)
+        if batch is None or not batch.response_done or batch.pending:
+            return
+
+        del self._tool_batches[response_id]
+        if batch.outputs_posted:
+            # Create a new response to process the function results
+            await connection.response.create()
+
+    async def _handle_function_call_with_improved_pattern(
+        self, conversation_created_event, connection, arguments_waiter
+    ):
+        """Enhanced function call handler with WebSocket events"""
         function_call_item = conversation_created_event.item
         function_name = function_call_item.name
         call_id = function_call_item.call_id
         previous_item_id = function_call_item.id
+        response_id = None
 
         logger.info(f"Function call detected: {function_name} with call_id: {call_id}")
 
@@ -442,20 +676,12 @@ class WebSocketVoiceClient:
         )
 
         try:
-            # Set tracking variables
-            self.function_call_in_progress = True
-            self.active_call_id = call_id
-
             # Wait for the function arguments to be complete
             function_done = await self._wait_for_event(
-                connection, {ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE}
+                arguments_waiter,
+                {ServerEventType.RESPONSE_FUNCTION_CALL_ARGUMENTS_DONE},
             )
-
-            if function_done.call_id != call_id:
-                logger.warning(
-                    f"Call ID mismatch: expected {call_id}, got {function_done.call_id}"
-                )
-                return
+            response_id = function_done.response_id
 
             arguments = function_done.arguments
             logger.info(f"Function arguments received: {arguments}")
@@ -472,9 +698,6 @@ class WebSocketVoiceClient:
                 },
             )
 
-            # Wait for response to be done before proceeding
-            await self._wait_for_event(connection, {ServerEventType.RESPONSE_DONE})
-
             # Execute the function if we have it
             if function_name in self.available_functions:
                 logger.info(f"Executing function: {function_name}")
@@ -490,40 +713,70 @@ class WebSocketVoiceClient:
                     },
                 )
 
-                # Execute the function
-                start_time = asyncio.get_event_loop().time()
-                result = await self.available_functions[function_name](arguments)
-                end_time = asyncio.get_event_loop().time()
-
-                # Send function completed event
-                await self.bridge.send_message(
-                    self.client_id,
-                    {
-                        "type": "tool_call_completed",
-                        "function_name": function_name,
-                        "call_id": call_id,
-                        "result": result,
-                        "execution_time": end_time - start_time,
-                        "timestamp": end_time,
-                    },
-                )
+                # Execute the function within its configured timeout
+                timeout_seconds = self.tool_timeouts.get(function_name, 10)
+                turn = self._turn
+                async with self._tool_semaphore:
+                    start_time = asyncio.get_event_loop().time()
+                    span = turn.tool_started(function_name, call_id) if turn else None
+                    status = STATUS_ERROR
+                    try:
+                        result, status = await execute_tool(
+                            function_name,
+                            self.available_functions[function_name],
+                            arguments,
+                            timeout_seconds,
+                        )
+                    except asyncio.CancelledError:
+                        status = STATUS_CANCELLED
+                        raise
+                    finally:
+                        if span:
+                            TurnTrace.tool_finished(span, status)
+                    end_time = asyncio.get_event_loop().time()
+
+                if status == STATUS_TIMEOUT:
+                    # The model still gets the structured timeout result below
+                    await self.bridge.send_message(
+                        self.client_id,
+                        {
+                            "type": "tool_call_error",
+                            "function_name": function_name,
+                            "call_id": call_id,
+                            "error": f"Tool timed out after {timeout_seconds}s",
+                            "execution_time": end_time - start_time,
+                            "timestamp": end_time,
+                        },
+                    )
+                else:
+                    # Send function completed event
+                    await self.bridge.send_message(
+                        self.client_id,
+                        {
+                            "type": "tool_call_completed",
+                            "function_name": function_name,
+                            "call_id": call_id,
+                            "result": result,
+                            "execution_time": end_time - start_time,
+                            "timestamp": end_time,
+                        },
+                    )
 
                 # Create function call output item
-                from azure.ai.voicelive.models import FunctionCallOutputItem
-
                 function_output = FunctionCallOutputItem(
                     call_id=call_id, output=json.dumps(result)
                 )
 
-                # Send the result back to the conversation with proper previous_item_id
+                # Post the result as soon as it is ready, with proper previous_item_id
                 await connection.conversation.item.create(
                     previous_item_id=previous_item_id, item=function_output
                 )
 
-                logger.info(f"Function result sent: {result}")
+                batch = self._tool_batches.get(response_id)
+                if batch is not None:
+                    batch.outputs_posted += 1
 
-                # Create a new response to process the function result
-                await connection.response.create()
+                logger.info(f"Function result sent: {result}")
 
             else:
                 logger.error(f"Unknown function: {function_name}")
@@ -540,6 +793,20 @@ class WebSocketVoiceClient:
                     },
                 )
 
+        except asyncio.CancelledError:
+            logger.info(f"Function call {function_name} ({call_id}) cancelled")
+            await self.bridge.send_message(
+                self.client_id,
+                {
+                    "type": "tool_call_error",
+                    "function_name": function_name,
+                    "call_id": call_id,
+                    "error": "Tool call cancelled",
+                    "timestamp": asyncio.get_event_loop().time(),
+                },
+            )
+            raise
+
         except asyncio.TimeoutError:
             error_msg = (
                 f"Timeout waiting for function call completion for {function_name}"
@@ -575,27 +842,23 @@ class WebSocketVoiceClient:
             )
 
         finally:
-            self.function_call_in_progress = False
-            self.active_call_id = None
+            if not arguments_waiter.done():
+                arguments_waiter.cancel()
+
+        # Completed (successfully or not): let the response continue if this was the last call
+        batch = self._tool_batches.get(response_id)
+        if batch is not None:
+            batch.pending.discard(call_id)
+            await self._maybe_continue_response(response_id, connection)
 
     async def _wait_for_event(
-        self, connection, wanted_types: set, timeout_s: float = 10.0
+        self, waiter: asyncio.Future, wanted_types: set, timeout_s: float = 10.0
     ):
-        """Wait for specific event types."""
-
-        async def _next():
-            async for event in connection:
-                # Keep essential error logging
-                if hasattr(event, "error"):
-                    logger.error(f"Event has error: {event.error}")
-                if event.type == ServerEventType.ERROR:
-                    logger.error(f"VoiceLive API Error event received: {event}")
-
-                if event.type in wanted_types:
-                    return event
-
+        """Wait for a waiter registered on the event demultiplexer."""
         try:
-            result = await asyncio.wait_for(_next(), timeout=timeout_s)
+            result = await self.event_demux.wait(waiter, timeout_s=timeout_s)
+            if hasattr(result, "error") and result.error:
+                logger.error(f"Event has error: {result.error}")
             return result
         except asyncio.TimeoutError:
             logger.error(
@@ -608,6 +871,8 @@ class WebSocketVoiceClient:
 
     async def process_audio_input(self, audio_base64: str):
         """Process audio input from frontend."""
+        # Read by the session supervisor's idle timeout
+        self.last_input_at = time.monotonic()
         if self.connection:
             await self.audio_processor.process_input_audio(
                 audio_base64, self.connection
@@ -617,14 +882,16 @@ class WebSocketVoiceClient:
         """Interrupt current response and stop playback."""
         if self.connection:
             try:
-                # Stop playback on frontend
+                # Stop playback on frontend and drop audio not yet sent
+                self.bridge.flush_audio(self.client_id)
                 await self.bridge.send_message(self.client_id, {
                     "type": "stop_playback",
                     "reason": "manual_interrupt",
                     "timestamp": asyncio.get_event_loop().time()
                 })
                 
-                # Cancel VoiceLive response
+                # Cancel in-flight tool calls and the VoiceLive response
+                await self.cancel_tool_calls("manual interrupt")
                 await self.connection.response.cancel()
                 
                 logger.info("Response and playback interrupted")
@@ -634,6 +901,10 @@ class WebSocketVoiceClient:
     async def cleanup(self):
         """Clean up resources."""
         self.is_running = False
+        await self.cancel_tool_calls("session teardown")
+        turn_recorder.finish(self._turn, "closed")
+        self._turn = None
+        self.event_demux.close()
         if self.audio_processor:
             await self.audio_processor.cleanup()
         self.connection = None
@@ -642,21 +913,25 @@ class WebSocketVoiceClient:
     async def _handle_user_interruption(self, connection):
         """Handle user interrupting the assistant by speaking."""
         try:
-            # 1. Stop current audio playback via WebSocket
+            # 1. Stop current audio playback via WebSocket (queued audio is stale now)
+            self.bridge.flush_audio(self.client_id)
             await self.bridge.send_message(self.client_id, {
                 "type": "stop_playback",
                 "reason": "user_interruption",
                 "timestamp": asyncio.get_event_loop().time()
             })
             
-            # 2. Cancel any ongoing response from VoiceLive API
+            # 2. Abandon in-flight tool calls; their results are stale now
+            await self.cancel_tool_calls("user interruption")
+
+            # 3. Cancel any ongoing response from VoiceLive API
             try:
                 await connection.response.cancel()
                 logger.info("Cancelled ongoing response due to user interruption")
             except Exception as e:
                 logger.debug(f"No response to cancel: {e}")
                 
-            # 3. Clear audio buffer if needed
+            # 4. Clear audio buffer if needed
             # await connection.input_audio_buffer.clear()  # Uncomment if available
             
         except Exception as e:
@@ -289,6 +289,15 @@ export default function useVoiceAssistant({
         onSessionError?.(message as SessionEvent);
         break;
 
+      // Admission control: server at capacity
+      case 'session_queued':
+        console.log(`Session queued at position ${message.position}`);
+        break;
+
+      case 'session_rejected':
+        onSessionError?.({ type: 'session_error', error: message.message } as SessionEvent);
+        break;
+
       // Audio streaming
       case 'audio_data':
         handleAudioData(message as AudioDataEvent);
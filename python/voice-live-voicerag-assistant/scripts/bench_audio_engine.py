@@ -0,0 +1,351 @@
+"""
+Headless benchmark for the shared audio engine (voice-live-quickstarts/audio_engine.py)
+Runs AudioProcessor against the null backend and a fake VoiceLive connection:
+microphone buffers flow to input_audio_buffer.append, response audio is streamed
+into playback and interrupted part-way (barge-in), with no sound card needed.
+
+Reports the append message rate and the capture-to-append latency, the cost of
+the capture and playback callbacks, and the barge-in-to-silence latency.
+Compare coalescing budgets (and a slow connection) with --latency-budget-ms
+and --append-delay-ms.
+
+--wakeups compares thread and event-loop wakeups per second, and the added
+capture latency, against the previous scripts/handler.py design (capture,
+send and playback threads polling queues with a 100 ms timeout) while the
+microphone streams and no response audio is playing.
+
+Usage:
+    python scripts/bench_audio_engine.py --seconds 5 --realtime-factor 1
+    python scripts/bench_audio_engine.py --latency-budget-ms 0
+    python scripts/bench_audio_engine.py --latency-budget-ms 100 --append-delay-ms 150
+    python scripts/bench_audio_engine.py --wakeups --seconds 10
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# The engine lives in the sibling quickstarts sample (see README.md, "Local voice client")
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "..", "voice-live-quickstarts"))
+
+from audio_engine import (  # noqa: E402
+    CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_WIDTH,
+    AudioProcessor,
+    NullBackend,
+    _ClockThread,
+)
+
+
+class TimedNullBackend(NullBackend):
+    """
+    Null backend that records when each buffer was captured and what the callbacks cost.
+
+    With capture_limit_bytes set, the capture clock stops itself after that
+    much audio and sets capture_done, so an unpaced run captures exactly the
+    requested audio instead of however much the clock produces before the
+    event loop gets around to stopping it.
+    """
+
+    def __init__(self, realtime_factor: float, capture_limit_bytes: int = 0):
+        super().__init__(realtime_factor)
+        self.capture_limit_bytes = capture_limit_bytes
+        self.capture_done = threading.Event()
+        self.capture_times = []  # (end byte offset, perf_counter) per captured buffer
+        self.capture_callback_s = []
+        self.playback_callback_s = []
+
+    def start_capture(self, callback, frames_per_buffer):
+        size = frames_per_buffer * SAMPLE_WIDTH * CHANNELS
+        limit = self.capture_limit_bytes
+
+        def tick():
+            if limit and self.captured_bytes >= limit:
+                self.capture_done.set()
+                # From the clock's own thread this only signals it to exit
+                self.stop_capture()
+                return
+            start = time.perf_counter()
+            data = self._next_capture_buffer(size)
+            self.captured_bytes += len(data)
+            self.capture_times.append((self.captured_bytes, start))
+            callback(data)
+            self.capture_callback_s.append(time.perf_counter() - start)
+
+        self._capture_clock = _ClockThread(
+            "audio-capture", self._period(frames_per_buffer), tick
+        )
+
+    def start_playback(self, callback, frames_per_buffer):
+        def timed(size):
+            start = time.perf_counter()
+            data = callback(size)
+            self.playback_callback_s.append(time.perf_counter() - start)
+            return data
+
+        super().start_playback(timed, frames_per_buffer)
+
+
+class _FakeInputAudioBuffer:
+    def __init__(self, append_delay_s: float):
+        self.append_delay_s = append_delay_s
+        self.appends = []  # (decoded bytes, perf_counter)
+
+    async def append(self, *, audio: str):
+        self.appends.append((len(base64.b64decode(audio)), time.perf_counter()))
+        # Yield like a socket write would, even when unpaced capture keeps the sender busy
+        await asyncio.sleep(self.append_delay_s)
+
+
+class FakeConnection:
+    """Just enough of VoiceLiveConnection for AudioProcessor."""
+
+    def __init__(self, append_delay_s: float = 0.0):
+        self.input_audio_buffer = _FakeInputAudioBuffer(append_delay_s)
+
+
+class LegacyPollingPipeline:
+    """
+    Capture path of the previous scripts/handler.py AudioProcessor.
+
+    A capture thread does blocking reads (simulated with a sleep per buffer)
+    and queues base64 audio; a send thread polls that queue with a 100 ms
+    timeout and submits one coroutine per buffer; a playback thread polls
+    its own queue the same way.
+    """
+
+    def __init__(self, connection, loop: asyncio.AbstractEventLoop, chunk_size: int = 1024):
+        self.connection = connection
+        self.loop = loop
+        self.chunk_size = chunk_size
+        self.capture_times = []  # (end byte offset, perf_counter) per captured buffer
+        self.captured_bytes = 0
+        self.loop_wakeups = 0
+        self.polling_wakeups = 0
+        self.running = False
+        self.send_queue: "queue.Queue[str]" = queue.Queue()
+        self.playback_queue: "queue.Queue[tuple]" = queue.Queue()
+        self.threads = []
+
+    def start(self):
+        self.running = True
+        for target in (self._capture, self._send, self._playback):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self):
+        self.running = False
+        for thread in self.threads:
+            thread.join(timeout=1.0)
+
+    def _capture(self):
+        size = self.chunk_size * SAMPLE_WIDTH
+        period = self.chunk_size / SAMPLE_RATE
+        next_read = time.perf_counter()
+        while self.running:
+            next_read += period
+            time.sleep(max(0.0, next_read - time.perf_counter()))  # input_stream.read
+            self.captured_bytes += size
+            self.capture_times.append((self.captured_bytes, time.perf_counter()))
+            self.send_queue.put(base64.b64encode(bytes(size)).decode("utf-8"))
+
+    def _send(self):
+        while self.running:
+            try:
+                audio_base64 = self.send_queue.get(timeout=0.1)
+            except queue.Empty:
+                self.polling_wakeups += 1
+                continue
+            self.polling_wakeups += 1
+            self.loop_wakeups += 1
+            asyncio.run_coroutine_threadsafe(
+                self.connection.input_audio_buffer.append(audio=audio_base64), self.loop
+            )
+
+    def _playback(self):
+        while self.running:
+            try:
+                self.playback_queue.get(timeout=0.1)
+            except queue.Empty:
+                self.polling_wakeups += 1
+                continue
+
+
+def _capture_latencies_ms(backend, appends) -> list:
+    """Time from capturing the oldest buffer in each append to the append running."""
+    latencies = []
+    index = 0
+    sent = 0
+    for size, sent_at in appends:
+        # First captured buffer whose audio is in this append
+        while index < len(backend.capture_times) and backend.capture_times[index][0] <= sent:
+            index += 1
+        if index < len(backend.capture_times):
+            latencies.append((sent_at - backend.capture_times[index][1]) * 1000)
+        sent += size
+    return latencies
+
+
+def _scaled(seconds: float, realtime_factor: float) -> float:
+    """Wall-clock time for an audio-time interval (0 = unpaced, no waiting)."""
+    return seconds / realtime_factor if realtime_factor > 0 else 0.0
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+async def run(
+    seconds: float,
+    realtime_factor: float,
+    barge_ins: int,
+    latency_budget_ms: float,
+    append_delay_ms: float,
+):
+    backend = TimedNullBackend(realtime_factor, int(seconds * SAMPLE_RATE) * SAMPLE_WIDTH * CHANNELS)
+    connection = FakeConnection(append_delay_ms / 1000)
+    ap = AudioProcessor(connection, backend=backend, latency_budget_ms=latency_budget_ms)
+
+    ap.start_playback()
+    ap.start_capture()
+    start = time.perf_counter()
+
+    # Stream response audio 4x faster than real time and interrupt it part-way
+    delta = bytes(SAMPLE_RATE * SAMPLE_WIDTH // 10)  # 100 ms of audio per delta
+    interval = seconds / max(1, barge_ins)
+    for _ in range(barge_ins):
+        epoch = ap.playback_epoch
+        for _ in range(int(interval * 10)):
+            ap.queue_audio(delta, epoch)
+            await asyncio.sleep(_scaled(0.025, realtime_factor))
+        ap.skip_pending_audio()
+    # The backend stops its own clock once the requested audio is captured
+    await asyncio.to_thread(backend.capture_done.wait)
+    backend.stop_playback()
+    # Let the sender catch up, including its last partial batch
+    while ap.appended_bytes < backend.captured_bytes:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+
+    capture = ap.capture_stats()
+    ap.shutdown()
+    await asyncio.sleep(0.1)
+
+    appends = connection.input_audio_buffer.appends
+    latencies = _capture_latencies_ms(backend, appends)
+    stats = ap.playback_stats()
+    audio_seconds = backend.captured_bytes / (SAMPLE_RATE * SAMPLE_WIDTH)
+
+    print(
+        f"Audio engine, null backend: {audio_seconds:.1f}s of capture in {elapsed:.2f}s wall, "
+        f"{latency_budget_ms:.0f} ms latency budget, {append_delay_ms:.0f} ms per append"
+    )
+    print(f"  appends sent              {len(appends):>10}")
+    print(f"  appends per audio second  {len(appends) / max(audio_seconds, 1e-9):>10.1f}")
+    print(f"  mean append size          {statistics.fmean([a[0] for a in appends]) if appends else 0:>10.0f} bytes")
+    print(f"  capture->append p50       {_percentile(latencies, 0.5):>10.2f} ms")
+    print(f"  capture->append p99       {_percentile(latencies, 0.99):>10.2f} ms")
+    print(f"  buffers per append        {capture['buffers_per_append'] or 0:>10.2f}")
+    print(f"  coalescing delay avg      {capture['coalesce_delay_ms_avg'] or 0:>10.1f} ms")
+    print(f"  coalescing delay max      {capture['coalesce_delay_ms_max'] or 0:>10.1f} ms")
+    print(f"  capture callback mean     {statistics.fmean(backend.capture_callback_s) * 1e6 if backend.capture_callback_s else 0:>10.1f} us")
+    print(f"  playback callback mean    {statistics.fmean(backend.playback_callback_s) * 1e6 if backend.playback_callback_s else 0:>10.1f} us")
+    print(f"  barge-ins                 {stats['barge_ins']:>10}")
+    print(f"  barge-in to silence max   {stats['barge_in_to_silence_ms_max'] or 0:>10.1f} ms")
+    print(f"  playback underruns        {stats['underruns']:>10}")
+
+
+async def run_wakeups(seconds: float, latency_budget_ms: float):
+    """Wakeups per second and added capture latency: legacy threads vs the engine."""
+    rows = []
+
+    connection = FakeConnection()
+    legacy = LegacyPollingPipeline(connection, asyncio.get_running_loop())
+    legacy.start()
+    await asyncio.sleep(seconds)
+    legacy.stop()
+    await asyncio.sleep(0.05)
+    rows.append((
+        "legacy polling threads",
+        legacy.loop_wakeups,
+        legacy.polling_wakeups,
+        _capture_latencies_ms(legacy, connection.input_audio_buffer.appends),
+    ))
+
+    for budget_ms in sorted({0.0, latency_budget_ms}):
+        backend = TimedNullBackend(1.0)
+        connection = FakeConnection()
+        ap = AudioProcessor(connection, backend=backend, latency_budget_ms=budget_ms)
+        ap.start_playback()
+        ap.start_capture()
+        await asyncio.sleep(seconds)
+        ap.shutdown()
+        await asyncio.sleep(0.05)
+        rows.append((
+            f"engine, {budget_ms:.0f} ms budget",
+            ap.sender_wakeups,
+            0,
+            _capture_latencies_ms(backend, connection.input_audio_buffer.appends),
+        ))
+
+    print(f"Wakeups while capturing for {seconds:.0f}s with playback idle (device callbacks excluded)")
+    print(f"  {'pipeline':<26}{'loop/s':>8}{'polls/s':>9}{'latency p50':>13}{'p99':>9}")
+    for name, loop_wakeups, polls, latencies in rows:
+        print(
+            f"  {name:<26}{loop_wakeups / seconds:>8.1f}{polls / seconds:>9.1f}"
+            f"{_percentile(latencies, 0.5):>10.1f} ms{_percentile(latencies, 0.99):>6.1f} ms"
+        )
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the shared audio engine headlessly")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Audio seconds to capture")
+    parser.add_argument(
+        "--realtime-factor",
+        type=float,
+        default=1.0,
+        help="Clock speed of the null backend (1 = real time, 0 = as fast as possible)",
+    )
+    parser.add_argument("--barge-ins", type=int, default=3, help="Responses to interrupt")
+    parser.add_argument(
+        "--latency-budget-ms", type=float, default=100.0, help="Capture coalescing budget (0 = every buffer)"
+    )
+    parser.add_argument(
+        "--append-delay-ms", type=float, default=0.0, help="Simulated time to send one append"
+    )
+    parser.add_argument(
+        "--wakeups", action="store_true", help="Compare wakeups with the previous polling design"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+    if args.wakeups:
+        asyncio.run(run_wakeups(args.seconds, args.latency_budget_ms))
+        return
+    asyncio.run(
+        run(
+            args.seconds,
+            args.realtime_factor,
+            args.barge_ins,
+            args.latency_budget_ms,
+            args.append_delay_ms,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
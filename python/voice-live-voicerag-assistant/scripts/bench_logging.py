@@ -0,0 +1,147 @@
+"""
+Micro-benchmark for logging on the audio hot path
+Compares the per-chunk cost of the old eager f-string debug logging with the
+guarded lazy form, and the cost of emitting records to a slow stream directly
+versus through the queued handler and the rate-limited HotPathLogger from log_utils.
+
+Usage:
+    python scripts/bench_logging.py --chunks 200000
+"""
+
+import argparse
+import io
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "app", "backend"))
+
+from log_utils import LOG_FORMAT, HotPathLogger  # noqa: E402
+
+CLIENT_ID = "client-0123456789"
+AUDIO = bytes(4800)
+
+
+class SlowStream(io.StringIO):
+    """Stream whose writes take a fixed time, like a congested stdout pipe."""
+
+    def __init__(self, write_delay_s: float):
+        super().__init__()
+        self.write_delay_s = write_delay_s
+
+    def write(self, text):
+        if self.write_delay_s:
+            time.sleep(self.write_delay_s)
+        return len(text)
+
+
+def _isolated_logger(name: str, handler: logging.Handler, level: int) -> logging.Logger:
+    bench_logger = logging.getLogger(name)
+    bench_logger.handlers = [handler]
+    bench_logger.propagate = False
+    bench_logger.setLevel(level)
+    return bench_logger
+
+
+def _per_call_ns(fn, iterations: int) -> float:
+    start = time.perf_counter_ns()
+    fn(iterations)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def bench_disabled_debug(iterations: int):
+    """DEBUG disabled: what every audio chunk paid just to not log."""
+    bench_logger = _isolated_logger("bench.disabled", logging.NullHandler(), logging.INFO)
+
+    def eager(n):
+        for _ in range(n):
+            bench_logger.debug(f"🔊 Audio data streamed to client {CLIENT_ID} ({len(AUDIO)} bytes)")
+
+    def lazy(n):
+        for _ in range(n):
+            bench_logger.debug("🔊 Audio data streamed to client %s (%d bytes)", CLIENT_ID, len(AUDIO))
+
+    def guarded(n):
+        for _ in range(n):
+            if bench_logger.isEnabledFor(logging.DEBUG):
+                bench_logger.debug(
+                    "🔊 Audio data streamed to client %s (%d bytes)", CLIENT_ID, len(AUDIO)
+                )
+
+    return {
+        "eager f-string": _per_call_ns(eager, iterations),
+        "lazy %-format": _per_call_ns(lazy, iterations),
+        "guarded lazy": _per_call_ns(guarded, iterations),
+    }
+
+
+def bench_emission(iterations: int, write_delay_s: float):
+    """Records actually emitted: time spent in the calling (event loop) thread."""
+    results = {}
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    direct = logging.StreamHandler(SlowStream(write_delay_s))
+    direct.setFormatter(formatter)
+    bench_logger = _isolated_logger("bench.direct", direct, logging.INFO)
+    results["direct StreamHandler"] = _per_call_ns(
+        lambda n: [bench_logger.info("event %s", CLIENT_ID) for _ in range(n)], iterations
+    )
+
+    sink = logging.StreamHandler(SlowStream(write_delay_s))
+    sink.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, sink)
+    listener.start()
+    bench_logger = _isolated_logger(
+        "bench.queued", logging.handlers.QueueHandler(log_queue), logging.INFO
+    )
+    results["QueueHandler"] = _per_call_ns(
+        lambda n: [bench_logger.info("event %s", CLIENT_ID) for _ in range(n)], iterations
+    )
+    listener.stop()
+
+    hot_logger = HotPathLogger(
+        _isolated_logger(
+            "bench.limited", logging.handlers.QueueHandler(queue.SimpleQueue()), logging.INFO
+        ),
+        rate_per_second=5.0,
+    )
+    results["HotPathLogger (5/s)"] = _per_call_ns(
+        lambda n: [hot_logger.info("event %s", CLIENT_ID) for _ in range(n)], iterations
+    )
+    return results
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark hot-path logging overhead")
+    parser.add_argument("--chunks", type=int, default=200000, help="Iterations for the disabled-DEBUG case")
+    parser.add_argument("--records", type=int, default=2000, help="Iterations for the emission case")
+    parser.add_argument(
+        "--write-delay-us", type=float, default=50.0, help="Simulated stream write latency"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+
+    print(f"Per-chunk cost with DEBUG disabled ({args.chunks} chunks)")
+    for name, ns in bench_disabled_debug(args.chunks).items():
+        print(f"  {name:<28}{ns:>10.0f} ns")
+
+    print(
+        f"\nPer-record cost on the calling thread ({args.records} records, "
+        f"{args.write_delay_us:.0f} us stream writes)"
+    )
+    for name, ns in bench_emission(args.records, args.write_delay_us / 1e6).items():
+        print(f"  {name:<28}{ns:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
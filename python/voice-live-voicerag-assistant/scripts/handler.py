@@ -4,10 +4,7 @@ import asyncio
 import json
 import datetime
 import logging
-import base64
 import signal
-import threading
-import queue
 from typing import (
     Union,
     Optional,
@@ -19,13 +16,22 @@ from typing import (
     List,
     cast,
 )
-from concurrent.futures import ThreadPoolExecutor
 
-# Audio processing imports
+# Audio engine shared with the Python quickstarts; this sample must stay next
+# to python/voice-live-quickstarts (see README.md, "Local voice client")
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "voice-live-quickstarts"
+    ),
+)
 try:
-    import pyaudio
+    from audio_engine import AudioProcessor
 except ImportError:
-    print("This sample requires pyaudio. Install with: pip install pyaudio")
+    print(
+        "This sample requires audio_engine.py from python/voice-live-quickstarts. "
+        "Run it from a full checkout of the samples repository."
+    )
     sys.exit(1)
 
 # Environment variable loading
@@ -95,245 +101,6 @@ async def _wait_for_match(
     return await asyncio.wait_for(_next(), timeout=timeout_s)
 
 
-class AudioProcessor:
-    """
-    Handles real-time audio capture and playback for the voice assistant.
-
-    Responsibilities:
-    - Captures audio input from the microphone using PyAudio.
-    - Plays back audio output using PyAudio.
-    - Manages threading for audio capture, sending, and playback.
-    - Uses queues to buffer audio data between threads.
-    """
-
-    def __init__(self, connection):
-        self.connection = connection
-        self.audio = pyaudio.PyAudio()
-
-        # Audio configuration - PCM16, 24kHz, mono as specified
-        self.format = pyaudio.paInt16
-        self.channels = 1
-        self.rate = 24000
-        self.chunk_size = 1024
-
-        # Capture and playback state
-        self.is_capturing = False
-        self.is_playing = False
-        self.input_stream = None
-        self.output_stream = None
-
-        # Audio queues and threading
-        self.audio_queue: "queue.Queue[bytes]" = queue.Queue()
-        self.audio_send_queue: "queue.Queue[str]" = (
-            queue.Queue()
-        )  # base64 audio to send
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.capture_thread: Optional[threading.Thread] = None
-        self.playback_thread: Optional[threading.Thread] = None
-        self.send_thread: Optional[threading.Thread] = None
-        self.loop: Optional[asyncio.AbstractEventLoop] = None  # Store the event loop
-
-        logger.info("AudioProcessor initialized with 24kHz PCM16 mono audio")
-
-    async def start_capture(self):
-        """Start capturing audio from microphone."""
-        if self.is_capturing:
-            return
-
-        # Store the current event loop for use in threads
-        self.loop = asyncio.get_event_loop()
-
-        self.is_capturing = True
-
-        try:
-            self.input_stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.rate,
-                input=True,
-                frames_per_buffer=self.chunk_size,
-                stream_callback=None,
-            )
-
-            self.input_stream.start_stream()
-
-            # Start capture thread
-            self.capture_thread = threading.Thread(target=self._capture_audio_thread)
-            self.capture_thread.daemon = True
-            self.capture_thread.start()
-
-            # Start audio send thread
-            self.send_thread = threading.Thread(target=self._send_audio_thread)
-            self.send_thread.daemon = True
-            self.send_thread.start()
-
-            logger.info("Started audio capture")
-
-        except Exception as e:
-            logger.error(f"Failed to start audio capture: {e}")
-            self.is_capturing = False
-            raise
-
-    def _capture_audio_thread(self):
-        """Audio capture thread - runs in background."""
-        while self.is_capturing and self.input_stream:
-            try:
-                # Read audio data
-                audio_data = self.input_stream.read(
-                    self.chunk_size, exception_on_overflow=False
-                )
-
-                if audio_data and self.is_capturing:
-                    # Convert to base64 and queue for sending
-                    audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-                    self.audio_send_queue.put(audio_base64)
-
-            except Exception as e:
-                if self.is_capturing:
-                    logger.error(f"Error in audio capture: {e}")
-                break
-
-    def _send_audio_thread(self):
-        """Audio send thread - handles async operations from sync thread."""
-        while self.is_capturing:
-            try:
-                # Get audio data from queue (blocking with timeout)
-                audio_base64 = self.audio_send_queue.get(timeout=0.1)
-
-                if audio_base64 and self.is_capturing and self.loop:
-                    # Schedule the async send operation in the main event loop
-                    future = asyncio.run_coroutine_threadsafe(
-                        self.connection.input_audio_buffer.append(audio=audio_base64),
-                        self.loop,
-                    )
-                    # Don't wait for completion to avoid blocking
-
-            except queue.Empty:
-                continue
-            except Exception as e:
-                if self.is_capturing:
-                    logger.error(f"Error sending audio: {e}")
-                break
-
-    async def stop_capture(self):
-        """Stop capturing audio."""
-        if not self.is_capturing:
-            return
-
-        self.is_capturing = False
-
-        if self.input_stream:
-            self.input_stream.stop_stream()
-            self.input_stream.close()
-            self.input_stream = None
-
-        if self.capture_thread:
-            self.capture_thread.join(timeout=1.0)
-
-        if self.send_thread:
-            self.send_thread.join(timeout=1.0)
-
-        # Clear the send queue
-        while not self.audio_send_queue.empty():
-            try:
-                self.audio_send_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        logger.info("Stopped audio capture")
-
-    async def start_playback(self):
-        """Initialize audio playback system."""
-        if self.is_playing:
-            return
-
-        self.is_playing = True
-
-        try:
-            self.output_stream = self.audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.rate,
-                output=True,
-                frames_per_buffer=self.chunk_size,
-            )
-
-            # Start playback thread
-            self.playback_thread = threading.Thread(target=self._playback_audio_thread)
-            self.playback_thread.daemon = True
-            self.playback_thread.start()
-
-            logger.info("Audio playback system ready")
-
-        except Exception as e:
-            logger.error(f"Failed to initialize audio playback: {e}")
-            self.is_playing = False
-            raise
-
-    def _playback_audio_thread(self):
-        """Audio playback thread - runs in background."""
-        while self.is_playing:
-            try:
-                # Get audio data from queue (blocking with timeout)
-                audio_data = self.audio_queue.get(timeout=0.1)
-
-                if audio_data and self.output_stream and self.is_playing:
-                    self.output_stream.write(audio_data)
-
-            except queue.Empty:
-                continue
-            except Exception as e:
-                if self.is_playing:
-                    logger.error(f"Error in audio playback: {e}")
-                break
-
-    async def queue_audio(self, audio_data: bytes):
-        """Queue audio data for playback."""
-        if self.is_playing:
-            self.audio_queue.put(audio_data)
-
-    async def stop_playback(self):
-        """Stop audio playback and clear queue."""
-        if not self.is_playing:
-            return
-
-        self.is_playing = False
-
-        # Clear the queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        if self.output_stream:
-            self.output_stream.stop_stream()
-            self.output_stream.close()
-            self.output_stream = None
-
-        if self.playback_thread:
-            self.playback_thread.join(timeout=1.0)
-
-        logger.info("Stopped audio playback")
-
-    async def cleanup(self):
-        """Clean up audio resources."""
-        await self.stop_capture()
-        await self.stop_playback()
-
-        if self.audio:
-            self.audio.terminate()
-
-        self.executor.shutdown(wait=True)
-        logger.info("Audio processor cleaned up")
-
-        if self.connection:
-            try:
-                await self.connection.close()
-            except Exception as e:
-                pass
-
-
 class AsyncFunctionCallingClient:
     """Async client for Azure Voice Live API with function calling capabilities and audio input."""
 
@@ -356,6 +123,7 @@ class AsyncFunctionCallingClient:
         self.active_call_id: Optional[str] = None
         self.audio_processor: Optional[AudioProcessor] = None
         self.session_ready: bool = False
+        self.response_epoch: Optional[int] = None
         self.tools = tools if tools is not None else {}
 
         # Define available functions
@@ -420,7 +188,7 @@ class AsyncFunctionCallingClient:
                 await self._setup_session(connection)
 
                 # Start audio playback system
-                await self.audio_processor.start_playback()
+                self.audio_processor.start_playback()
 
                 logger.info(
                     "Voice assistant with function calling ready! Start speaking..."
@@ -444,7 +212,7 @@ class AsyncFunctionCallingClient:
         finally:
             # Cleanup audio processor
             if self.audio_processor:
-                await self.audio_processor.cleanup()
+                self.audio_processor.shutdown()
 
     async def _setup_session(self, connection):
         """Configure the VoiceLive session with function tools asynchronously."""
@@ -497,15 +265,16 @@ class AsyncFunctionCallingClient:
             self.session_ready = True
 
             # Start audio capture once session is ready
-            await ap.start_capture()
+            ap.start_capture()
             print("🎤 Ready for voice input! Try asking about your credit card...")
 
         elif event.type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
             logger.info("🎤 User started speaking - stopping playback")
             print("🎤 Listening...")
 
-            # Stop current assistant audio playback (interruption handling)
-            await ap.stop_playback()
+            # Drop queued assistant audio (interruption handling); the output
+            # stream stays open for the next response
+            ap.skip_pending_audio()
 
             # Cancel any ongoing response
             try:
@@ -517,11 +286,10 @@ class AsyncFunctionCallingClient:
             logger.info("🎤 User stopped speaking")
             print("🤔 Processing...")
 
-            # Restart playback system for response
-            await ap.start_playback()
-
         elif event.type == ServerEventType.RESPONSE_CREATED:
             logger.info("🤖 Assistant response created")
+            # Audio of this response is dropped once the user barges in
+            self.response_epoch = ap.playback_epoch
 
         elif event.type == ServerEventType.RESPONSE_TEXT_DELTA:
             logger.info(f"Text response: {event.delta}")
@@ -529,7 +297,7 @@ class AsyncFunctionCallingClient:
         elif event.type == ServerEventType.RESPONSE_AUDIO_DELTA:
             # Stream audio response to speakers
             logger.debug("Received audio delta")
-            await ap.queue_audio(event.delta)
+            ap.queue_audio(event.delta, self.response_epoch)
 
         elif event.type == ServerEventType.RESPONSE_AUDIO_DONE:
             logger.info("🤖 Assistant finished speaking")
@@ -0,0 +1,493 @@
+"""
+Concurrent-session load generator for the backend /ws/{client_id} endpoint
+Opens N browser-equivalent WebSocket clients that start a session and stream
+real-time paced audio chunks, then reports latency percentiles.
+
+Measured per client:
+    greeting_ms      start_session sent -> first audio frame of the greeting
+                     (not recorded if the client spoke or playback was
+                     stopped before the greeting arrived)
+    first_audio_ms   end of user speech -> first assistant audio frame
+    audio_gap_ms     arrival gap between consecutive audio frames of a response
+    underrun_ms      playback stalls of a simulated client jitter buffer
+    tool_rtt_ms      tool_call_started -> tool_call_completed/error
+    tool_to_audio_ms tool_call_started -> first audio frame afterwards
+    send_lag_ms      how late the generator sent a chunk vs. its schedule
+                     (if this grows, the generator itself is the bottleneck)
+
+Usage:
+    # against a running backend (itself pointed at scripts/mock_voicelive_server.py)
+    python scripts/load_test.py --url ws://localhost:8000 --clients 50 --turns 3
+
+    # start the mock VoiceLive server and a uvicorn worker as subprocesses
+    python scripts/load_test.py --spawn-stack --scenario tool_call --clients 50
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import math
+import os
+import struct
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import aiohttp
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(SCRIPT_DIR, "..", "app", "backend")
+sys.path.insert(0, BACKEND_DIR)
+
+from audio_protocol import (  # noqa: E402
+    AUDIO_TRANSPORT_BINARY,
+    AUDIO_TRANSPORT_TEXT,
+    FRAME_KIND_AUDIO_IN,
+    HEADER_SIZE,
+    encode_frame,
+)
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("load_test")
+
+SAMPLE_RATE = 24000
+BYTES_PER_SAMPLE = 2
+
+METRICS = (
+    "greeting_ms",
+    "first_audio_ms",
+    "audio_gap_ms",
+    "underrun_ms",
+    "tool_rtt_ms",
+    "tool_to_audio_ms",
+    "send_lag_ms",
+)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _pcm_chunk(samples: int, speech: bool) -> bytes:
+    """A chunk of loud tone (speech) or digital silence."""
+    if not speech:
+        return bytes(samples * BYTES_PER_SAMPLE)
+    return struct.pack(
+        f"<{samples}h",
+        *(int(6000 * math.sin(2 * math.pi * 220 * i / SAMPLE_RATE)) for i in range(samples)),
+    )
+
+
+class LoadResults:
+    """Samples and counters collected across all clients."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {name: [] for name in METRICS}
+        self.sessions_started = 0
+        self.session_errors = 0
+        self.connect_errors = 0
+        self.turns_completed = 0
+        self.turns_timed_out = 0
+        self.tool_calls = 0
+        self.underruns = 0
+        self.audio_frames = 0
+        self.greetings_missed = 0
+
+    def add(self, name: str, value_ms: float):
+        self.samples[name].append(value_ms)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for name, values in self.samples.items():
+            values = sorted(values)
+            report[name] = {
+                "count": len(values),
+                "p50": round(percentile(values, 50), 1),
+                "p95": round(percentile(values, 95), 1),
+                "p99": round(percentile(values, 99), 1),
+                "max": round(values[-1], 1) if values else float("nan"),
+            }
+        return report
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            "sessions_started": self.sessions_started,
+            "session_errors": self.session_errors,
+            "connect_errors": self.connect_errors,
+            "turns_completed": self.turns_completed,
+            "turns_timed_out": self.turns_timed_out,
+            "tool_calls": self.tool_calls,
+            "audio_frames": self.audio_frames,
+            "underruns": self.underruns,
+            "greetings_missed": self.greetings_missed,
+        }
+
+
+class SimulatedClient:
+    """One browser-equivalent client: paced microphone audio in, audio frames out."""
+
+    def __init__(self, index: int, args: argparse.Namespace, results: LoadResults):
+        self.client_id = f"load-{index}-{uuid.uuid4().hex[:8]}"
+        self.args = args
+        self.results = results
+        self.binary = args.audio_transport == AUDIO_TRANSPORT_BINARY
+
+        samples = SAMPLE_RATE * args.chunk_ms // 1000
+        self.speech_chunk = _pcm_chunk(samples, speech=True)
+        self.silence_chunk = _pcm_chunk(samples, speech=False)
+        self.speech_text = base64.b64encode(self.speech_chunk).decode("ascii")
+        self.silence_text = base64.b64encode(self.silence_chunk).decode("ascii")
+        self.sequence = 0
+
+        # Turn state shared between the sender and the receiver
+        self.session_started = asyncio.Event()
+        self.session_requested_at: Optional[float] = None
+        self.greeting_heard = asyncio.Event()
+        self.greeting_interrupted = False
+        self.speech_ended_at: Optional[float] = None
+        self.awaiting_first_audio = False
+        self.last_audio_at: Optional[float] = None
+        self.playout_end: Optional[float] = None
+        self.tool_started_at: Dict[str, float] = {}
+        self.awaiting_tool_audio: Optional[float] = None
+
+    async def run(self, session: aiohttp.ClientSession):
+        url = f"{self.args.url.rstrip('/')}/ws/{self.client_id}"
+        try:
+            async with session.ws_connect(url, max_msg_size=0) as ws:
+                receiver = asyncio.create_task(self._receive(ws))
+                try:
+                    self.session_requested_at = time.perf_counter()
+                    await ws.send_str(
+                        json.dumps(
+                            {
+                                "type": "start_session",
+                                "config": {"audioTransport": self.args.audio_transport},
+                            }
+                        )
+                    )
+                    await asyncio.wait_for(self.session_started.wait(), self.args.turn_timeout)
+                    self.results.sessions_started += 1
+                    if self.args.wait_for_greeting:
+                        try:
+                            await asyncio.wait_for(
+                                self.greeting_heard.wait(), self.args.turn_timeout
+                            )
+                        except asyncio.TimeoutError:
+                            self.results.greetings_missed += 1
+                            self.session_requested_at = None
+                    await self._send_turns(ws)
+                    await ws.send_str(json.dumps({"type": "stop_session"}))
+                finally:
+                    receiver.cancel()
+                    try:
+                        await receiver
+                    except asyncio.CancelledError:
+                        pass
+        except asyncio.TimeoutError:
+            self.results.session_errors += 1
+            logger.warning(f"{self.client_id}: session did not start")
+        except (aiohttp.ClientError, OSError) as e:
+            self.results.connect_errors += 1
+            logger.warning(f"{self.client_id}: connection failed: {e}")
+
+    async def _send_turns(self, ws: aiohttp.ClientWebSocketResponse):
+        """Stream audio continuously (like an open microphone), speaking once per turn."""
+        loop = asyncio.get_running_loop()
+        interval = self.args.chunk_ms / 1000
+        speech_chunks = max(1, self.args.speech_ms // self.args.chunk_ms)
+        next_send = loop.time()
+
+        for _ in range(self.args.turns):
+            turn_started = loop.time()
+            # Any audio from here on may be the answer, not the greeting
+            self.greeting_interrupted = True
+            for _ in range(speech_chunks):
+                next_send = await self._send_chunk(ws, next_send, interval, speech=True)
+            self.speech_ended_at = time.perf_counter()
+            self.awaiting_first_audio = True
+            self._reset_playout()
+
+            # Keep sending silence until the response has played out (or the turn times out)
+            while True:
+                next_send = await self._send_chunk(ws, next_send, interval, speech=False)
+                now = time.perf_counter()
+                if (
+                    not self.awaiting_first_audio
+                    and not self.tool_started_at
+                    and self.playout_end is not None
+                    and now - self.playout_end >= self.args.pause_ms / 1000
+                ):
+                    self.results.turns_completed += 1
+                    break
+                if loop.time() - turn_started > self.args.turn_timeout:
+                    self.results.turns_timed_out += 1
+                    self.awaiting_first_audio = False
+                    break
+
+    async def _send_chunk(
+        self, ws: aiohttp.ClientWebSocketResponse, next_send: float, interval: float, speech: bool
+    ) -> float:
+        loop = asyncio.get_running_loop()
+        delay = next_send - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.results.add("send_lag_ms", max(0.0, loop.time() - next_send) * 1000)
+
+        if self.binary:
+            payload = self.speech_chunk if speech else self.silence_chunk
+            await ws.send_bytes(
+                encode_frame(payload, FRAME_KIND_AUDIO_IN, self.sequence, loop.time())
+            )
+            self.sequence += 1
+        else:
+            data = self.speech_text if speech else self.silence_text
+            await ws.send_str(json.dumps({"type": "audio_chunk", "data": data}))
+
+        # Absolute schedule: a late send does not push every later chunk back
+        return next_send + interval
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse):
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.BINARY:
+                self._on_audio(len(msg.data) - HEADER_SIZE)
+            elif msg.type == aiohttp.WSMsgType.TEXT:
+                self._on_message(json.loads(msg.data))
+            else:
+                break
+
+    def _reset_playout(self):
+        self.playout_end = None
+        self.last_audio_at = None
+
+    def _on_message(self, message: dict):
+        message_type = message.get("type")
+        now = time.perf_counter()
+
+        if message_type == "audio_data":
+            self._on_audio(len(message.get("data", "")) * 3 // 4)
+        elif message_type == "session_started":
+            self.session_started.set()
+        elif message_type == "session_error":
+            logger.warning(f"{self.client_id}: session error: {message.get('error')}")
+        elif message_type == "tool_call_started":
+            self.results.tool_calls += 1
+            self.tool_started_at[message.get("call_id")] = now
+            self.awaiting_tool_audio = now
+        elif message_type in ("tool_call_completed", "tool_call_error"):
+            started = self.tool_started_at.pop(message.get("call_id"), None)
+            if started is not None:
+                self.results.add("tool_rtt_ms", (now - started) * 1000)
+        elif message_type == "stop_playback":
+            # Barge-in: the client drops whatever is still buffered
+            self.greeting_interrupted = True
+            self._reset_playout()
+
+    def _on_audio(self, payload_bytes: int):
+        now = time.perf_counter()
+        self.results.audio_frames += 1
+        duration = payload_bytes / BYTES_PER_SAMPLE / SAMPLE_RATE
+
+        if self.session_requested_at is not None:
+            if self.greeting_interrupted:
+                self.results.greetings_missed += 1
+            else:
+                self.results.add("greeting_ms", (now - self.session_requested_at) * 1000)
+            self.session_requested_at = None
+            self.greeting_heard.set()
+        if self.awaiting_first_audio and self.speech_ended_at is not None:
+            self.awaiting_first_audio = False
+            self.results.add("first_audio_ms", (now - self.speech_ended_at) * 1000)
+        if self.awaiting_tool_audio is not None:
+            self.results.add("tool_to_audio_ms", (now - self.awaiting_tool_audio) * 1000)
+            self.awaiting_tool_audio = None
+
+        if self.playout_end is None:
+            # New audio stream: playback starts after a small jitter buffer, like the browser player
+            self.playout_end = now + self.args.jitter_buffer_ms / 1000
+        else:
+            self.results.add("audio_gap_ms", (now - self.last_audio_at) * 1000)
+            # Simulated playout: a frame arriving after the buffer drained is an audible stall
+            if now > self.playout_end:
+                stall_ms = (now - self.playout_end) * 1000
+                if stall_ms >= 1.0:
+                    self.results.underruns += 1
+                    self.results.add("underrun_ms", stall_ms)
+                self.playout_end = now
+        self.playout_end += duration
+        self.last_audio_at = now
+
+
+async def run_load(args: argparse.Namespace) -> LoadResults:
+    results = LoadResults()
+    clients = [SimulatedClient(i, args, results) for i in range(args.clients)]
+    ramp_delay = args.ramp_seconds / args.clients if args.clients else 0
+
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = []
+        for client in clients:
+            tasks.append(asyncio.create_task(client.run(session)))
+            if ramp_delay:
+                await asyncio.sleep(ramp_delay)
+        await asyncio.gather(*tasks)
+    return results
+
+
+def print_report(results: LoadResults, args: argparse.Namespace, elapsed: float):
+    print()
+    print(
+        f"Clients: {args.clients}  turns/client: {args.turns}  "
+        f"transport: {args.audio_transport}  chunk: {args.chunk_ms} ms  elapsed: {elapsed:.1f}s"
+    )
+    print(f"{'metric':<18}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for name, row in results.summary().items():
+        print(
+            f"{name:<18}{row['count']:>8}{row['p50']:>10}{row['p95']:>10}{row['p99']:>10}{row['max']:>10}"
+        )
+    print()
+    for name, value in results.counters().items():
+        print(f"{name:<18}{value:>8}")
+
+
+async def _wait_for_http(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not become healthy within {timeout}s")
+
+
+async def spawn_stack(args: argparse.Namespace) -> List[asyncio.subprocess.Process]:
+    """Start the mock VoiceLive server and one uvicorn worker pointed at it."""
+    mock = await asyncio.create_subprocess_exec(
+        sys.executable,
+        os.path.join(SCRIPT_DIR, "mock_voicelive_server.py"),
+        "--port", str(args.mock_port),
+        "--scenario", args.scenario,
+        "--event-latency-ms", str(args.mock_event_latency_ms),
+        "--jitter-ms", str(args.mock_jitter_ms),
+        "--session-setup-latency-ms", str(args.mock_session_setup_latency_ms),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    env = {
+        **os.environ,
+        "AZURE_VOICELIVE_ENDPOINT": f"http://127.0.0.1:{args.mock_port}",
+        "AZURE_VOICELIVE_API_KEY": os.getenv("AZURE_VOICELIVE_API_KEY", "local"),
+    }
+    backend = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "uvicorn", "app:app",
+        "--host", "127.0.0.1",
+        "--port", str(args.backend_port),
+        "--log-level", "warning",
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    processes = [mock, backend]
+    try:
+        await _wait_for_http(f"http://127.0.0.1:{args.mock_port}/health")
+        await _wait_for_http(f"http://127.0.0.1:{args.backend_port}/health")
+    except Exception:
+        await stop_stack(processes)
+        raise
+    args.url = f"ws://127.0.0.1:{args.backend_port}"
+    return processes
+
+
+async def stop_stack(processes: List[asyncio.subprocess.Process]):
+    for process in processes:
+        if process.returncode is None:
+            process.terminate()
+    for process in processes:
+        await process.wait()
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Load generator for the voice assistant WebSocket endpoint",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--url", default="ws://localhost:8000", help="Backend base URL")
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--ramp-seconds", type=float, default=5.0, help="Spread connection starts over this time")
+    parser.add_argument("--turns", type=int, default=3, help="User turns per session")
+    parser.add_argument("--speech-ms", type=int, default=1200, help="Speech duration per turn")
+    parser.add_argument("--chunk-ms", type=int, default=100, help="Audio chunk size (browser sends 100 ms)")
+    parser.add_argument("--pause-ms", type=int, default=500, help="Silence after playback before the next turn")
+    parser.add_argument("--jitter-buffer-ms", type=int, default=80, help="Simulated client playout buffer")
+    parser.add_argument("--turn-timeout", type=float, default=30.0, help="Seconds before a turn is abandoned")
+    parser.add_argument(
+        "--audio-transport",
+        choices=(AUDIO_TRANSPORT_TEXT, AUDIO_TRANSPORT_BINARY),
+        default=AUDIO_TRANSPORT_TEXT,
+    )
+    parser.add_argument(
+        "--no-wait-for-greeting",
+        dest="wait_for_greeting",
+        action="store_false",
+        help="Start speaking at once instead of after the greeting starts (barges in on it)",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+
+    stack = parser.add_argument_group("local stack")
+    stack.add_argument("--spawn-stack", action="store_true", help="Start the mock server and backend")
+    stack.add_argument("--scenario", default="mixed", help="Mock server scenario")
+    stack.add_argument("--mock-port", type=int, default=8765)
+    stack.add_argument("--backend-port", type=int, default=8000)
+    stack.add_argument("--mock-event-latency-ms", type=float, default=0.0)
+    stack.add_argument("--mock-jitter-ms", type=float, default=0.0)
+    stack.add_argument("--mock-session-setup-latency-ms", type=float, default=0.0)
+    return parser.parse_args()
+
+
+async def main_async(args: argparse.Namespace):
+    processes = await spawn_stack(args) if args.spawn_stack else []
+    try:
+        start = time.perf_counter()
+        results = await run_load(args)
+        elapsed = time.perf_counter() - start
+    finally:
+        await stop_stack(processes)
+
+    print_report(results, args, elapsed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "clients": args.clients,
+                    "turns": args.turns,
+                    "audio_transport": args.audio_transport,
+                    "elapsed_seconds": elapsed,
+                    "latency_ms": results.summary(),
+                    "counters": results.counters(),
+                },
+                f,
+                indent=2,
+            )
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,520 @@
+"""
+Local stand-in for the Azure VoiceLive realtime WebSocket API
+Speaks the same session / response / audio-delta / function-call event protocol
+so the backend can be exercised and load tested without an Azure endpoint.
+
+Usage:
+    python scripts/mock_voicelive_server.py --port 8765 --scenario tool_call
+
+    # then point the backend at it
+    AZURE_VOICELIVE_ENDPOINT=http://localhost:8765 AZURE_VOICELIVE_API_KEY=local \\
+        uvicorn app:app
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import math
+import random
+import struct
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from aiohttp import WSMsgType, web
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("mock_voicelive")
+
+SAMPLE_RATE = 24000
+SCENARIOS = ("greeting", "tool_call", "barge_in", "long_response", "mixed")
+
+
+class MockConfig(NamedTuple):
+    """Behaviour of the mock server."""
+
+    scenario: str = "greeting"
+    event_latency_ms: float = 0.0  # added before every server event
+    jitter_ms: float = 0.0  # +/- uniform jitter on top of the latency
+    first_audio_latency_ms: float = 300.0  # response.create -> first audio delta
+    session_setup_latency_ms: float = 0.0  # before session.created and session.updated
+    audio_chunk_ms: int = 40
+    response_seconds: float = 1.5
+    long_response_seconds: float = 20.0
+    barge_in_after_ms: float = 1500.0
+    realtime_factor: float = 1.0  # 1.0 paces audio in real time, 0 sends it as fast as possible
+    speech_threshold: int = 500  # mean absolute PCM16 amplitude counted as speech
+    silence_ms: int = 500  # trailing silence that ends a user turn
+    tool_name: str = "get_product_information"
+    tool_arguments: str = '{"query": "credit card benefits"}'
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:20]}"
+
+
+def _tone_chunk_base64(chunk_ms: int, frequency: float = 440.0) -> str:
+    """One chunk of a PCM16 sine tone, base64 encoded once and reused."""
+    samples = SAMPLE_RATE * chunk_ms // 1000
+    pcm = struct.pack(
+        f"<{samples}h",
+        *(
+            int(8000 * math.sin(2 * math.pi * frequency * i / SAMPLE_RATE))
+            for i in range(samples)
+        ),
+    )
+    return base64.b64encode(pcm).decode("ascii")
+
+
+def _mean_amplitude(pcm: bytes) -> float:
+    """Mean absolute amplitude of a PCM16 buffer (sampled for speed)."""
+    count = len(pcm) // 2
+    if not count:
+        return 0.0
+    samples = struct.unpack_from(f"<{count}h", pcm)
+    step = max(1, count // 64)
+    picked = samples[::step]
+    return sum(abs(s) for s in picked) / len(picked)
+
+
+class MockVoiceLiveSession:
+    """State and event handling for one mock VoiceLive connection."""
+
+    def __init__(self, ws: web.WebSocketResponse, config: MockConfig, audio_b64: str):
+        self.ws = ws
+        self.config = config
+        self.audio_b64 = audio_b64
+        self.session_id = _new_id("sess")
+        self.session: Dict[str, Any] = {}
+        self.scenario = (
+            random.choice(SCENARIOS[:-1]) if config.scenario == "mixed" else config.scenario
+        )
+
+        # Simple energy-based VAD over appended input audio
+        self.in_speech = False
+        self.speech_start_ms = 0.0
+        self.audio_ms = 0.0
+        self.silence_run_ms = 0.0
+        self.user_item_id: Optional[str] = None
+
+        self.response_task: Optional[asyncio.Task] = None
+        self.greeted = False
+        self.pending_tool_answers = 0
+        self.send_lock = asyncio.Lock()
+
+    async def send(self, event: Dict[str, Any]):
+        """Send a server event after the configured latency and jitter."""
+        delay = self.config.event_latency_ms
+        if self.config.jitter_ms:
+            delay += random.uniform(-self.config.jitter_ms, self.config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        event.setdefault("event_id", _new_id("event"))
+        async with self.send_lock:
+            if not self.ws.closed:
+                await self.ws.send_str(json.dumps(event))
+
+    async def run(self):
+        """Serve the connection until the client goes away."""
+        await self._session_setup_delay()
+        await self.send(
+            {"type": "session.created", "session": {"id": self.session_id, "model": "mock"}}
+        )
+        try:
+            async for msg in self.ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    event = json.loads(msg.data)
+                except ValueError:
+                    await self._send_error("invalid_json", "Could not parse client event")
+                    continue
+                await self._handle_client_event(event)
+        finally:
+            await self._cancel_response(send_done=False)
+
+    async def _session_setup_delay(self):
+        """Stand-in for the service's connection and session configuration time."""
+        if self.config.session_setup_latency_ms > 0:
+            await asyncio.sleep(self.config.session_setup_latency_ms / 1000)
+
+    async def _handle_client_event(self, event: Dict[str, Any]):
+        event_type = event.get("type")
+
+        if event_type == "session.update":
+            self.session = {**self.session, **event.get("session", {}), "id": self.session_id}
+            await self._session_setup_delay()
+            await self.send({"type": "session.updated", "session": self.session})
+
+        elif event_type == "input_audio_buffer.append":
+            await self._handle_audio(event.get("audio", ""))
+
+        elif event_type == "response.create":
+            self._start_response(self._answer_kind())
+
+        elif event_type == "response.cancel":
+            await self._cancel_response()
+
+        elif event_type == "conversation.item.create":
+            item = dict(event.get("item", {}))
+            item.setdefault("id", _new_id("item"))
+            await self.send(
+                {
+                    "type": "conversation.item.created",
+                    "previous_item_id": event.get("previous_item_id"),
+                    "item": item,
+                }
+            )
+            if item.get("type") == "function_call_output":
+                self.pending_tool_answers += 1
+
+        elif event_type in ("input_audio_buffer.clear", "input_audio_buffer.commit"):
+            pass
+
+        else:
+            logger.debug(f"Ignoring client event {event_type}")
+
+    async def _handle_audio(self, audio_b64: str):
+        try:
+            pcm = base64.b64decode(audio_b64)
+        except ValueError:
+            return
+        chunk_ms = len(pcm) / 2 / SAMPLE_RATE * 1000
+        self.audio_ms += chunk_ms
+        is_speech = _mean_amplitude(pcm) >= self.config.speech_threshold
+
+        if is_speech and not self.in_speech:
+            self.in_speech = True
+            self.silence_run_ms = 0.0
+            self.speech_start_ms = self.audio_ms - chunk_ms
+            self.user_item_id = _new_id("item")
+            await self.send(
+                {
+                    "type": "input_audio_buffer.speech_started",
+                    "audio_start_ms": int(self.speech_start_ms),
+                    "item_id": self.user_item_id,
+                }
+            )
+            # A real service cancels the active response on barge-in
+            await self._cancel_response()
+
+        elif self.in_speech:
+            self.silence_run_ms = 0.0 if is_speech else self.silence_run_ms + chunk_ms
+            if self.silence_run_ms >= self.config.silence_ms:
+                self.in_speech = False
+                await self._end_user_turn()
+
+    async def _end_user_turn(self, kind: Optional[str] = None):
+        item_id = self.user_item_id
+        await self.send(
+            {
+                "type": "input_audio_buffer.speech_stopped",
+                "audio_end_ms": int(self.audio_ms),
+                "item_id": item_id,
+            }
+        )
+        await self.send(
+            {"type": "input_audio_buffer.committed", "previous_item_id": None, "item_id": item_id}
+        )
+        await self.send(
+            {
+                "type": "conversation.item.created",
+                "previous_item_id": None,
+                "item": {"id": item_id, "type": "message", "role": "user", "content": []},
+            }
+        )
+        await self.send(
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": item_id,
+                "content_index": 0,
+                "transcript": "Mock user utterance.",
+            }
+        )
+        # Server VAD creates the response itself
+        if kind is None:
+            kind = "tool" if self.scenario == "tool_call" else self._answer_kind()
+        await self._cancel_response()
+        self._start_response(kind)
+
+    def _answer_kind(self) -> str:
+        if not self.greeted:
+            # The first response is the proactive greeting
+            self.greeted = True
+            return "answer"
+        if self.pending_tool_answers:
+            self.pending_tool_answers = 0
+            return "answer"
+        if self.scenario in ("barge_in", "long_response"):
+            return "long"
+        return "answer"
+
+    def _start_response(self, kind: str):
+        if self.response_task and not self.response_task.done():
+            asyncio.create_task(
+                self._send_error(
+                    "conversation_already_has_active_response",
+                    "Conversation already has an active response",
+                )
+            )
+            return
+        self.response_task = asyncio.create_task(self._run_response(kind))
+
+    async def _cancel_response(self, send_done: bool = True):
+        task = self.response_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        if send_done:
+            await self.send(
+                {
+                    "type": "response.done",
+                    "response": {"id": getattr(task, "response_id", None), "status": "cancelled", "output": []},
+                }
+            )
+
+    async def _run_response(self, kind: str):
+        response_id = _new_id("resp")
+        asyncio.current_task().response_id = response_id
+        await self.send(
+            {
+                "type": "response.created",
+                "response": {"id": response_id, "status": "in_progress", "output": []},
+            }
+        )
+
+        if kind == "tool":
+            await self._emit_function_call(response_id)
+            status = "completed"
+        else:
+            seconds = (
+                self.config.long_response_seconds if kind == "long" else self.config.response_seconds
+            )
+            if self.scenario == "barge_in" and kind == "long":
+                asyncio.create_task(self._inject_barge_in(asyncio.current_task()))
+            await self._emit_audio(response_id, seconds)
+            status = "completed"
+
+        await self.send(
+            {"type": "response.done", "response": {"id": response_id, "status": status, "output": []}}
+        )
+
+    async def _emit_function_call(self, response_id: str):
+        item_id = _new_id("item")
+        call_id = _new_id("call")
+        tools: List[Dict[str, Any]] = self.session.get("tools") or []
+        name = tools[0].get("name", self.config.tool_name) if tools else self.config.tool_name
+        item = {
+            "id": item_id,
+            "type": "function_call",
+            "call_id": call_id,
+            "name": name,
+            "arguments": "",
+            "status": "in_progress",
+        }
+        await self.send(
+            {"type": "response.output_item.added", "response_id": response_id, "output_index": 0, "item": item}
+        )
+        await self.send({"type": "conversation.item.created", "previous_item_id": None, "item": item})
+        await self.send(
+            {
+                "type": "response.function_call_arguments.delta",
+                "response_id": response_id,
+                "item_id": item_id,
+                "output_index": 0,
+                "call_id": call_id,
+                "delta": self.config.tool_arguments,
+            }
+        )
+        await self.send(
+            {
+                "type": "response.function_call_arguments.done",
+                "response_id": response_id,
+                "item_id": item_id,
+                "output_index": 0,
+                "call_id": call_id,
+                "name": name,
+                "arguments": self.config.tool_arguments,
+            }
+        )
+        await self.send(
+            {
+                "type": "response.output_item.done",
+                "response_id": response_id,
+                "output_index": 0,
+                "item": {**item, "arguments": self.config.tool_arguments, "status": "completed"},
+            }
+        )
+
+    async def _emit_audio(self, response_id: str, seconds: float):
+        item_id = _new_id("item")
+        common = {"response_id": response_id, "item_id": item_id, "output_index": 0, "content_index": 0}
+        await self.send(
+            {
+                "type": "response.output_item.added",
+                "response_id": response_id,
+                "output_index": 0,
+                "item": {"id": item_id, "type": "message", "role": "assistant", "content": []},
+            }
+        )
+        await asyncio.sleep(self.config.first_audio_latency_ms / 1000)
+
+        chunk_seconds = self.config.audio_chunk_ms / 1000
+        chunks = max(1, int(seconds / chunk_seconds))
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for index in range(chunks):
+            await self.send({"type": "response.audio.delta", **common, "delta": self.audio_b64})
+            if index % 10 == 0:
+                await self.send({"type": "response.audio_transcript.delta", **common, "delta": "mock "})
+            if self.config.realtime_factor > 0:
+                # Pace against the wall clock so jitter does not accumulate
+                target = start + (index + 1) * chunk_seconds / self.config.realtime_factor
+                await asyncio.sleep(max(0.0, target - loop.time()))
+
+        await self.send({"type": "response.audio.done", **common})
+        await self.send(
+            {"type": "response.audio_transcript.done", **common, "transcript": "Mock assistant response."}
+        )
+
+    async def _inject_barge_in(self, response_task: asyncio.Task):
+        """Simulate the user talking over a long response."""
+        await asyncio.sleep(self.config.barge_in_after_ms / 1000)
+        if self.response_task is not response_task or response_task.done():
+            return
+        self.user_item_id = _new_id("item")
+        await self.send(
+            {
+                "type": "input_audio_buffer.speech_started",
+                "audio_start_ms": int(self.audio_ms),
+                "item_id": self.user_item_id,
+            }
+        )
+        await self._cancel_response()
+        self.in_speech = True
+        self.silence_run_ms = 0.0
+        await asyncio.sleep(0.6)
+        self.in_speech = False
+        # Answer the interruption with a normal response so the barge-in is not repeated
+        await self._end_user_turn("answer")
+
+    async def _send_error(self, code: str, message: str):
+        await self.send(
+            {"type": "error", "error": {"type": "invalid_request_error", "code": code, "message": message}}
+        )
+
+
+class MockVoiceLiveServer:
+    """aiohttp application serving /voice-live/realtime."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.audio_b64 = _tone_chunk_base64(config.audio_chunk_ms)
+        self.active_sessions = 0
+        self.total_sessions = 0
+
+        self.app = web.Application()
+        self.app.router.add_get("/voice-live/realtime", self.handle_realtime)
+        self.app.router.add_get("/health", self.handle_health)
+
+    async def handle_realtime(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=10 * 1024 * 1024)
+        await ws.prepare(request)
+
+        self.active_sessions += 1
+        self.total_sessions += 1
+        session = MockVoiceLiveSession(ws, self.config, self.audio_b64)
+        logger.info(
+            f"Session {session.session_id} connected (scenario={session.scenario}, active={self.active_sessions})"
+        )
+        try:
+            await session.run()
+        finally:
+            self.active_sessions -= 1
+            logger.info(f"Session {session.session_id} closed (active={self.active_sessions})")
+        return ws
+
+    async def handle_health(self, _request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "status": "healthy",
+                "scenario": self.config.scenario,
+                "active_sessions": self.active_sessions,
+                "total_sessions": self.total_sessions,
+            }
+        )
+
+
+async def start_mock_server(
+    config: MockConfig, host: str = "127.0.0.1", port: int = 8765
+) -> web.AppRunner:
+    """Start the mock server in the running event loop (for use from benchmarks)."""
+    server = MockVoiceLiveServer(config)
+    runner = web.AppRunner(server.app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Mock VoiceLive server listening on http://{host}:{port} (scenario={config.scenario})")
+    return runner
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Local mock of the Azure VoiceLive realtime API",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scenario", choices=SCENARIOS, default="greeting")
+    parser.add_argument("--event-latency-ms", type=float, default=0.0, help="Latency added before every event")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter added to the latency")
+    parser.add_argument("--first-audio-latency-ms", type=float, default=300.0)
+    parser.add_argument(
+        "--session-setup-latency-ms",
+        type=float,
+        default=0.0,
+        help="Delay before session.created and session.updated",
+    )
+    parser.add_argument("--audio-chunk-ms", type=int, default=40)
+    parser.add_argument("--response-seconds", type=float, default=1.5)
+    parser.add_argument("--long-response-seconds", type=float, default=20.0)
+    parser.add_argument("--barge-in-after-ms", type=float, default=1500.0)
+    parser.add_argument(
+        "--realtime-factor", type=float, default=1.0, help="Audio pacing; 0 sends audio as fast as possible"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
+    return parser.parse_args()
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    config = MockConfig(
+        scenario=args.scenario,
+        event_latency_ms=args.event_latency_ms,
+        jitter_ms=args.jitter_ms,
+        first_audio_latency_ms=args.first_audio_latency_ms,
+        session_setup_latency_ms=args.session_setup_latency_ms,
+        audio_chunk_ms=args.audio_chunk_ms,
+        response_seconds=args.response_seconds,
+        long_response_seconds=args.long_response_seconds,
+        barge_in_after_ms=args.barge_in_after_ms,
+        realtime_factor=args.realtime_factor,
+    )
+    server = MockVoiceLiveServer(config)
+    web.run_app(server.app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()